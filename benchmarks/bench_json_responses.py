@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""热点接口响应序列化耗时对比。
+
+用法：
+    python benchmarks/bench_json_responses.py [--iterations 2000]
+
+对比场景：
+- 50 条消息的对话记录（GET /api/session/{id}/messages）
+- 500 行的后台会话列表页（GET /api/admin/sessions?limit=500）
+
+对比方式（均包含由服务层结果构造响应内容的耗时）：
+- response_model：FastAPI 默认路径，构造 Pydantic 模型后按 response_model 再校验并序列化
+- fast (orjson)：FAST_JSON_RESPONSES=true，mapper 产出的 dict 直接序列化
+- stdlib json：同上但用标准库 json 序列化（仅作参照：大页面比默认路径更慢，
+  因此未安装 orjson 时快速路径不生效）
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from interview_system.api.mappers import message_payloads, to_message_responses
+from interview_system.api.responses import dumps_json
+from interview_system.api.schemas.admin import AdminListResponse
+from interview_system.api.schemas.message import MessageResponse
+
+
+def _transcript(n: int) -> list[dict[str, Any]]:
+    messages: list[dict[str, Any]] = []
+    for i in range(n // 2):
+        ts = 1705392000000 + i * 60_000
+        messages.append(
+            {
+                "id": f"log{i + 1}-q",
+                "role": "assistant",
+                "content": f"【第{i + 1}/6题】学校-德育:\n请结合您的经历，谈谈学校德育工作中印象最深的一件事。",
+                "timestamp": ts,
+            }
+        )
+        messages.append(
+            {
+                "id": f"log{i + 1}-a",
+                "role": "user",
+                "content": "我认为教学应该以学生为中心，关注学生的全面发展。" * 4,
+                "timestamp": ts,
+            }
+        )
+    return messages
+
+
+def _admin_page(n: int) -> dict[str, Any]:
+    topics = [
+        {"name": "学校-德育", "scene": "学校", "edu_type": "德育", "questions": ["Q1"]},
+        {"name": "家庭-智育", "scene": "家庭", "edu_type": "智育", "questions": ["Q2"]},
+    ] * 3
+    items = [
+        {
+            "session_id": f"{i:08d}-0000-4000-8000-000000000000",
+            "user_name": f"用户{i}",
+            "start_time": "2024-01-16 08:00:00",
+            "end_time": None,
+            "is_finished": i % 2,
+            "current_question_idx": i % 6,
+            "selected_topics_json": json.dumps(topics, ensure_ascii=False),
+            "created_at": "2024-01-16 08:00:00",
+            "updated_at": "2024-01-16 08:30:00",
+            "is_followup": 0,
+            "current_followup_is_ai": 0,
+            "current_followup_count": 0,
+            "current_followup_question": "",
+            "selected_topics": topics,
+        }
+        for i in range(n)
+    ]
+    return {"total": 10_000, "items": items, "next_cursor": "eyJrIjoxfQ"}
+
+
+def _std_dumps(content: Any) -> bytes:
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def _per_call_us(fn: Callable[[], bytes], iterations: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def _report(title: str, results: dict[str, float]) -> None:
+    baseline = results["response_model"]
+    print(title)
+    for name, us in results.items():
+        print(f"  {name:<16} {us:10.1f} µs  ({baseline / us:.1f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    if importlib.util.find_spec("orjson") is None:
+        raise SystemExit("需要 orjson: pip install 'interview-system[fast]'")
+
+    messages = _transcript(50)
+    transcript_adapter = TypeAdapter(list[MessageResponse])
+    _report(
+        "50 条消息的对话记录:",
+        {
+            "response_model": _per_call_us(
+                lambda: transcript_adapter.dump_json(
+                    transcript_adapter.validate_python(to_message_responses(messages))
+                ),
+                args.iterations,
+            ),
+            "fast (orjson)": _per_call_us(
+                lambda: dumps_json(message_payloads(messages)), args.iterations
+            ),
+            "stdlib json": _per_call_us(
+                lambda: _std_dumps(message_payloads(messages)), args.iterations
+            ),
+        },
+    )
+
+    page = _admin_page(500)
+    page_adapter = TypeAdapter(AdminListResponse)
+    iterations = max(1, args.iterations // 10)
+    _report(
+        "500 行的后台会话列表页:",
+        {
+            "response_model": _per_call_us(
+                lambda: page_adapter.dump_json(page_adapter.validate_python(page)),
+                iterations,
+            ),
+            "fast (orjson)": _per_call_us(lambda: dumps_json(page), iterations),
+            "stdlib json": _per_call_us(lambda: _std_dumps(page), iterations),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
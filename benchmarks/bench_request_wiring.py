@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""每个请求的依赖装配开销对比。
+
+用法：
+    python benchmarks/bench_request_wiring.py [--iterations 20000]
+
+对比两种方式获取 InterviewService / SessionService 的耗时：
+- 逐请求装配：按旧版 deps.get_interview_service 的写法，每次 import 配置与题库、
+  定义 LLM 适配类并新建仓储、AnswerProcessor、FollowupGenerator 与服务对象
+- 应用容器：lifespan 中创建一次，依赖函数只做属性查找
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+
+from interview_system.api import deps
+from interview_system.api.container import build_container
+from interview_system.application.services.interview_service import InterviewService
+from interview_system.application.services.session_service import SessionService
+from interview_system.config.settings import Settings
+from interview_system.domain.services.answer_processor import AnswerProcessor
+from interview_system.domain.services.followup_generator import FollowupGenerator
+from interview_system.infrastructure.cache.memory_cache import SessionCache
+from interview_system.infrastructure.cache.query_cache import QueryCache
+from interview_system.infrastructure.database import AsyncDatabase
+from interview_system.infrastructure.database.repositories import SessionRepositoryImpl
+
+
+def _legacy_interview_service(
+    db: AsyncDatabase, cache: SessionCache
+) -> InterviewService:
+    """旧版逐请求装配（仅用于对比）。"""
+    from interview_system.common.config import INTERVIEW_CONFIG
+    from interview_system.core.questions import EDU_TYPES, SCENES, TOPICS
+    from interview_system.integrations.api_helpers import generate_followup
+
+    class _LLM:
+        def generate_followup(self, answer: str, topic: dict, conversation_log=None):
+            try:
+                return generate_followup(answer, topic, conversation_log)
+            except Exception:
+                return None
+
+    repo = SessionRepositoryImpl(db, cache=cache, write_buffer=None)
+    api_key = (os.getenv("API_KEY") or "").strip()
+    processor = AnswerProcessor(
+        depth_keywords=INTERVIEW_CONFIG.depth_keywords,
+        common_keywords=INTERVIEW_CONFIG.common_keywords,
+        max_depth_score=INTERVIEW_CONFIG.max_depth_score,
+    )
+    followup = FollowupGenerator(
+        llm=_LLM() if api_key else None,
+        min_answer_length=INTERVIEW_CONFIG.min_answer_length,
+        max_followups_per_question=INTERVIEW_CONFIG.max_followups_per_question,
+        max_depth_score=INTERVIEW_CONFIG.max_depth_score,
+    )
+    return InterviewService(
+        repository=repo,
+        answer_processor=processor,
+        followup_generator=followup,
+        topics_source={"TOPICS": TOPICS, "SCENES": SCENES, "EDU_TYPES": EDU_TYPES},
+        total_questions=INTERVIEW_CONFIG.total_questions,
+    )
+
+
+def _per_call_us(fn, iterations: int) -> float:
+    fn()  # 预热（首次 import）
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    settings = Settings(database_url="sqlite+aiosqlite:///:memory:")
+    db = AsyncDatabase(settings.database_url)
+    cache = SessionCache()
+    container = build_container(
+        settings,
+        db=db,
+        session_cache=cache,
+        admin_query_cache=QueryCache(),
+        session_write_buffer=None,
+    )
+    # 模拟 Request：deps 只访问 request.app.state.container
+    request = SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(container=container))
+    )
+
+    def legacy() -> None:
+        _legacy_interview_service(db, cache)
+        SessionService(SessionRepositoryImpl(db, cache=cache, write_buffer=None))
+
+    def scoped() -> None:
+        deps.get_interview_service(request)  # type: ignore[arg-type]
+        deps.get_session_service(request)  # type: ignore[arg-type]
+
+    before = _per_call_us(legacy, args.iterations)
+    after = _per_call_us(scoped, args.iterations)
+    await db.dispose()
+
+    print(f"迭代次数: {args.iterations}（每次获取 InterviewService + SessionService）")
+    print(f"逐请求装配: {before:8.2f} µs/请求")
+    print(f"应用容器:   {after:8.2f} µs/请求  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""SQLite 调优参数写入吞吐对比。
+
+用法：
+    python benchmarks/bench_sqlite_pragmas.py [--sessions 20] [--turns 30]
+
+模拟多个并发访谈：每轮追加一条对话日志并保存一次 session 状态，
+分别在 SQLite 默认参数与 SqlitePragmas 调优参数下统计每秒完成的轮次。
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from interview_system.domain.entities import Session
+from interview_system.domain.value_objects.conversation_entry import ConversationEntry
+from interview_system.infrastructure.database import AsyncDatabase, SqlitePragmas
+from interview_system.infrastructure.database.repositories import SessionRepositoryImpl
+
+
+async def _run_interview(repo: SessionRepositoryImpl, turns: int) -> None:
+    session = Session(user_name="bench")
+    await repo.save(session)
+    for i in range(turns):
+        entry = ConversationEntry(
+            timestamp=datetime.now(UTC),
+            topic="学校-德育",
+            question_type="核心问题",
+            question=f"Q{i}",
+            answer="我认为教学应该以学生为中心" * 4,
+            depth_score=2,
+            is_ai_generated=False,
+        )
+        await repo.append_conversation_entry(session.id, entry)
+        session.current_question_idx = i + 1
+        await repo.save(session)
+
+
+async def _bench(
+    path: Path, pragmas: SqlitePragmas | None, *, sessions: int, turns: int
+) -> float:
+    db = AsyncDatabase(f"sqlite+aiosqlite:///{path}", sqlite_pragmas=pragmas)
+    await db.init()
+    repo = SessionRepositoryImpl(db)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_run_interview(repo, turns) for _ in range(sessions)))
+    elapsed = time.perf_counter() - started
+
+    await db.dispose()
+    return sessions * turns / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = await _bench(
+            Path(tmp) / "default.db", None, sessions=args.sessions, turns=args.turns
+        )
+        tuned = await _bench(
+            Path(tmp) / "tuned.db",
+            SqlitePragmas(),
+            sessions=args.sessions,
+            turns=args.turns,
+        )
+
+    print(f"并发访谈: {args.sessions}，每个 {args.turns} 轮")
+    print(f"默认参数: {base:10.1f} 轮/秒")
+    print(f"调优参数: {tuned:10.1f} 轮/秒  ({tuned / base:.2f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
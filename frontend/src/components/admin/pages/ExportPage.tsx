@@ -7,8 +7,11 @@ import { API_BASE } from '@/services/api';
 import { logError } from '@/services/logger';
 import { useAdminStore } from '@/stores';
 
-type ExportFormat = 'csv' | 'json' | 'xlsx';
-type ExportScope = 'sessions' | 'conversations';
+type ExportFormat = 'csv' | 'json' | 'ndjson' | 'xlsx' | 'parquet' | 'arrow';
+type ExportScope = 'sessions' | 'conversations' | 'all';
+type ExportCompression = 'none' | 'gzip';
+
+const TEXT_FORMATS: ExportFormat[] = ['csv', 'json', 'ndjson'];
 
 function toIsoParam(value: string): string | null {
   const trimmed = value.trim();
@@ -18,6 +21,28 @@ function toIsoParam(value: string): string | null {
   return d.toISOString();
 }
 
+type ExportJob = {
+  job_id: string;
+  status: 'queued' | 'running' | 'succeeded' | 'failed' | 'cancelled';
+  filename: string;
+  rows_written: number;
+  total_rows: number | null;
+  progress: number | null;
+  error: string | null;
+  download_url: string | null;
+};
+
+function saveBlob(blob: Blob, filename: string) {
+  const url = URL.createObjectURL(blob);
+  const a = document.createElement('a');
+  a.href = url;
+  a.download = filename;
+  document.body.appendChild(a);
+  a.click();
+  a.remove();
+  URL.revokeObjectURL(url);
+}
+
 function parseFilename(contentDisposition: string | null, fallback: string) {
   if (!contentDisposition) return fallback;
   const match = /filename="([^"]+)"/.exec(contentDisposition);
@@ -29,6 +54,9 @@ export function ExportPage() {
 
   const [scope, setScope] = React.useState<ExportScope>('conversations');
   const [format, setFormat] = React.useState<ExportFormat>('csv');
+  const [compression, setCompression] = React.useState<ExportCompression>('none');
+  // 仅文本格式支持压缩（XLSX/Parquet/Arrow 已自带压缩）
+  const effectiveCompression = TEXT_FORMATS.includes(format) ? compression : 'none';
   const [start, setStart] = React.useState('');
   const [end, setEnd] = React.useState('');
   const [userName, setUserName] = React.useState('');
@@ -54,6 +82,7 @@ export function ExportPage() {
       params.set('scope', scope);
       params.set('format', format);
       params.set('limit', String(limit));
+      if (effectiveCompression !== 'none') params.set('compression', effectiveCompression);
 
       const s = toIsoParam(start);
       const e = toIsoParam(end);
@@ -75,17 +104,10 @@ export function ExportPage() {
       }
 
       const blob = await resp.blob();
-      const defaultName = `export.${format}`;
+      const defaultName = effectiveCompression === 'gzip' ? `export.${format}.gz` : `export.${format}`;
       const filename = parseFilename(resp.headers.get('content-disposition'), defaultName);
 
-      const url = URL.createObjectURL(blob);
-      const a = document.createElement('a');
-      a.href = url;
-      a.download = filename;
-      document.body.appendChild(a);
-      a.click();
-      a.remove();
-      URL.revokeObjectURL(url);
+      saveBlob(blob, filename);
     } catch (e) {
       logError('ExportPage', '下载失败', e);
       const msg = e instanceof Error ? e.message : '下载失败';
@@ -93,7 +115,78 @@ export function ExportPage() {
     } finally {
       setDownloading(false);
     }
-  }, [token, scope, format, limit, start, end, userName, topic, keyword, minDepth, maxDepth]);
+  }, [token, scope, format, effectiveCompression, limit, start, end, userName, topic, keyword, minDepth, maxDepth]);
+
+  const [job, setJob] = React.useState<ExportJob | null>(null);
+
+  const submitJob = React.useCallback(async () => {
+    if (!token) {
+      setError('缺少 Token（右上角设置）');
+      return;
+    }
+
+    setError(null);
+    try {
+      const body: Record<string, unknown> = { scope, format, limit, compression: effectiveCompression };
+      const s = toIsoParam(start);
+      const e = toIsoParam(end);
+      if (s) body.start = s;
+      if (e) body.end = e;
+      if (userName.trim()) body.user_name = userName.trim();
+      if (topic.trim()) body.topic = topic.trim();
+      if (keyword.trim()) body.keyword = keyword.trim();
+      if (minDepth.trim()) body.min_depth = Number(minDepth.trim());
+      if (maxDepth.trim()) body.max_depth = Number(maxDepth.trim());
+
+      const resp = await fetch(`${API_BASE}/admin/exports`, {
+        method: 'POST',
+        headers: { 'X-Admin-Token': token, 'Content-Type': 'application/json' },
+        body: JSON.stringify(body),
+      });
+      if (!resp.ok) throw new Error((await resp.text()) || `HTTP ${resp.status}`);
+      setJob((await resp.json()) as ExportJob);
+    } catch (e) {
+      logError('ExportPage', '提交导出任务失败', e);
+      setError(e instanceof Error ? e.message : '提交导出任务失败');
+    }
+  }, [token, scope, format, effectiveCompression, limit, start, end, userName, topic, keyword, minDepth, maxDepth]);
+
+  // 轮询任务进度，直到结束
+  React.useEffect(() => {
+    if (!token || !job || (job.status !== 'queued' && job.status !== 'running')) return;
+    const timer = window.setTimeout(async () => {
+      try {
+        const resp = await fetch(`${API_BASE}/admin/exports/${job.job_id}`, {
+          headers: { 'X-Admin-Token': token },
+        });
+        if (!resp.ok) throw new Error((await resp.text()) || `HTTP ${resp.status}`);
+        setJob((await resp.json()) as ExportJob);
+      } catch (e) {
+        logError('ExportPage', '查询导出任务失败', e);
+        setError(e instanceof Error ? e.message : '查询导出任务失败');
+        setJob(null);
+      }
+    }, 1000);
+    return () => window.clearTimeout(timer);
+  }, [token, job]);
+
+  const downloadJob = React.useCallback(async () => {
+    if (!token || !job?.download_url) return;
+    setDownloading(true);
+    setError(null);
+    try {
+      const resp = await fetch(`${API_BASE}/admin/exports/${job.job_id}/download`, {
+        headers: { 'X-Admin-Token': token },
+      });
+      if (!resp.ok) throw new Error((await resp.text()) || `HTTP ${resp.status}`);
+      saveBlob(await resp.blob(), job.filename);
+    } catch (e) {
+      logError('ExportPage', '下载失败', e);
+      setError(e instanceof Error ? e.message : '下载失败');
+    } finally {
+      setDownloading(false);
+    }
+  }, [token, job]);
 
   return (
     <div className="space-y-4">
@@ -112,19 +205,45 @@ export function ExportPage() {
                 <Button variant={scope === 'sessions' ? 'default' : 'outline'} onClick={() => setScope('sessions')}>
                   会话表
                 </Button>
+                {format === 'xlsx' && (
+                  <Button variant={scope === 'all' ? 'default' : 'outline'} onClick={() => setScope('all')}>
+                    全部（多 sheet）
+                  </Button>
+                )}
               </div>
             </div>
 
             <div className="space-y-1">
               <div className="text-xs text-muted-foreground">格式</div>
-              <div className="flex gap-2">
-                {(['csv', 'json', 'xlsx'] as ExportFormat[]).map((f) => (
-                  <Button key={f} variant={format === f ? 'default' : 'outline'} onClick={() => setFormat(f)}>
+              <div className="flex flex-wrap gap-2">
+                {(['csv', 'json', 'ndjson', 'xlsx', 'parquet', 'arrow'] as ExportFormat[]).map((f) => (
+                  <Button
+                    key={f}
+                    variant={format === f ? 'default' : 'outline'}
+                    onClick={() => {
+                      setFormat(f);
+                      if (f !== 'xlsx' && scope === 'all') setScope('conversations');
+                    }}
+                  >
                     {f.toUpperCase()}
                   </Button>
                 ))}
               </div>
             </div>
+
+            {TEXT_FORMATS.includes(format) && (
+              <div className="space-y-1">
+                <div className="text-xs text-muted-foreground">压缩</div>
+                <div className="flex gap-2">
+                  <Button variant={compression === 'none' ? 'default' : 'outline'} onClick={() => setCompression('none')}>
+                    不压缩
+                  </Button>
+                  <Button variant={compression === 'gzip' ? 'default' : 'outline'} onClick={() => setCompression('gzip')}>
+                    GZIP
+                  </Button>
+                </div>
+              </div>
+            )}
           </div>
 
           <div className="grid gap-3 md:grid-cols-3">
@@ -138,7 +257,7 @@ export function ExportPage() {
             </div>
             <div className="space-y-1">
               <div className="text-xs text-muted-foreground">Limit</div>
-              <Input type="number" min={1} max={20000} value={limit} onChange={(e) => setLimit(Number(e.target.value || 5000))} />
+              <Input type="number" min={1} value={limit} onChange={(e) => setLimit(Number(e.target.value || 5000))} />
             </div>
           </div>
 
@@ -172,11 +291,31 @@ export function ExportPage() {
             <Button onClick={download} disabled={downloading}>
               {downloading ? '下载中...' : '下载'}
             </Button>
+            <Button
+              variant="outline"
+              onClick={submitJob}
+              disabled={job?.status === 'queued' || job?.status === 'running'}
+            >
+              后台导出
+            </Button>
+            {job?.status === 'succeeded' && (
+              <Button variant="outline" onClick={downloadJob} disabled={downloading}>
+                下载 {job.filename}
+              </Button>
+            )}
             <span className="text-xs text-muted-foreground">
               请求头: <code>X-Admin-Token</code>
             </span>
           </div>
 
+          {job && job.status !== 'succeeded' ? (
+            <p className="text-xs text-muted-foreground">
+              后台导出：{job.status}
+              {job.total_rows != null ? `（${job.rows_written} / ${job.total_rows} 行）` : `（${job.rows_written} 行）`}
+              {job.error ? ` ${job.error}` : ''}
+            </p>
+          ) : null}
+
           {error ? <p className="text-sm text-destructive">{error}</p> : null}
         </CardContent>
       </Card>
@@ -268,10 +268,12 @@ export const sessionApi = {
       body: { topics },
     }).then(({ session, messages }) => ({ session: toSession(session), messages })),
 
-  sendMessage: (sessionId: string, text: string) =>
+  // idempotencyKey：重试同一次提交时保持不变，服务端返回首次结果而不会重复记录
+  sendMessage: (sessionId: string, text: string, idempotencyKey?: string) =>
     request<Message, { text: string }>(`/session/${sessionId}/message`, {
       method: 'POST',
       body: { text },
+      headers: idempotencyKey ? { 'Idempotency-Key': idempotencyKey } : undefined,
     }),
 
   getMessages: (sessionId: string) =>
@@ -280,8 +282,11 @@ export const sessionApi = {
   undo: (sessionId: string) =>
     request<Message[]>(`/session/${sessionId}/undo`, { method: 'POST' }),
 
-  skip: (sessionId: string) =>
-    request<Message>(`/session/${sessionId}/skip`, { method: 'POST' }),
+  skip: (sessionId: string, idempotencyKey?: string) =>
+    request<Message>(`/session/${sessionId}/skip`, {
+      method: 'POST',
+      headers: idempotencyKey ? { 'Idempotency-Key': idempotencyKey } : undefined,
+    }),
 
   restart: (sessionId: string) =>
     request<ApiSession>(`/session/${sessionId}/restart`, { method: 'POST' }).then(toSession),
@@ -0,0 +1,181 @@
+"""应用级服务容器。
+
+说明：
+- 在 lifespan 中创建一次，挂在 ``app.state.container`` 上
+- 仓储与应用服务均为无请求状态的对象（只持有连接池/缓存等长生命周期依赖），可安全地跨请求、跨协程共享
+- 题库、访谈配置与 LLM 适配器在创建时加载一次，不再在每个请求中重复 import 与构造
+- LLM 调用、导出编码与文件读写使用各自的线程池（``BlockingExecutors``），不共用默认线程池
+- 多 worker 时幂等键、导出任务与后台查询缓存的数据版本号改用数据库中的共享状态
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from interview_system.api.export_jobs import ExportJobManager
+from interview_system.application.services.admin_service import AdminService
+from interview_system.application.services.interview_service import (
+    IdempotencyStore,
+    InterviewService,
+)
+from interview_system.application.services.session_service import SessionService
+from interview_system.config.settings import Settings
+from interview_system.domain.services.answer_processor import AnswerProcessor
+from interview_system.domain.services.followup_generator import FollowupGenerator
+from interview_system.infrastructure.cache.idempotency import MemoryIdempotencyStore
+from interview_system.infrastructure.cache.memory_cache import SessionCache
+from interview_system.infrastructure.cache.query_cache import QueryCache
+from interview_system.infrastructure.database.connection import AsyncDatabase
+from interview_system.infrastructure.database.export_job_store import SqlExportJobStore
+from interview_system.infrastructure.database.idempotency_store import (
+    SqlIdempotencyStore,
+)
+from interview_system.infrastructure.database.repositories.admin_repository_impl import (
+    AdminRepositoryImpl,
+)
+from interview_system.infrastructure.database.repositories.session_repository_impl import (
+    SessionRepositoryImpl,
+)
+from interview_system.infrastructure.database.write_buffer import SessionStateBuffer
+from interview_system.infrastructure.executors import BlockingExecutors
+
+
+class EnvFollowupLLM:
+    """基于环境变量 API_KEY 的 LLM 追问适配器。
+
+    每次调用时检查 API_KEY（运行期配置的 Key 立即生效），未配置或调用失败时返回 None，
+    由 FollowupGenerator 回退到预设追问。
+    """
+
+    def __init__(self) -> None:
+        from interview_system.integrations.api_helpers import generate_followup
+
+        self._generate = generate_followup
+
+    def generate_followup(
+        self,
+        answer: str,
+        topic: dict[str, Any],
+        conversation_log: Sequence[dict[str, Any]] | None = None,
+    ) -> str | None:
+        if not (os.getenv("API_KEY") or "").strip():
+            return None
+        try:
+            log = list(conversation_log) if conversation_log is not None else None
+            return self._generate(answer, topic, log)
+        except Exception:
+            return None
+
+
+@dataclass(frozen=True, slots=True)
+class AppContainer:
+    """应用生命周期内共享的组件。"""
+
+    settings: Settings
+    db: AsyncDatabase
+    session_cache: SessionCache | None
+    admin_query_cache: QueryCache
+    session_write_buffer: SessionStateBuffer | None
+    idempotency_store: IdempotencyStore | None
+    executors: BlockingExecutors
+    session_repository: SessionRepositoryImpl
+    admin_repository: AdminRepositoryImpl
+    interview_service: InterviewService
+    session_service: SessionService
+    admin_service: AdminService
+    export_jobs: ExportJobManager
+
+
+def build_interview_service(
+    repository: SessionRepositoryImpl,
+    *,
+    idempotency_store: IdempotencyStore | None = None,
+    executors: BlockingExecutors | None = None,
+) -> InterviewService:
+    from interview_system.common.config import INTERVIEW_CONFIG
+    from interview_system.core.questions import EDU_TYPES, SCENES, TOPICS
+
+    processor = AnswerProcessor(
+        depth_keywords=INTERVIEW_CONFIG.depth_keywords,
+        common_keywords=INTERVIEW_CONFIG.common_keywords,
+        max_depth_score=INTERVIEW_CONFIG.max_depth_score,
+    )
+    followup = FollowupGenerator(
+        llm=EnvFollowupLLM(),
+        min_answer_length=INTERVIEW_CONFIG.min_answer_length,
+        max_followups_per_question=INTERVIEW_CONFIG.max_followups_per_question,
+        max_depth_score=INTERVIEW_CONFIG.max_depth_score,
+    )
+    return InterviewService(
+        repository=repository,
+        answer_processor=processor,
+        followup_generator=followup,
+        topics_source={"TOPICS": TOPICS, "SCENES": SCENES, "EDU_TYPES": EDU_TYPES},
+        total_questions=INTERVIEW_CONFIG.total_questions,
+        idempotency_store=idempotency_store,
+        llm_executor=executors.llm if executors is not None else None,
+    )
+
+
+def build_idempotency_store(
+    settings: Settings, *, db: AsyncDatabase, multi_worker: bool = False
+) -> IdempotencyStore | None:
+    """IDEMPOTENCY_MAX_KEYS=0 时不处理幂等键；多 worker 时登记在数据库中供各 worker 共用。"""
+    if settings.idempotency_max_keys <= 0:
+        return None
+    if multi_worker:
+        return SqlIdempotencyStore(db, ttl_seconds=settings.idempotency_ttl_seconds)
+    return MemoryIdempotencyStore(
+        maxsize=settings.idempotency_max_keys,
+        ttl_seconds=settings.idempotency_ttl_seconds,
+    )
+
+
+def build_container(
+    settings: Settings,
+    *,
+    db: AsyncDatabase,
+    session_cache: SessionCache | None,
+    admin_query_cache: QueryCache,
+    session_write_buffer: SessionStateBuffer | None,
+    executors: BlockingExecutors,
+    multi_worker: bool = False,
+) -> AppContainer:
+    session_repository = SessionRepositoryImpl(
+        db, cache=session_cache, write_buffer=session_write_buffer
+    )
+    admin_repository = AdminRepositoryImpl(
+        db, count_cache=admin_query_cache, shared_data_version=multi_worker
+    )
+    admin_service = AdminService(admin_repository, cache=admin_query_cache)
+    idempotency_store = build_idempotency_store(
+        settings, db=db, multi_worker=multi_worker
+    )
+    return AppContainer(
+        settings=settings,
+        db=db,
+        session_cache=session_cache,
+        admin_query_cache=admin_query_cache,
+        session_write_buffer=session_write_buffer,
+        idempotency_store=idempotency_store,
+        executors=executors,
+        session_repository=session_repository,
+        admin_repository=admin_repository,
+        interview_service=build_interview_service(
+            session_repository, idempotency_store=idempotency_store, executors=executors
+        ),
+        session_service=SessionService(session_repository),
+        admin_service=admin_service,
+        export_jobs=ExportJobManager(
+            settings.export_dir,
+            lambda: admin_service,
+            max_concurrency=settings.export_max_concurrency,
+            max_pending=settings.export_max_pending,
+            ttl_seconds=settings.export_ttl_seconds,
+            executors=executors,
+            store=SqlExportJobStore(db) if multi_worker else None,
+        ),
+    )
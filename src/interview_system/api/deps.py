@@ -1,20 +1,25 @@
-"""Dependency injection for FastAPI。"""
+"""Dependency injection for FastAPI。
+
+长生命周期组件在 lifespan 中创建一次（见 ``api/container.py``），此处只做查找；
+参数类型为 HTTPConnection，HTTP 与 WebSocket 路由均可使用。
+"""
 
 from __future__ import annotations
 
-import os
 import secrets
 
 from fastapi import Header, Request
+from starlette.requests import HTTPConnection
 
+from interview_system.api.container import AppContainer
 from interview_system.api.exceptions import APIError
+from interview_system.api.export_jobs import ExportJobManager
 from interview_system.application.services.admin_service import AdminService
 from interview_system.application.services.interview_service import InterviewService
 from interview_system.application.services.session_service import SessionService
 from interview_system.config.settings import Settings
-from interview_system.domain.services.answer_processor import AnswerProcessor
-from interview_system.domain.services.followup_generator import FollowupGenerator
 from interview_system.infrastructure.cache.memory_cache import SessionCache
+from interview_system.infrastructure.cache.query_cache import QueryCache
 from interview_system.infrastructure.database.connection import AsyncDatabase
 from interview_system.infrastructure.database.repositories.admin_repository_impl import (
     AdminRepositoryImpl,
@@ -22,24 +27,40 @@ from interview_system.infrastructure.database.repositories.admin_repository_impl
 from interview_system.infrastructure.database.repositories.session_repository_impl import (
     SessionRepositoryImpl,
 )
+from interview_system.infrastructure.database.write_buffer import SessionStateBuffer
+from interview_system.infrastructure.executors import BlockingExecutors
+
+
+def get_container(request: HTTPConnection) -> AppContainer:
+    return request.app.state.container
+
+
+def get_settings(request: HTTPConnection) -> Settings:
+    return get_container(request).settings
 
 
-def get_settings(request: Request) -> Settings:
-    return request.app.state.settings
+def get_fast_json(request: HTTPConnection) -> bool:
+    return get_container(request).settings.fast_json_responses
 
 
-def get_database(request: Request) -> AsyncDatabase:
-    return request.app.state.db
+def get_database(request: HTTPConnection) -> AsyncDatabase:
+    return get_container(request).db
 
 
-def get_session_cache(request: Request) -> SessionCache:
-    return request.app.state.session_cache
+def get_executors(request: HTTPConnection) -> BlockingExecutors:
+    return get_container(request).executors
 
 
-def get_session_repository(request: Request) -> SessionRepositoryImpl:
-    db = get_database(request)
-    cache = get_session_cache(request)
-    return SessionRepositoryImpl(db, cache=cache)
+def get_session_cache(request: HTTPConnection) -> SessionCache | None:
+    return get_container(request).session_cache
+
+
+def get_session_write_buffer(request: HTTPConnection) -> SessionStateBuffer | None:
+    return get_container(request).session_write_buffer
+
+
+def get_session_repository(request: HTTPConnection) -> SessionRepositoryImpl:
+    return get_container(request).session_repository
 
 
 def require_admin_token(
@@ -64,53 +85,25 @@ def require_admin_token(
         )
 
 
-def get_admin_repository(request: Request) -> AdminRepositoryImpl:
-    db = get_database(request)
-    return AdminRepositoryImpl(db)
-
+def get_admin_query_cache(request: HTTPConnection) -> QueryCache | None:
+    return get_container(request).admin_query_cache
 
-def get_admin_service(request: Request) -> AdminService:
-    repo = get_admin_repository(request)
-    return AdminService(repo)
 
+def get_admin_repository(request: HTTPConnection) -> AdminRepositoryImpl:
+    return get_container(request).admin_repository
 
-def get_session_service(request: Request) -> SessionService:
-    repo = get_session_repository(request)
-    return SessionService(repo)
 
+def get_admin_service(request: HTTPConnection) -> AdminService:
+    return get_container(request).admin_service
 
-def get_interview_service(request: Request) -> InterviewService:
-    from interview_system.common.config import INTERVIEW_CONFIG
-    from interview_system.core.questions import EDU_TYPES, SCENES, TOPICS
-    from interview_system.integrations.api_helpers import generate_followup
 
-    class _LLM:
-        def generate_followup(self, answer: str, topic: dict, conversation_log=None):
-            try:
-                return generate_followup(answer, topic, conversation_log)
-            except Exception:
-                return None
+def get_export_job_manager(request: HTTPConnection) -> ExportJobManager:
+    return get_container(request).export_jobs
 
-    repo = get_session_repository(request)
-    api_key = (os.getenv("API_KEY") or "").strip()
 
-    processor = AnswerProcessor(
-        depth_keywords=INTERVIEW_CONFIG.depth_keywords,
-        common_keywords=INTERVIEW_CONFIG.common_keywords,
-        max_depth_score=INTERVIEW_CONFIG.max_depth_score,
-    )
+def get_session_service(request: HTTPConnection) -> SessionService:
+    return get_container(request).session_service
 
-    followup = FollowupGenerator(
-        llm=_LLM() if api_key else None,
-        min_answer_length=INTERVIEW_CONFIG.min_answer_length,
-        max_followups_per_question=INTERVIEW_CONFIG.max_followups_per_question,
-        max_depth_score=INTERVIEW_CONFIG.max_depth_score,
-    )
 
-    return InterviewService(
-        repository=repo,
-        answer_processor=processor,
-        followup_generator=followup,
-        topics_source={"TOPICS": TOPICS, "SCENES": SCENES, "EDU_TYPES": EDU_TYPES},
-        total_questions=INTERVIEW_CONFIG.total_questions,
-    )
+def get_interview_service(request: HTTPConnection) -> InterviewService:
+    return get_container(request).interview_service
@@ -9,10 +9,13 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from interview_system.application.exceptions import (
+    IdempotencyKeyReusedError,
+    InvalidCursorError,
     NothingToUndoError,
     SessionAlreadyCompletedError,
     SessionNotFoundError,
 )
+from interview_system.domain.repositories.session_repository import StaleSessionError
 
 
 @dataclass(frozen=True, slots=True)
@@ -32,47 +35,75 @@ def _error_payload(
     return payload
 
 
-def register_exception_handlers(app: FastAPI) -> None:
-    @app.exception_handler(APIError)
-    async def _handle_api_error(_request: Request, exc: APIError):  # noqa: ANN001
-        return JSONResponse(
-            status_code=exc.status_code,
-            content=_error_payload(
-                code=exc.code, message=exc.message, details=exc.details
-            ),
-        )
-
-    @app.exception_handler(SessionNotFoundError)
-    async def _handle_session_not_found(_request: Request, exc: SessionNotFoundError):  # noqa: ANN001
-        return JSONResponse(
+def to_api_error(exc: Exception) -> APIError | None:
+    """将应用层异常映射为 APIError（HTTP 与 WebSocket 共用），未知异常返回 None。"""
+    if isinstance(exc, APIError):
+        return exc
+    if isinstance(exc, SessionNotFoundError):
+        return APIError(
+            code="SESSION_NOT_FOUND",
+            message="Session not found",
             status_code=404,
-            content=_error_payload(
-                code="SESSION_NOT_FOUND",
-                message="Session not found",
-                details={"session_id": str(exc.session_id)},
-            ),
+            details={"session_id": str(exc.session_id)},
         )
-
-    @app.exception_handler(SessionAlreadyCompletedError)
-    async def _handle_session_completed(
-        _request: Request, exc: SessionAlreadyCompletedError
-    ):  # noqa: ANN001
-        return JSONResponse(
+    if isinstance(exc, SessionAlreadyCompletedError):
+        return APIError(
+            code="SESSION_COMPLETED",
+            message="Session already completed",
             status_code=400,
-            content=_error_payload(
-                code="SESSION_COMPLETED",
-                message="Session already completed",
-                details={"session_id": str(exc.session_id)},
-            ),
+            details={"session_id": str(exc.session_id)},
         )
-
-    @app.exception_handler(NothingToUndoError)
-    async def _handle_nothing_to_undo(_request: Request, exc: NothingToUndoError):  # noqa: ANN001
-        return JSONResponse(
+    if isinstance(exc, NothingToUndoError):
+        return APIError(
+            code="NO_MESSAGES_TO_UNDO",
+            message="No messages to undo",
+            status_code=400,
+            details={"session_id": str(exc.session_id)},
+        )
+    if isinstance(exc, InvalidCursorError):
+        return APIError(
+            code="INVALID_CURSOR",
+            message="Invalid pagination cursor",
             status_code=400,
-            content=_error_payload(
-                code="NO_MESSAGES_TO_UNDO",
-                message="No messages to undo",
-                details={"session_id": str(exc.session_id)},
-            ),
+            details={"cursor": exc.cursor},
+        )
+    if isinstance(exc, StaleSessionError):
+        return APIError(
+            code="SESSION_CONFLICT",
+            message="Session was modified by another request, please retry",
+            status_code=409,
+            details={"session_id": str(exc.session_id)},
         )
+    if isinstance(exc, IdempotencyKeyReusedError):
+        return APIError(
+            code="IDEMPOTENCY_KEY_REUSED",
+            message="Idempotency-Key was already used with a different request",
+            status_code=422,
+            details={
+                "session_id": str(exc.session_id),
+                "idempotency_key": exc.idempotency_key,
+            },
+        )
+    return None
+
+
+def error_payload(error: APIError) -> dict[str, Any]:
+    return _error_payload(code=error.code, message=error.message, details=error.details)
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    async def _handle(_request: Request, exc: Exception):  # noqa: ANN001
+        error = to_api_error(exc)
+        assert error is not None
+        return JSONResponse(status_code=error.status_code, content=error_payload(error))
+
+    for exc_type in (
+        APIError,
+        SessionNotFoundError,
+        SessionAlreadyCompletedError,
+        NothingToUndoError,
+        InvalidCursorError,
+        IdempotencyKeyReusedError,
+        StaleSessionError,
+    ):
+        app.add_exception_handler(exc_type, _handle)
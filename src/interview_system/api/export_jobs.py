@@ -0,0 +1,405 @@
+"""后台导出任务：脱离 HTTP 请求生命周期生成大文件。
+
+说明：
+- 任务提交后立即返回，由后台协程分块写入 EXPORT_DIR（写完前为 ``.part`` 临时文件）
+- 并发数受信号量限制，排队任务数有上限，避免导出挤占访谈请求
+- 单 worker 时任务状态只保存在进程内存中；完成的文件按 TTL 清理（启动时同时清理残留文件）
+- 多 worker 时通过共享的 ExportJobStore 登记任务：任一 worker 都能查询、下载与删除，
+  启动时只清理无登记的残留文件，执行任务的 worker 退出后由其他 worker 标记失败并清理
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+import uuid
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal, Protocol
+
+from interview_system.api.utils.export_files import (
+    COMPRESSION_SUFFIXES,
+    MEDIA_TYPES,
+    ExportCompression,
+    ExportFormat,
+    ExportScope,
+    export_filename,
+    export_media_type,
+    export_scopes,
+    write_export,
+)
+from interview_system.application.services.admin_service import AdminService
+from interview_system.infrastructure.executors import BlockingExecutors
+
+logger = logging.getLogger(__name__)
+
+ExportJobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+_PART_SUFFIX = ".part"
+_JOB_FILE = re.compile(
+    rf"^[0-9a-f]{{32}}\.({'|'.join(MEDIA_TYPES)})"
+    rf"({'|'.join(re.escape(s) for s in COMPRESSION_SUFFIXES.values())})?(\.part)?$"
+)
+
+
+class ExportQueueFullError(Exception):
+    """排队中的导出任务数已达上限。"""
+
+
+class ExportJobStore(Protocol):
+    """各 worker 共享的导出任务登记；记录为字典，键与 ExportJob 字段一致（不含 path）。"""
+
+    async def insert(self, record: dict[str, Any], *, max_pending: int) -> bool:
+        """排队与执行中的任务（全部 worker 合计）少于 max_pending 时登记并返回 True。"""
+        ...
+
+    async def update(self, job_id: str, fields: dict[str, Any]) -> bool:
+        """更新状态与进度并刷新心跳；任务已被删除时返回 False。"""
+        ...
+
+    async def get(self, job_id: str) -> dict[str, Any] | None: ...
+
+    async def delete(self, job_id: str) -> bool: ...
+
+    async def existing_ids(self, job_ids: Iterable[str]) -> set[str]: ...
+
+    async def fail_stale(self, *, heartbeat_before: float, now: float) -> list[str]:
+        """把心跳超时的排队/执行中任务标记为失败，返回其 id。"""
+        ...
+
+    async def expire(self, *, finished_before: float) -> list[str]:
+        """删除结束时间不晚于 finished_before 的任务，返回其 id。"""
+        ...
+
+
+@dataclass(slots=True)
+class ExportJob:
+    """导出任务状态（可变，由后台协程更新）。"""
+
+    id: str
+    scope: ExportScope
+    format: ExportFormat
+    filters: dict[str, Any]
+    filename: str
+    created_at: float
+    compression: ExportCompression = "none"
+    status: ExportJobStatus = "queued"
+    started_at: float | None = None
+    finished_at: float | None = None
+    rows_written: int = 0
+    total_rows: int | None = None
+    error: str | None = None
+    path: Path | None = None
+
+    @property
+    def media_type(self) -> str:
+        return export_media_type(self.format, self.compression)
+
+    @property
+    def is_done(self) -> bool:
+        return self.status in ("succeeded", "failed", "cancelled")
+
+    @property
+    def size_bytes(self) -> int | None:
+        if self.path is None or self.status != "succeeded":
+            return None
+        try:
+            return self.path.stat().st_size
+        except OSError:
+            return None
+
+    @property
+    def progress(self) -> float | None:
+        if self.status == "succeeded":
+            return 1.0
+        if not self.total_rows:
+            return None
+        return min(1.0, self.rows_written / self.total_rows)
+
+
+class ExportJobManager:
+    """导出任务队列：任务在提交它的 worker 中执行，store 为空时状态只保存在本进程。"""
+
+    def __init__(
+        self,
+        export_dir: Path | str,
+        service_factory: Callable[[], AdminService],
+        *,
+        max_concurrency: int = 1,
+        max_pending: int = 20,
+        ttl_seconds: float = 3600,
+        cleanup_interval_seconds: float = 60,
+        executors: BlockingExecutors | None = None,
+        store: ExportJobStore | None = None,
+        sync_interval_seconds: float = 1,
+        stale_after_seconds: float = 30,
+    ) -> None:
+        self._dir = Path(export_dir)
+        self._service_factory = service_factory
+        self._semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+        self._max_pending = max(1, int(max_pending))
+        self._ttl = float(ttl_seconds)
+        self._cleanup_interval = max(0.01, float(cleanup_interval_seconds))
+        self._executors = executors
+        self._store = store
+        self._sync_interval = max(0.01, float(sync_interval_seconds))
+        self._stale_after = float(stale_after_seconds)
+        self._jobs: dict[str, ExportJob] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._background: list[asyncio.Task[None]] = []
+
+    @property
+    def export_dir(self) -> Path:
+        return self._dir
+
+    async def get(self, job_id: str) -> ExportJob | None:
+        """多 worker 时以共享登记为准（其他 worker 的任务进度最多滞后一个同步周期）。"""
+        job = self._jobs.get(job_id)
+        if self._store is None:
+            return job
+        record = await self._store.get(job_id)
+        if record is None:
+            # 已被其他 worker 删除（本进程执行中的任务在下次同步进度时取消）
+            return None
+        if job is not None and not job.is_done:
+            return job
+        job = ExportJob(**record)
+        if job.status == "succeeded":
+            job.path = self._final_path(job)
+        return job
+
+    async def submit(
+        self,
+        *,
+        scope: ExportScope,
+        format: ExportFormat,
+        filters: dict[str, Any],
+        compression: ExportCompression = "none",
+    ) -> ExportJob:
+        """登记任务并在后台执行；排队/执行中的任务过多时抛出 ExportQueueFullError。"""
+        if self._store is None:
+            pending = sum(1 for job in self._jobs.values() if not job.is_done)
+            if pending >= self._max_pending:
+                raise ExportQueueFullError()
+
+        job_id = uuid.uuid4().hex
+        stem = f"{scope}_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}"
+        job = ExportJob(
+            id=job_id,
+            scope=scope,
+            format=format,
+            filters={**filters, "scope": scope},
+            filename=export_filename(stem, format=format, compression=compression),
+            created_at=time.time(),
+            compression=compression,
+        )
+        if self._store is not None and not await self._store.insert(
+            _record(job), max_pending=self._max_pending
+        ):
+            raise ExportQueueFullError()
+        self._jobs[job_id] = job
+        self._tasks[job_id] = asyncio.create_task(self._run(job))
+        return job
+
+    async def delete(self, job_id: str) -> bool:
+        """取消（如仍在执行）并删除任务及其文件。
+
+        其他 worker 执行中的任务只删除登记与文件，执行方在下次同步进度时发现并取消。
+        """
+        found = self._jobs.pop(job_id, None) is not None
+        if self._store is not None:
+            found = await self._store.delete(job_id) or found
+        if not found:
+            return False
+        await self._cancel(job_id)
+        self._remove_files(job_id)
+        return True
+
+    async def cleanup(self, *, now: float | None = None) -> int:
+        """删除已结束且超过 TTL 的任务与文件，返回删除的任务数。"""
+        now = time.time() if now is None else now
+        expired = {
+            job.id
+            for job in self._jobs.values()
+            if job.is_done
+            and job.finished_at is not None
+            and now - job.finished_at >= self._ttl
+        }
+        if self._store is not None:
+            expired.update(await self._store.expire(finished_before=now - self._ttl))
+            # 执行方已退出（心跳超时）的任务：标记失败并删除残留的临时文件
+            stale = await self._store.fail_stale(
+                heartbeat_before=now - self._stale_after, now=now
+            )
+            for job_id in stale:
+                if job_id not in self._jobs:
+                    self._remove_files(job_id)
+        for job_id in expired:
+            self._jobs.pop(job_id, None)
+            self._tasks.pop(job_id, None)
+            self._remove_files(job_id)
+        return len(expired)
+
+    async def start(self) -> None:
+        """清理上次运行残留的导出文件并启动周期清理任务（目录在首个任务执行时创建）。
+
+        多 worker 时其他 worker 可能正在写入同一目录，只删除共享登记中没有记录的文件。
+        """
+        if self._dir.is_dir():
+            # 只删除本模块生成的文件，避免误删目录中的其他内容
+            files = {
+                path: path.name.split(".", 1)[0]
+                for path in self._dir.iterdir()
+                if path.is_file() and _JOB_FILE.match(path.name)
+            }
+            live: set[str] = set()
+            if self._store is not None:
+                live = await self._store.existing_ids(set(files.values()))
+            for path, job_id in files.items():
+                if job_id not in live:
+                    path.unlink(missing_ok=True)
+        if not any(not task.done() for task in self._background):
+            self._background = [asyncio.create_task(self._cleanup_loop())]
+            if self._store is not None:
+                self._background.append(asyncio.create_task(self._sync_loop()))
+
+    async def close(self) -> None:
+        """取消执行中的任务与清理任务（未完成的临时文件一并删除）。"""
+        tasks = [t for t in self._tasks.values() if not t.done()]
+        tasks.extend(self._background)
+        self._background = []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _cancel(self, job_id: str) -> None:
+        task = self._tasks.pop(job_id, None)
+        if task is not None and not task.done():
+            task.cancel()
+            # 用 wait 而非直接 await task：调用方自身被取消时不会被这里吞掉
+            await asyncio.wait({task})
+
+    def _remove_files(self, job_id: str) -> None:
+        for path in self._dir.glob(f"{job_id}.*"):
+            if _JOB_FILE.match(path.name):
+                path.unlink(missing_ok=True)
+
+    def _part_path(self, job: ExportJob) -> Path:
+        return self._dir / f"{self._final_path(job).name}{_PART_SUFFIX}"
+
+    def _final_path(self, job: ExportJob) -> Path:
+        name = export_filename(job.id, format=job.format, compression=job.compression)
+        return self._dir / name
+
+    async def _publish(self, job: ExportJob) -> bool:
+        """把状态与进度写入共享登记；登记已被其他 worker 删除时返回 False。"""
+        if self._store is None:
+            return True
+        try:
+            # 调用方被取消时让已开始的更新完成，避免事务中途中断
+            return await asyncio.shield(self._store.update(job.id, _progress(job)))
+        except Exception:
+            logger.warning("导出任务状态同步失败: %s", job.id, exc_info=True)
+            return True
+
+    async def _run(self, job: ExportJob) -> None:
+        part = self._part_path(job)
+        try:
+            async with self._semaphore:
+                job.status = "running"
+                job.started_at = time.time()
+                await self._publish(job)
+                service = self._service_factory()
+                job.total_rows = await self._estimate_rows(service, job)
+
+                def _on_rows(n: int) -> None:
+                    job.rows_written += n
+
+                self._dir.mkdir(parents=True, exist_ok=True)
+                with part.open("wb") as out:
+                    await write_export(
+                        out,
+                        service,
+                        job.filters,
+                        format=job.format,
+                        compression=job.compression,
+                        on_rows=_on_rows,
+                        executors=self._executors,
+                    )
+                final = self._final_path(job)
+                part.replace(final)
+                job.path = final
+                job.status = "succeeded"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            part.unlink(missing_ok=True)
+            raise
+        except Exception as exc:
+            logger.exception("导出任务失败: %s", job.id)
+            job.status = "failed"
+            job.error = str(exc) or type(exc).__name__
+            part.unlink(missing_ok=True)
+        finally:
+            job.finished_at = time.time()
+            if not await self._publish(job):
+                # 执行期间已被其他 worker 删除
+                self._jobs.pop(job.id, None)
+                self._tasks.pop(job.id, None)
+                self._remove_files(job.id)
+
+    async def _estimate_rows(self, service: AdminService, job: ExportJob) -> int | None:
+        try:
+            counts = [
+                await service.count_export_items(**{**job.filters, "scope": scope})
+                for scope in export_scopes(job.scope)
+            ]
+        except Exception:
+            logger.warning("导出任务行数估算失败: %s", job.id, exc_info=True)
+            return None
+        return sum(counts)
+
+    async def _cleanup_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._cleanup_interval)
+            try:
+                await self.cleanup()
+            except Exception:
+                logger.exception("导出文件清理失败")
+
+    async def _sync_loop(self) -> None:
+        # 定期同步本进程任务的进度并刷新心跳；登记已被删除的任务在此取消
+        while True:
+            await asyncio.sleep(self._sync_interval)
+            for job in [j for j in self._jobs.values() if not j.is_done]:
+                if not await self._publish(job):
+                    self._jobs.pop(job.id, None)
+                    await self._cancel(job.id)
+                    self._remove_files(job.id)
+
+
+def _record(job: ExportJob) -> dict[str, Any]:
+    return {
+        "id": job.id,
+        "scope": job.scope,
+        "format": job.format,
+        "compression": job.compression,
+        "filters": job.filters,
+        "filename": job.filename,
+        "created_at": job.created_at,
+        **_progress(job),
+    }
+
+
+def _progress(job: ExportJob) -> dict[str, Any]:
+    return {
+        "status": job.status,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "rows_written": job.rows_written,
+        "total_rows": job.total_rows,
+        "error": job.error,
+    }
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import json
 import logging
+import multiprocessing
 import os
 import re
+import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
 from urllib.parse import urlparse
@@ -13,13 +15,24 @@ from urllib.parse import urlparse
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from interview_system.api.container import build_container
 from interview_system.api.exceptions import register_exception_handlers
-from interview_system.api.routes import admin, health, interview, session
+from interview_system.api.routes import admin, health, interview, session, ws
 from interview_system.config import settings as _settings
 from interview_system.config.logging import configure_logging
 from interview_system.config.settings import Settings
+from interview_system.infrastructure.cache.backends import (
+    RedisCacheBackend,
+    SqliteCacheBackend,
+)
 from interview_system.infrastructure.cache.memory_cache import SessionCache
-from interview_system.infrastructure.database.connection import AsyncDatabase
+from interview_system.infrastructure.cache.query_cache import QueryCache
+from interview_system.infrastructure.database.connection import (
+    AsyncDatabase,
+    SqlitePragmas,
+)
+from interview_system.infrastructure.database.write_buffer import SessionStateBuffer
+from interview_system.infrastructure.executors import BlockingExecutors
 
 logger = logging.getLogger(__name__)
 
@@ -120,18 +133,117 @@ def get_public_url_state() -> dict[str, object]:
     return _read_public_url_state_file(Path(state_path))
 
 
+def _build_sqlite_pragmas(settings: Settings) -> SqlitePragmas | None:
+    """根据配置构造 SQLite 调优参数（关闭时返回 None，使用 SQLite 默认值）。"""
+    if not settings.sqlite_tuning:
+        return None
+    return SqlitePragmas(
+        journal_mode=settings.sqlite_journal_mode,
+        synchronous=settings.sqlite_synchronous,
+        busy_timeout_ms=settings.sqlite_busy_timeout_ms,
+        mmap_size=settings.sqlite_mmap_size,
+        cache_size=settings.sqlite_cache_size,
+        temp_store=settings.sqlite_temp_store,
+    )
+
+
+def _is_multi_worker(settings: Settings) -> bool:
+    """是否按多 worker 运行（决定进程内状态是否改用共享存储）。
+
+    SERVER_WORKERS 未设置（0）时无法得知 worker 数：由 ``uvicorn --workers`` 派生或在
+    gunicorn 下运行的进程按多 worker 处理，避免静默使用各进程独立的状态。
+    """
+    if settings.server_workers > 0:
+        return settings.server_workers > 1
+    return multiprocessing.parent_process() is not None or "gunicorn" in sys.modules
+
+
+def _build_session_cache(
+    settings: Settings, *, multi_worker: bool, executors: BlockingExecutors
+) -> SessionCache | None:
+    """按配置构造会话缓存；多 worker 下进程内缓存会读到其他 worker 更新前的状态，不启用。"""
+    ttl = settings.session_cache_ttl_seconds
+    if settings.session_cache_backend == "sqlite":
+        backend = SqliteCacheBackend(
+            settings.session_cache_url or "./session_cache.db",
+            ttl_seconds=ttl,
+            max_entries=settings.session_cache_max_entries,
+            executor=executors.file_io,
+        )
+        return SessionCache(backend=backend)
+    if settings.session_cache_backend == "redis":
+        backend_url = settings.session_cache_url or "redis://localhost:6379/0"
+        return SessionCache(backend=RedisCacheBackend(backend_url, ttl_seconds=ttl))
+    if multi_worker:
+        return None
+    return SessionCache(maxsize=settings.session_cache_max_entries, ttl_seconds=ttl)
+
+
 def create_app(settings: Settings) -> FastAPI:
     """创建 FastAPI app（允许测试时传入不同 Settings）。"""
     configure_logging(log_level=settings.log_level)
 
     @asynccontextmanager
-    async def lifespan(app: FastAPI):  # type: ignore[misc]
-        app.state.settings = settings
-        app.state.session_cache = SessionCache()
-        app.state.db = AsyncDatabase(settings.database_url)
-        await app.state.db.init()
+    async def lifespan(app: FastAPI):
+        # 多 worker 时各进程的内存状态互不可见：会话缓存需使用共享后端，写回缓冲不启用，
+        # 幂等键与导出任务登记在数据库中（见 build_container）
+        multi_worker = _is_multi_worker(settings)
+        if multi_worker and settings.server_workers == 0:
+            logger.info("未设置 SERVER_WORKERS 且由多进程服务器启动，按多 worker 运行")
+        executors = BlockingExecutors.create(
+            llm_workers=settings.llm_executor_workers,
+            cpu_workers=settings.cpu_executor_workers,
+            file_io_workers=settings.file_io_executor_workers,
+            process_workers=settings.export_process_workers,
+        )
+        session_cache = _build_session_cache(
+            settings, multi_worker=multi_worker, executors=executors
+        )
+        admin_query_cache = QueryCache(
+            ttl_seconds=settings.admin_query_cache_ttl_seconds
+        )
+        db = AsyncDatabase(
+            settings.database_url,
+            sqlite_pragmas=_build_sqlite_pragmas(settings),
+            read_database_url=settings.admin_database_url or None,
+            read_engine=settings.admin_read_engine,
+            read_pool_size=settings.admin_read_pool_size,
+            read_statement_timeout_ms=settings.admin_statement_timeout_ms,
+        )
+        await db.init()
+        write_buffer: SessionStateBuffer | None = None
+        if settings.session_write_behind and multi_worker:
+            logger.warning("SESSION_WRITE_BEHIND 仅支持单 worker，多 worker 下已停用")
+        elif settings.session_write_behind:
+            write_buffer = SessionStateBuffer(
+                db,
+                flush_interval_seconds=settings.session_flush_interval_seconds,
+                max_pending=settings.session_flush_max_pending,
+            )
+            write_buffer.start()
+
+        container = build_container(
+            settings,
+            db=db,
+            session_cache=session_cache,
+            admin_query_cache=admin_query_cache,
+            session_write_buffer=write_buffer,
+            executors=executors,
+            multi_worker=multi_worker,
+        )
+        app.state.container = container
+        await container.export_jobs.start()
         yield
-        await app.state.db.dispose()
+        await container.export_jobs.close()
+        # 等待进行中的 LLM 调用等阻塞任务完成后再关闭线程池
+        if not await executors.drain(settings.server_graceful_shutdown_seconds):
+            logger.warning("关闭时仍有未完成的阻塞任务，已放弃等待")
+        executors.shutdown()
+        if write_buffer is not None:
+            await write_buffer.close()
+        if session_cache is not None:
+            await session_cache.close()
+        await db.dispose()
 
     app = FastAPI(
         title="Interview System API",
@@ -142,7 +254,9 @@ def create_app(settings: Settings) -> FastAPI:
 
     register_exception_handlers(app)
 
-    allow_origins = _unique_keep_order(_parse_cors_origins() + list(settings.allowed_origins))
+    allow_origins = _unique_keep_order(
+        _parse_cors_origins() + list(settings.allowed_origins)
+    )
     allow_origin_regex = _build_cors_allow_origin_regex()
     app.add_middleware(
         CORSMiddleware,
@@ -157,6 +271,7 @@ def create_app(settings: Settings) -> FastAPI:
     app.include_router(interview.router, prefix="/api")
     app.include_router(admin.router, prefix="/api")
     app.include_router(health.router)
+    app.include_router(ws.router)
 
     @app.get("/api/public-url")
     async def public_url():
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Literal, cast
+from typing import Any, Literal, cast
 from uuid import uuid4
 
+from interview_system.api.export_jobs import ExportJob
+from interview_system.api.schemas.admin import AdminExportJobResponse
 from interview_system.api.schemas.message import MessageResponse
 from interview_system.api.schemas.session import SessionResponse
 from interview_system.domain.entities.session import Session
@@ -14,39 +16,59 @@ from interview_system.domain.entities.session import Session
 Role = Literal["user", "assistant", "system"]
 
 
+def session_payload(session: Session) -> dict[str, Any]:
+    """SessionResponse 结构的纯 dict（快速 JSON 路径直接序列化）。"""
+    return {
+        "id": str(session.id),
+        "status": "completed" if session.is_finished() else "active",
+        "current_question": int(session.current_question_idx),
+        "total_questions": len(session.selected_topics)
+        if session.selected_topics
+        else 0,
+        "created_at": int(session.created_at.timestamp() * 1000),
+        "user_name": session.user_name,
+    }
+
+
 def to_session_response(session: Session) -> SessionResponse:
-    return SessionResponse(
-        id=str(session.id),
-        status="completed" if session.is_finished() else "active",
-        current_question=int(session.current_question_idx),
-        total_questions=len(session.selected_topics) if session.selected_topics else 0,
-        created_at=int(session.created_at.timestamp() * 1000),
-        user_name=session.user_name,
-    )
+    return SessionResponse(**session_payload(session))
 
 
-def to_message_response(
+def message_payload(
     role: Role,
     content: str,
     *,
     msg_id: str | None = None,
     timestamp_ms: int | None = None,
-) -> MessageResponse:
+) -> dict[str, Any]:
+    """MessageResponse 结构的纯 dict。"""
     ts = (
         timestamp_ms
         if timestamp_ms is not None
         else int(datetime.now(timezone.utc).timestamp() * 1000)
     )
+    return {
+        "id": msg_id or f"msg_{uuid4().hex[:8]}",
+        "role": role,
+        "content": content,
+        "timestamp": ts,
+    }
+
+
+def to_message_response(
+    role: Role,
+    content: str,
+    *,
+    msg_id: str | None = None,
+    timestamp_ms: int | None = None,
+) -> MessageResponse:
     return MessageResponse(
-        id=msg_id or f"msg_{uuid4().hex[:8]}",
-        role=role,
-        content=content,
-        timestamp=ts,
+        **message_payload(role, content, msg_id=msg_id, timestamp_ms=timestamp_ms)
     )
 
 
-def to_message_responses(messages: list[dict]) -> list[MessageResponse]:
-    result: list[MessageResponse] = []
+def message_payloads(messages: list[dict]) -> list[dict[str, Any]]:
+    result: list[dict[str, Any]] = []
     now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
     for i, msg in enumerate(messages):
         raw_role = str(msg.get("role", "assistant"))
@@ -54,11 +76,43 @@ def to_message_responses(messages: list[dict]) -> list[MessageResponse]:
         if raw_role in {"user", "assistant", "system"}:
             normalized_role = cast(Role, raw_role)
         result.append(
-            to_message_response(
-                role=normalized_role,
-                content=str(msg.get("content", "")),
-                msg_id=f"msg_{i}",
+            message_payload(
+                normalized_role,
+                str(msg.get("content", "")),
+                msg_id=str(msg.get("id") or f"msg_{i}"),
                 timestamp_ms=int(msg.get("timestamp") or now_ms),
             )
         )
     return result
+
+
+def to_message_responses(messages: list[dict]) -> list[MessageResponse]:
+    return [MessageResponse(**payload) for payload in message_payloads(messages)]
+
+
+def _from_epoch(ts: float | None) -> datetime | None:
+    return None if ts is None else datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+def to_export_job_response(job: ExportJob) -> AdminExportJobResponse:
+    return AdminExportJobResponse(
+        job_id=job.id,
+        status=job.status,
+        scope=job.scope,
+        format=job.format,
+        compression=job.compression,
+        filename=job.filename,
+        created_at=datetime.fromtimestamp(job.created_at, tz=timezone.utc),
+        started_at=_from_epoch(job.started_at),
+        finished_at=_from_epoch(job.finished_at),
+        rows_written=job.rows_written,
+        total_rows=job.total_rows,
+        progress=job.progress,
+        size_bytes=job.size_bytes,
+        error=job.error,
+        download_url=(
+            f"/api/admin/exports/{job.id}/download"
+            if job.status == "succeeded"
+            else None
+        ),
+    )
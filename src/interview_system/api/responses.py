@@ -0,0 +1,64 @@
+"""热点接口的快速 JSON 响应（可选，``FAST_JSON_RESPONSES=true`` 开启）。
+
+说明：
+- 默认路径：路由返回 dict，FastAPI 按 response_model 校验后序列化
+- 快速路径：mapper 产出的 payload 已是确定结构的纯 dict/list，直接用 orjson 序列化为字节，
+  跳过 response_model 的二次校验；OpenAPI 文档仍由 response_model 生成
+- 依赖可选的 orjson（``pip install interview-system[fast]``）；未安装时保持默认路径
+  （标准库 json 比 Pydantic 的 Rust 序列化更慢，不作为回退）
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any
+
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 取决于是否安装 fast 依赖
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+# 由响应体决定的头，不从 headers_from 复制
+_BODY_HEADERS = {b"content-length", b"content-type"}
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_json(content: Any) -> bytes:
+    return orjson.dumps(
+        content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    )
+
+
+class FastJSONResponse(Response):
+    """不经校验直接以 orjson 序列化内容的 JSON 响应。"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+def json_response(
+    payload: Any, *, fast: bool, headers_from: Response | None = None
+) -> Any:
+    """fast=True 且已安装 orjson 时返回 FastJSONResponse（沿用 headers_from 上已设置的响应头），
+    否则原样返回 payload 交由 FastAPI 按 response_model 校验。"""
+    if not (fast and HAS_ORJSON):
+        return payload
+    response = FastJSONResponse(payload)
+    if headers_from is not None:
+        response.headers.raw.extend(
+            (key, value)
+            for key, value in headers_from.headers.raw
+            if key not in _BODY_HEADERS
+        )
+    return response
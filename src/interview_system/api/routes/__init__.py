@@ -1,6 +1,6 @@
 """API route modules"""
 
 from . import health, interview, session
-from . import admin
+from . import admin, ws
 
-__all__ = ["session", "interview", "health", "admin"]
+__all__ = ["session", "interview", "health", "admin", "ws"]
@@ -2,20 +2,46 @@
 
 from __future__ import annotations
 
+import io
 from datetime import datetime
-from typing import Literal
+from typing import IO, Literal, cast
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import FileResponse, StreamingResponse
 
-from interview_system.api.deps import get_admin_service, require_admin_token
+from interview_system.api.deps import (
+    get_admin_service,
+    get_executors,
+    get_export_job_manager,
+    get_fast_json,
+    require_admin_token,
+)
+from interview_system.api.exceptions import APIError
+from interview_system.api.export_jobs import (
+    ExportJob,
+    ExportJobManager,
+    ExportQueueFullError,
+)
+from interview_system.api.mappers import to_export_job_response
+from interview_system.api.responses import json_response
 from interview_system.api.schemas.admin import (
+    AdminExportJobResponse,
+    AdminExportQuery,
     AdminListResponse,
     AdminOverviewResponse,
     AdminSearchResponse,
 )
-from interview_system.api.utils.xlsx import build_xlsx
+from interview_system.api.utils.export_files import (
+    STREAM_ENCODERS,
+    ensure_export_supported,
+    export_filename,
+    export_media_type,
+    iter_file,
+    spool_export,
+    stream_export,
+)
 from interview_system.application.services.admin_service import AdminService
+from interview_system.infrastructure.executors import BlockingExecutors
 
 router = APIRouter(
     prefix="/admin",
@@ -31,8 +57,10 @@ async def overview(
     end: datetime | None = Query(default=None),
     bucket: Literal["day", "hour"] = Query(default="day"),
     top_n: int = Query(default=10, ge=1, le=50),
+    fast_json: bool = Depends(get_fast_json),
 ):
-    return await service.overview(start=start, end=end, bucket=bucket, top_n=top_n)
+    payload = await service.overview(start=start, end=end, bucket=bucket, top_n=top_n)
+    return json_response(payload, fast=fast_json)
 
 
 @router.get("/sessions", response_model=AdminListResponse)
@@ -44,15 +72,21 @@ async def list_sessions(
     is_finished: bool | None = Query(default=None),
     limit: int = Query(default=50, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
+    count: Literal["exact", "cached", "none"] = Query(default="cached"),
+    fast_json: bool = Depends(get_fast_json),
 ):
-    return await service.list_sessions(
+    page = await service.list_sessions(
         start=start,
         end=end,
         user_name=user_name,
         is_finished=is_finished,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        count=count,
     )
+    return json_response(page, fast=fast_json)
 
 
 @router.get("/search", response_model=AdminSearchResponse)
@@ -67,8 +101,11 @@ async def search(
     max_depth: int | None = Query(default=None, ge=0),
     limit: int = Query(default=50, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
+    count: Literal["exact", "cached", "none"] = Query(default="cached"),
+    fast_json: bool = Depends(get_fast_json),
 ):
-    return await service.search_conversations(
+    page = await service.search_conversations(
         start=start,
         end=end,
         user_name=user_name,
@@ -78,14 +115,34 @@ async def search(
         max_depth=max_depth,
         limit=limit,
         offset=offset,
+        cursor=cursor,
+        count=count,
+    )
+    return json_response(page, fast=fast_json)
+
+
+def _file_response(
+    body: IO[bytes], *, media_type: str, filename: str, executors: BlockingExecutors
+) -> StreamingResponse:
+    size = body.seek(0, io.SEEK_END)
+    body.seek(0)
+    return StreamingResponse(
+        iter_file(body, executors=executors),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(size),
+        },
     )
 
 
 @router.get("/export")
 async def export(
     service: AdminService = Depends(get_admin_service),
-    scope: Literal["sessions", "conversations"] = Query(default="conversations"),
-    format: Literal["csv", "json", "xlsx"] = Query(default="csv"),
+    scope: Literal["sessions", "conversations", "all"] = Query(default="conversations"),
+    format: Literal["csv", "json", "ndjson", "xlsx", "parquet", "arrow"] = Query(
+        default="csv"
+    ),
     start: datetime | None = Query(default=None),
     end: datetime | None = Query(default=None),
     user_name: str | None = Query(default=None),
@@ -93,56 +150,115 @@ async def export(
     keyword: str | None = Query(default=None),
     min_depth: int | None = Query(default=None, ge=0),
     max_depth: int | None = Query(default=None, ge=0),
-    limit: int = Query(default=5000, ge=1, le=20000),
+    limit: int | None = Query(default=None, ge=1),
     offset: int = Query(default=0, ge=0),
+    compression: Literal["none", "gzip", "zstd"] = Query(default="none"),
+    executors: BlockingExecutors = Depends(get_executors),
 ):
-    base_name, items = await service.export_rows(
-        scope=scope,
-        start=start,
-        end=end,
-        user_name=user_name,
-        topic=topic,
-        keyword=keyword,
-        min_depth=min_depth,
-        max_depth=max_depth,
-        limit=limit,
-        offset=offset,
+    ensure_export_supported(scope=scope, format=format, compression=compression)
+    filters = {
+        "scope": scope,
+        "start": start,
+        "end": end,
+        "user_name": user_name,
+        "topic": topic,
+        "keyword": keyword,
+        "min_depth": min_depth,
+        "max_depth": max_depth,
+        "limit": limit,
+        "offset": offset,
+    }
+    stem = f"{scope}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+    filename = export_filename(stem, format=format, compression=compression)
+    media_type = export_media_type(format, compression)
+
+    if format in STREAM_ENCODERS:
+        # 流式输出：首字节立即返回，内存占用与导出行数无关；压缩按块增量进行
+        return StreamingResponse(
+            stream_export(
+                service,
+                filters,
+                format=cast('Literal["csv", "json", "ndjson"]', format),
+                compression=compression,
+                executors=executors,
+            ),
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
+    # XLSX/Parquet/Arrow 的目录/footer 在文件末尾，写完临时文件后再返回
+    body = await spool_export(service, filters, format=format, executors=executors)
+    return _file_response(
+        body, media_type=media_type, filename=filename, executors=executors
     )
 
-    file_stem = f"{base_name}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
 
-    if format == "json":
-        body = service.to_json(items)
-        return Response(
-            content=body,
-            media_type="application/json",
-            headers={
-                "Content-Disposition": f'attachment; filename="{file_stem}.json"'
-            },
+async def _get_job(manager: ExportJobManager, job_id: str) -> ExportJob:
+    job = await manager.get(job_id)
+    if job is None:
+        raise APIError(
+            code="EXPORT_JOB_NOT_FOUND",
+            message="Export job not found",
+            status_code=404,
         )
+    return job
 
-    if format == "xlsx":
-        if not items:
-            rows: list[list[str]] = [["empty"]]
-        else:
-            headers = list(items[0].keys())
-            rows = [headers]
-            for item in items:
-                rows.append([str(item.get(h, "")) for h in headers])
-
-        body = build_xlsx(rows=rows, sheet_name=base_name)
-        return Response(
-            content=body,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={
-                "Content-Disposition": f'attachment; filename="{file_stem}.xlsx"'
-            },
-        )
 
-    body = service.to_csv(items)
-    return Response(
-        content=body,
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": f'attachment; filename="{file_stem}.csv"'},
+@router.post("/exports", response_model=AdminExportJobResponse, status_code=202)
+async def create_export_job(
+    query: AdminExportQuery,
+    manager: ExportJobManager = Depends(get_export_job_manager),
+):
+    """提交后台导出任务：立即返回，文件在后台分块写入 EXPORT_DIR。"""
+    ensure_export_supported(
+        scope=query.scope, format=query.format, compression=query.compression
     )
+    try:
+        job = await manager.submit(
+            scope=query.scope,
+            format=query.format,
+            compression=query.compression,
+            filters=query.model_dump(exclude={"scope", "format", "compression"}),
+        )
+    except ExportQueueFullError as exc:
+        raise APIError(
+            code="EXPORT_QUEUE_FULL",
+            message="Too many export jobs in progress",
+            status_code=429,
+        ) from exc
+    return to_export_job_response(job)
 
+
+@router.get("/exports/{job_id}", response_model=AdminExportJobResponse)
+async def get_export_job(
+    job_id: str,
+    manager: ExportJobManager = Depends(get_export_job_manager),
+):
+    return to_export_job_response(await _get_job(manager, job_id))
+
+
+@router.get("/exports/{job_id}/download")
+async def download_export_job(
+    job_id: str,
+    manager: ExportJobManager = Depends(get_export_job_manager),
+):
+    """下载已完成的导出文件（支持 HTTP Range 断点续传）。"""
+    job = await _get_job(manager, job_id)
+    if job.status != "succeeded" or job.path is None:
+        raise APIError(
+            code="EXPORT_JOB_NOT_READY",
+            message=f"Export job is {job.status}",
+            status_code=409,
+        )
+    return FileResponse(job.path, media_type=job.media_type, filename=job.filename)
+
+
+@router.delete("/exports/{job_id}", status_code=204)
+async def delete_export_job(
+    job_id: str,
+    manager: ExportJobManager = Depends(get_export_job_manager),
+):
+    """取消（如仍在执行）并删除导出任务与文件。"""
+    await _get_job(manager, job_id)
+    await manager.delete(job_id)
+    return Response(status_code=204)
@@ -4,13 +4,27 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends
 
-from interview_system.api.deps import get_database
+from interview_system.api.deps import get_database, get_executors
 from interview_system.infrastructure.database.connection import AsyncDatabase
+from interview_system.infrastructure.executors import BlockingExecutors
 
 router = APIRouter(tags=["health"])
 
 
 @router.get("/health")
-async def health_check(db: AsyncDatabase = Depends(get_database)):
+async def health_check(
+    db: AsyncDatabase = Depends(get_database),
+    executors: BlockingExecutors = Depends(get_executors),
+):
     await db.health_check()
-    return {"status": "healthy", "database": "connected"}
+    payload: dict[str, object] = {
+        "status": "healthy",
+        "database": "connected",
+        "read_engine": db.read_engine_mode,
+        # 各线程池的线程数上限、执行中/排队中任务数与累计完成数
+        "executors": executors.stats(),
+    }
+    sqlite = await db.sqlite_settings()
+    if sqlite is not None:
+        payload["sqlite"] = sqlite
+    return payload
@@ -2,48 +2,171 @@
 
 from __future__ import annotations
 
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 
-from interview_system.api.deps import get_interview_service
-from interview_system.api.mappers import to_message_response, to_message_responses
-from interview_system.api.schemas.message import MessageCreate, MessageResponse
+from interview_system.api.deps import get_fast_json, get_interview_service
+from interview_system.api.mappers import message_payload, message_payloads
+from interview_system.api.responses import json_response
+from interview_system.api.schemas.message import (
+    MessageCreate,
+    MessageResponse,
+    MessageSyncResponse,
+)
+from interview_system.application.dto.interview_dto import InterviewResultDTO
+from interview_system.application.dto.message_dto import MessageCursor
+from interview_system.application.exceptions import InvalidCursorError
 from interview_system.application.services.interview_service import InterviewService
 
 router = APIRouter(prefix="/session/{session_id}", tags=["interview"])
 
+# 允许浏览器缓存，但每次使用前必须携带 If-None-Match 重新验证
+_CACHE_CONTROL = "private, no-cache"
 
-@router.get("/messages", response_model=list[MessageResponse])
+
+# 客户端重试（网络超时后重发）时携带相同的键，服务端返回首次处理结果
+_IDEMPOTENCY_KEY = Header(
+    default=None,
+    alias="Idempotency-Key",
+    min_length=1,
+    max_length=255,
+    description="重试同一请求时保持不变的唯一键（如 UUID）",
+)
+
+
+def _etag(version: int) -> str:
+    return f'"v{version}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {tag.strip() for tag in header.split(",")}
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+def _set_validators(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+
+
+def _turn_response(
+    result: InterviewResultDTO, response: Response, *, fast_json: bool
+) -> Any:
+    if result.replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return json_response(
+        message_payload(
+            "assistant", result.assistant_message, msg_id=result.message_id
+        ),
+        fast=fast_json,
+        headers_from=response,
+    )
+
+
+def _not_modified_response(etag: str) -> Response:
+    response = Response(status_code=304)
+    _set_validators(response, etag)
+    return response
+
+
+@router.get(
+    "/messages",
+    response_model=list[MessageResponse],
+    responses={304: {"description": "会话版本未变化（If-None-Match 命中）"}},
+)
 async def get_messages(
-    session_id: UUID, service: InterviewService = Depends(get_interview_service)
+    session_id: UUID,
+    request: Request,
+    response: Response,
+    service: InterviewService = Depends(get_interview_service),
+    fast_json: bool = Depends(get_fast_json),
 ):
+    # 先取版本（会话缓存命中时无需访问数据库），未变化时直接 304
+    etag = _etag(await service.get_version(session_id))
+    if _not_modified(request, etag):
+        return _not_modified_response(etag)
     messages = await service.get_messages(session_id)
-    return to_message_responses(messages)
+    _set_validators(response, etag)
+    return json_response(
+        message_payloads(messages), fast=fast_json, headers_from=response
+    )
+
+
+@router.get(
+    "/messages/sync",
+    response_model=MessageSyncResponse,
+    responses={304: {"description": "会话版本未变化（If-None-Match 命中）"}},
+)
+async def sync_messages(
+    session_id: UUID,
+    request: Request,
+    response: Response,
+    since: str | None = Query(
+        None, description="上次同步返回的 cursor；为空时返回完整对话"
+    ),
+    service: InterviewService = Depends(get_interview_service),
+    fast_json: bool = Depends(get_fast_json),
+):
+    cursor: MessageCursor | None = None
+    if since:
+        try:
+            cursor = MessageCursor.decode(since)
+        except ValueError as exc:
+            raise InvalidCursorError(cursor=since) from exc
+
+    etag = _etag(await service.get_version(session_id))
+    if _not_modified(request, etag):
+        return _not_modified_response(etag)
+    result = await service.sync_messages(session_id, since=cursor)
+    _set_validators(response, _etag(result.cursor.version))
+    payload = {
+        "messages": message_payloads(result.messages),
+        "cursor": result.cursor.encode(),
+        "reset": result.reset,
+        "is_finished": result.is_finished,
+    }
+    return json_response(payload, fast=fast_json, headers_from=response)
 
 
 @router.post("/message", response_model=MessageResponse)
 async def send_message(
     session_id: UUID,
     data: MessageCreate,
+    response: Response,
+    idempotency_key: str | None = _IDEMPOTENCY_KEY,
     service: InterviewService = Depends(get_interview_service),
+    fast_json: bool = Depends(get_fast_json),
 ):
-    result = await service.process_answer(session_id=session_id, answer=data.text)
-    return to_message_response("assistant", result.assistant_message)
+    result = await service.process_answer(
+        session_id=session_id, answer=data.text, idempotency_key=idempotency_key
+    )
+    return _turn_response(result, response, fast_json=fast_json)
 
 
 @router.post("/undo", response_model=list[MessageResponse])
 async def undo_last(
-    session_id: UUID, service: InterviewService = Depends(get_interview_service)
+    session_id: UUID,
+    service: InterviewService = Depends(get_interview_service),
+    fast_json: bool = Depends(get_fast_json),
 ):
     await service.undo_last(session_id=session_id)
     messages = await service.get_messages(session_id)
-    return to_message_responses(messages)
+    return json_response(message_payloads(messages), fast=fast_json)
 
 
 @router.post("/skip", response_model=MessageResponse)
 async def skip_question(
-    session_id: UUID, service: InterviewService = Depends(get_interview_service)
+    session_id: UUID,
+    response: Response,
+    idempotency_key: str | None = _IDEMPOTENCY_KEY,
+    service: InterviewService = Depends(get_interview_service),
+    fast_json: bool = Depends(get_fast_json),
 ):
-    result = await service.skip_question(session_id=session_id)
-    return to_message_response("assistant", result.assistant_message)
+    result = await service.skip_question(
+        session_id=session_id, idempotency_key=idempotency_key
+    )
+    return _turn_response(result, response, fast_json=fast_json)
@@ -7,8 +7,13 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends
 
-from interview_system.api.deps import get_interview_service, get_session_service
-from interview_system.api.mappers import to_message_responses, to_session_response
+from interview_system.api.deps import (
+    get_fast_json,
+    get_interview_service,
+    get_session_service,
+)
+from interview_system.api.mappers import message_payloads, session_payload
+from interview_system.api.responses import json_response
 from interview_system.api.schemas.session import (
     SessionCreate,
     SessionResponse,
@@ -24,23 +29,29 @@ router = APIRouter(prefix="/session", tags=["session"])
 
 @router.post("/start", response_model=StartSessionResponse)
 async def start_session(
-    data: SessionCreate, service: InterviewService = Depends(get_interview_service)
+    data: SessionCreate,
+    service: InterviewService = Depends(get_interview_service),
+    fast_json: bool = Depends(get_fast_json),
 ):
     session = await service.start_session(user_name=data.user_name, topics=data.topics)
     messages = await service.get_messages(session.id)
-    return StartSessionResponse(
-        session=to_session_response(session), messages=to_message_responses(messages)
-    )
+    payload = {
+        "session": session_payload(session),
+        "messages": message_payloads(messages),
+    }
+    return json_response(payload, fast=fast_json)
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
 async def get_session(
-    session_id: UUID, service: SessionService = Depends(get_session_service)
+    session_id: UUID,
+    service: SessionService = Depends(get_session_service),
+    fast_json: bool = Depends(get_fast_json),
 ):
     session = await service.get(session_id)
     if session is None:
         raise SessionNotFoundError(session_id)
-    return to_session_response(session)
+    return json_response(session_payload(session), fast=fast_json)
 
 
 @router.post("/{session_id}/restart", response_model=SessionResponse)
@@ -48,7 +59,7 @@ async def restart_session(
     session_id: UUID, service: InterviewService = Depends(get_interview_service)
 ):
     session = await service.restart(session_id=session_id)
-    return to_session_response(session)
+    return session_payload(session)
 
 
 @router.get("/{session_id}/stats", response_model=SessionStats)
@@ -0,0 +1,125 @@
+"""WebSocket 访谈通道：一个长连接承载回答/跳过/撤销/重新开始指令。"""
+
+from __future__ import annotations
+
+import json
+import logging
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+
+from interview_system.api.deps import get_interview_service, get_session_service
+from interview_system.api.exceptions import APIError, error_payload, to_api_error
+from interview_system.api.mappers import to_message_response, to_session_response
+from interview_system.api.schemas.ws import WsCommand, WsEvent
+from interview_system.application.services.interview_service import InterviewService
+from interview_system.application.services.session_service import SessionService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["ws"])
+
+# 会话不存在时的关闭码（4000-4999 为应用自定义区间）
+_CLOSE_SESSION_NOT_FOUND = 4404
+
+
+async def _send(websocket: WebSocket, event: WsEvent) -> None:
+    await websocket.send_text(event.model_dump_json(exclude_none=True))
+
+
+async def _handle(
+    command: WsCommand,
+    *,
+    session_id: UUID,
+    interview: InterviewService,
+    sessions: SessionService,
+) -> WsEvent:
+    if command.type == "ping":
+        return WsEvent(type="pong", id=command.id)
+
+    if command.type in ("answer", "skip"):
+        if command.type == "answer":
+            result = await interview.process_answer(
+                session_id=session_id, answer=command.text or ""
+            )
+        else:
+            result = await interview.skip_question(session_id=session_id)
+        return WsEvent(
+            type="message",
+            id=command.id,
+            message=to_message_response(
+                "assistant", result.assistant_message, msg_id=result.message_id
+            ),
+            finished=result.is_finished,
+        )
+
+    if command.type == "undo":
+        result = await interview.undo_last(session_id=session_id)
+        session = await sessions.get(session_id)
+        return WsEvent(
+            type="undo",
+            id=command.id,
+            message=to_message_response(
+                "assistant", result.assistant_message, msg_id=result.message_id
+            ),
+            truncate_from=result.truncate_from,
+            session=to_session_response(session) if session is not None else None,
+        )
+
+    session = await interview.restart(session_id=session_id)
+    messages = await interview.get_messages(session_id)
+    first = messages[-1] if messages else {"content": ""}
+    return WsEvent(
+        type="restart",
+        id=command.id,
+        session=to_session_response(session),
+        message=to_message_response(
+            "assistant", str(first["content"]), msg_id=first.get("id")
+        ),
+    )
+
+
+@router.websocket("/ws/session/{session_id}")
+async def interview_channel(
+    websocket: WebSocket,
+    session_id: UUID,
+    interview: InterviewService = Depends(get_interview_service),
+    sessions: SessionService = Depends(get_session_service),
+):
+    await websocket.accept()
+    session = await sessions.get(session_id)
+    if session is None:
+        await websocket.close(code=_CLOSE_SESSION_NOT_FOUND, reason="SESSION_NOT_FOUND")
+        return
+    await _send(websocket, WsEvent(type="ready", session=to_session_response(session)))
+
+    # 同一连接内的指令按到达顺序串行处理
+    while True:
+        try:
+            raw = await websocket.receive_text()
+        except WebSocketDisconnect:
+            return
+
+        try:
+            command = WsCommand.model_validate(json.loads(raw))
+        except (ValueError, ValidationError) as exc:
+            error = APIError(code="INVALID_COMMAND", message=str(exc).splitlines()[0])
+            await _send(websocket, WsEvent(type="error", **error_payload(error)))
+            continue
+
+        if command.type != "ping":
+            await _send(websocket, WsEvent(type="ack", id=command.id))
+        try:
+            event = await _handle(
+                command, session_id=session_id, interview=interview, sessions=sessions
+            )
+        except Exception as exc:
+            api_error = to_api_error(exc)
+            if api_error is None:
+                logger.exception("WebSocket 指令处理失败: %s", command.type)
+                api_error = APIError(
+                    code="INTERNAL_ERROR", message="Internal error", status_code=500
+                )
+            event = WsEvent(type="error", id=command.id, **error_payload(api_error))
+        await _send(websocket, event)
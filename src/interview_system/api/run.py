@@ -1,23 +1,103 @@
 #!/usr/bin/env python3
 """
 FastAPI server launcher
-Usage: python -m interview_system.api.run
+Usage:
+    python -m interview_system.api.run            # 开发模式：单进程 + --reload
+    python -m interview_system.api.run --prod     # 生产模式：多 worker、uvloop/httptools、优雅停止
 """
 
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import os
+from typing import Any
+
 import uvicorn
 
 from interview_system.common.constants import DEFAULT_API_PORT
+from interview_system.config.settings import Settings
+from interview_system.infrastructure.database.connection import AsyncDatabase
+
+APP = "interview_system.api.main:app"
+
+
+def default_workers() -> int:
+    # 接口以 I/O 为主（阻塞任务已在专用线程池/进程池中执行），每个核一个 worker
+    return max(1, os.cpu_count() or 1)
+
+
+def server_options(
+    settings: Settings,
+    *,
+    production: bool,
+    host: str = "0.0.0.0",
+    port: int = DEFAULT_API_PORT,
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """构造 uvicorn.run 参数。"""
+    options: dict[str, Any] = {
+        "host": host,
+        "port": port,
+        "log_level": settings.log_level.lower(),
+    }
+    if not production:
+        return {**options, "reload": True}
 
+    return {
+        **options,
+        "reload": False,
+        "workers": workers or settings.server_workers or default_workers(),
+        # 未安装时回退到 uvicorn 自动选择（asyncio / h11）
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "auto",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "auto",
+        "timeout_keep_alive": settings.server_keep_alive_seconds,
+        "backlog": settings.server_backlog,
+        # 收到 SIGTERM 后停止接收新连接，等待进行中的请求完成
+        "timeout_graceful_shutdown": settings.server_graceful_shutdown_seconds,
+        "access_log": False,
+    }
 
-def main():
+
+async def migrate(database_url: str) -> None:
+    """在启动 worker 前执行一次建表/迁移，避免多个 worker 同时迁移同一数据库。"""
+    db = AsyncDatabase(database_url)
+    try:
+        await db.init()
+    finally:
+        await db.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
     """Start FastAPI server"""
-    uvicorn.run(
-        "interview_system.api.main:app",
-        host="0.0.0.0",
-        port=DEFAULT_API_PORT,
-        reload=True,
-        log_level="info",
+    parser = argparse.ArgumentParser(description="Interview System API server")
+    parser.add_argument(
+        "--prod", action="store_true", help="生产模式（多 worker，关闭 --reload）"
+    )
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=DEFAULT_API_PORT)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker 进程数（默认 SERVER_WORKERS 或 CPU 核数）",
+    )
+    args = parser.parse_args(argv)
+
+    settings = Settings()
+    options = server_options(
+        settings,
+        production=args.prod,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
     )
+    if args.prod:
+        asyncio.run(migrate(settings.database_url))
+    # worker 进程据此判断是否停用进程内会话缓存等单进程状态（--reload 为单个 worker）
+    os.environ["SERVER_WORKERS"] = str(options.get("workers", 1))
+    uvicorn.run(APP, **options)
 
 
 if __name__ == "__main__":
@@ -43,22 +43,26 @@ class AdminOverviewResponse(BaseModel):
 
 
 class AdminListResponse(BaseModel):
-    total: int = Field(..., ge=0)
+    # count=none 时为 None
+    total: int | None = Field(default=None, ge=0)
     items: list[dict]
+    next_cursor: str | None = None
 
 
 class AdminSearchResponse(BaseModel):
-    total: int = Field(..., ge=0)
+    # count=none 时为 None
+    total: int | None = Field(default=None, ge=0)
     items: list[dict]
+    next_cursor: str | None = None
 
 
 class AdminExportFormat(BaseModel):
-    format: Literal["csv", "json", "xlsx"]
+    format: Literal["csv", "json", "ndjson", "xlsx", "parquet", "arrow"]
 
 
 class AdminExportQuery(BaseModel):
-    scope: Literal["sessions", "conversations"] = "conversations"
-    format: Literal["csv", "json", "xlsx"] = "csv"
+    scope: Literal["sessions", "conversations", "all"] = "conversations"
+    format: Literal["csv", "json", "ndjson", "xlsx", "parquet", "arrow"] = "csv"
     start: datetime | None = None
     end: datetime | None = None
     user_name: str | None = None
@@ -66,6 +70,24 @@ class AdminExportQuery(BaseModel):
     keyword: str | None = None
     min_depth: int | None = Field(default=None, ge=0)
     max_depth: int | None = Field(default=None, ge=0)
-    limit: int = Field(default=5000, ge=1, le=20000)
+    limit: int | None = Field(default=None, ge=1)
     offset: int = Field(default=0, ge=0)
-
+    compression: Literal["none", "gzip", "zstd"] = "none"
+
+
+class AdminExportJobResponse(BaseModel):
+    job_id: str
+    status: Literal["queued", "running", "succeeded", "failed", "cancelled"]
+    scope: Literal["sessions", "conversations", "all"]
+    format: Literal["csv", "json", "ndjson", "xlsx", "parquet", "arrow"]
+    compression: Literal["none", "gzip", "zstd"] = "none"
+    filename: str
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    rows_written: int = 0
+    total_rows: int | None = None
+    progress: float | None = None
+    size_bytes: int | None = None
+    error: str | None = None
+    download_url: str | None = None
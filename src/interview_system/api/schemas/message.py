@@ -26,3 +26,15 @@ class MessageResponse(BaseModel):
     role: Literal["user", "assistant", "system"]
     content: str = Field(..., description="消息内容")
     timestamp: int = Field(..., description="毫秒时间戳")
+
+
+class MessageSyncResponse(BaseModel):
+    messages: list[MessageResponse] = Field(
+        ..., description="游标之后的新消息（末尾为当前待回答问题，id 固定为 pending）"
+    )
+    cursor: str = Field(..., description="下次同步时作为 since 参数传回")
+    reset: bool = Field(
+        False,
+        description="为 true 时 messages 为完整对话（有记录被撤销/重开），客户端应整体替换",
+    )
+    is_finished: bool = Field(False, description="访谈是否已结束")
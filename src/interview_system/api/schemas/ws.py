@@ -0,0 +1,45 @@
+"""WebSocket 访谈通道 Schema。"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+from interview_system.api.schemas.message import MessageResponse
+from interview_system.api.schemas.session import SessionResponse
+
+
+class WsCommand(BaseModel):
+    """客户端指令；id 为可选的客户端请求标识，在对应的服务端事件中原样回传。"""
+
+    type: Literal["answer", "skip", "undo", "restart", "ping"]
+    id: str | None = Field(default=None, max_length=64)
+    text: str | None = None
+
+    @model_validator(mode="after")
+    def _require_answer_text(self) -> WsCommand:
+        if self.type == "answer" and not (self.text or "").strip():
+            raise ValueError("answer 指令需要非空 text")
+        return self
+
+
+class WsEvent(BaseModel):
+    """服务端事件（只携带本轮增量，不回传完整对话记录）。
+
+    - ready：连接建立，附带会话状态
+    - ack：指令已受理（LLM 追问生成期间可据此展示“思考中”）
+    - message：新的助手消息（回答/跳过后的下一题或追问）
+    - undo：撤销完成；客户端删除 id 等于 truncate_from 的消息及其之后的消息，再追加 message
+    - restart：重新开始；客户端清空记录后显示 message
+    - pong / error
+    """
+
+    type: Literal["ready", "ack", "message", "undo", "restart", "pong", "error"]
+    id: str | None = None
+    session: SessionResponse | None = None
+    message: MessageResponse | None = None
+    # undo 事件：客户端需删除的第一条消息 id（与 /messages 中的 id 一致）
+    truncate_from: str | None = None
+    finished: bool | None = None
+    error: dict | None = None
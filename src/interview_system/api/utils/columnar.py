@@ -0,0 +1,157 @@
+"""列式导出（Parquet / Arrow IPC），依赖可选的 pyarrow（``pip install interview-system[export]``）。
+
+说明：
+- 每个数据块写为一个 record batch，内存占用与总行数无关
+- 列带类型：时间为 UTC 毫秒时间戳，深度为整数，AI 标记为布尔
+- 会话开始时间、对话时间直接取库中的毫秒列（保留毫秒精度，不解析文本）
+- 默认 zstd 压缩
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import IO, Any, Literal
+
+ColumnarFormat = Literal["parquet", "arrow"]
+
+MEDIA_TYPES: dict[str, str] = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+
+_TIMESTAMP = "timestamp"
+
+# 时间列 -> 行对象中的精确毫秒字段
+_EPOCH_MS_FIELDS = {"start_time": "start_time_ms", "timestamp": "timestamp_ms"}
+
+# 列名 -> 类型名（在导入 pyarrow 后映射为具体类型）
+_COLUMNS: dict[str, list[tuple[str, str]]] = {
+    "sessions": [
+        ("session_id", "string"),
+        ("user_name", "string"),
+        ("start_time", _TIMESTAMP),
+        ("end_time", _TIMESTAMP),
+        ("is_finished", "bool"),
+        ("current_question_idx", "int32"),
+        ("selected_topics_json", "string"),
+        ("created_at", _TIMESTAMP),
+        ("updated_at", _TIMESTAMP),
+        ("is_followup", "bool"),
+        ("current_followup_is_ai", "bool"),
+        ("current_followup_count", "int32"),
+        ("current_followup_question", "string"),
+        ("selected_topics", "list<string>"),
+    ],
+    "conversations": [
+        ("id", "int64"),
+        ("session_id", "string"),
+        ("user_name", "string"),
+        ("timestamp", _TIMESTAMP),
+        ("topic", "string"),
+        ("question_type", "string"),
+        ("question", "string"),
+        ("answer", "string"),
+        ("depth_score", "int8"),
+        ("is_ai_generated", "bool"),
+    ],
+}
+
+
+def _parse_epoch_ms(value: Any) -> int | None:
+    """库内文本时间（``%Y-%m-%d %H:%M:%S`` 或 ISO，无时区按 UTC）-> UTC 毫秒。"""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return int(dt.timestamp() * 1000)
+
+
+def _epoch_ms(row: Any, name: str) -> int | None:
+    exact = _EPOCH_MS_FIELDS.get(name)
+    ms = getattr(row, exact) if exact is not None else None
+    # 缺少毫秒值（未回填的旧数据）时回退解析文本
+    return ms if ms is not None else _parse_epoch_ms(getattr(row, name))
+
+
+def _topic_list(raw: str | None) -> list[str] | None:
+    try:
+        value = json.loads(raw) if raw else None
+    except ValueError:
+        return None
+    if not isinstance(value, list):
+        return None
+    return [str(v) for v in value]
+
+
+class ColumnarWriter:
+    """按块写入 Parquet / Arrow IPC 文件（非线程安全，同一时刻只应在一个线程中调用）。"""
+
+    def __init__(
+        self,
+        fileobj: IO[bytes],
+        *,
+        scope: Literal["sessions", "conversations"],
+        format: ColumnarFormat,
+        compression: str = "zstd",
+    ) -> None:
+        # 未安装时抛出 ImportError，由调用方转换为业务错误
+        import pyarrow as pa
+
+        self._pa = pa
+        types = {
+            "string": pa.string(),
+            "bool": pa.bool_(),
+            "int8": pa.int8(),
+            "int32": pa.int32(),
+            "int64": pa.int64(),
+            "list<string>": pa.list_(pa.string()),
+            _TIMESTAMP: pa.timestamp("ms", tz="UTC"),
+        }
+        columns = _COLUMNS[scope]
+        self._schema = pa.schema([(name, types[kind]) for name, kind in columns])
+        self._timestamps = [name for name, kind in columns if kind == _TIMESTAMP]
+        self._rows = 0
+
+        if format == "parquet":
+            import pyarrow.parquet as pq
+
+            self._writer: Any = pq.ParquetWriter(
+                fileobj, self._schema, compression=compression
+            )
+        else:
+            self._writer = pa.ipc.new_file(
+                fileobj,
+                self._schema,
+                options=pa.ipc.IpcWriteOptions(compression=compression),
+            )
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    def write_rows(self, rows: Sequence[Any]) -> None:
+        """将一块仓储行（``AdminService.iter_export_rows`` 的产出）写为一个 record batch。"""
+        if not rows:
+            return
+        columns: dict[str, list[Any]] = {}
+        for name in self._timestamps:
+            columns[name] = [_epoch_ms(row, name) for row in rows]
+        for name in self._schema.names:
+            if name == "selected_topics":
+                columns[name] = [_topic_list(row.selected_topics_json) for row in rows]
+            elif name not in columns:
+                columns[name] = [getattr(row, name) for row in rows]
+
+        batch = self._pa.RecordBatch.from_pydict(columns, schema=self._schema)
+        self._writer.write_batch(batch)
+        self._rows += len(rows)
+
+    def close(self) -> None:
+        """写入文件尾（Parquet footer / Arrow IPC footer），不关闭底层文件对象。"""
+        self._writer.close()
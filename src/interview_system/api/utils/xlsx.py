@@ -1,15 +1,48 @@
 """最小 XLSX 生成器（不依赖第三方库）。
 
 说明：
-- 仅支持单表 sheet1
-- 所有单元格写入为 inline string（Excel 可直接打开）
+- 逐行写入 zip 条目（worksheet XML 不在内存中整体拼接），支持多个 sheet
+- 较短的文本（主题、问题等重复值）经 sharedStrings 去重；长文本写为 inline string
+- 数值/布尔写为对应类型的单元格，None 留空
+- 单个 sheet 超过 Excel 行数上限时自动续写到新 sheet（重复表头）
 """
 
 from __future__ import annotations
 
 import io
+import math
+import re
 import zipfile
+from collections.abc import Iterable
 from html import escape
+from typing import IO, Any
+
+MAX_SHEET_ROWS = 1_048_576
+SHARED_STRING_MAX_LENGTH = 255
+
+# XML 1.0 不允许的控制字符
+_ILLEGAL_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+_INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CT_PREFIX = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+
+_STYLES = f"""{_XML_HEADER}<styleSheet xmlns="{_MAIN_NS}">
+  <fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>
+  <fills count="1"><fill><patternFill patternType="none"/></fill></fills>
+  <borders count="1"><border/></borders>
+  <cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>
+  <cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>
+</styleSheet>
+"""
+
+_ROOT_RELS = f"""{_XML_HEADER}<Relationships xmlns="{_PKG_REL_NS}">
+  <Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>
+</Relationships>
+"""
 
 
 def _col_letters(idx: int) -> str:
@@ -22,78 +55,170 @@ def _col_letters(idx: int) -> str:
     return out
 
 
-def _sheet_xml(rows: list[list[str]]) -> str:
-    parts: list[str] = [
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>',
-        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">',
-        "<sheetData>",
-    ]
-    for r_idx, row in enumerate(rows, start=1):
-        parts.append(f'<row r="{r_idx}">')
-        for c_idx, value in enumerate(row, start=1):
-            addr = f"{_col_letters(c_idx)}{r_idx}"
-            text = escape("" if value is None else str(value))
-            parts.append(f'<c r="{addr}" t="inlineStr"><is><t>{text}</t></is></c>')
+def _xml_text(value: str) -> str:
+    return escape(_ILLEGAL_XML_CHARS.sub("", value), quote=False)
+
+
+def _sheet_title(name: str, taken: set[str]) -> str:
+    base = _INVALID_SHEET_CHARS.sub("_", name).strip() or "sheet"
+    title = base[:31]
+    n = 2
+    while title.lower() in taken:
+        suffix = f"_{n}"
+        title = base[: 31 - len(suffix)] + suffix
+        n += 1
+    return title
+
+
+class XlsxWriter:
+    """增量 XLSX 写入器（非线程安全，同一时刻只应在一个线程中调用）。"""
+
+    def __init__(
+        self, fileobj: IO[bytes], *, shared_max_length: int = SHARED_STRING_MAX_LENGTH
+    ) -> None:
+        self._zip = zipfile.ZipFile(fileobj, mode="w", compression=zipfile.ZIP_DEFLATED)
+        self._shared_max_length = shared_max_length
+        self._strings: dict[str, int] = {}
+        self._string_refs = 0
+        self._titles: list[str] = []
+        self._columns: list[str] = []
+        self._sheet: IO[bytes] | None = None
+        self._sheet_name = ""
+        self._header: list[Any] | None = None
+        self._row = 0
+
+    def add_sheet(self, name: str) -> None:
+        """结束当前 sheet 并开始新 sheet，之后的行写入新 sheet。"""
+        self._close_sheet()
+        title = _sheet_title(name, {t.lower() for t in self._titles})
+        self._titles.append(title)
+        self._sheet_name = name
+        self._header = None
+        self._row = 0
+        self._sheet = self._zip.open(
+            f"xl/worksheets/sheet{len(self._titles)}.xml", mode="w"
+        )
+        self._sheet.write(
+            f'{_XML_HEADER}<worksheet xmlns="{_MAIN_NS}"><sheetData>'.encode()
+        )
+
+    def write_row(self, values: Iterable[Any]) -> None:
+        row = list(values)
+        if self._sheet is None:
+            self.add_sheet("sheet1")
+        if self._row >= MAX_SHEET_ROWS:
+            header = self._header
+            self.add_sheet(self._sheet_name)
+            if header is not None:
+                self.write_row(header)
+        if self._header is None:
+            self._header = row
+
+        self._row += 1
+        while len(self._columns) < len(row):
+            self._columns.append(_col_letters(len(self._columns) + 1))
+        parts = [f'<row r="{self._row}">']
+        for col, value in zip(self._columns, row):
+            cell = self._cell(value)
+            if cell:
+                parts.append(f'<c r="{col}{self._row}"{cell}</c>')
         parts.append("</row>")
-    parts.append("</sheetData></worksheet>")
-    return "".join(parts)
+        assert self._sheet is not None
+        self._sheet.write("".join(parts).encode("utf-8"))
+
+    def write_rows(self, rows: Iterable[Iterable[Any]]) -> None:
+        for row in rows:
+            self.write_row(row)
+
+    def _cell(self, value: Any) -> str:
+        """返回单元格属性与内容（不含开头的 ``<c r=..`` 与结尾的 ``</c>``）。"""
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return f' t="b"><v>{int(value)}</v>'
+        if isinstance(value, int) or (
+            isinstance(value, float) and math.isfinite(value)
+        ):
+            return f"><v>{value}</v>"
+        text = str(value)
+        if len(text) <= self._shared_max_length:
+            idx = self._strings.setdefault(text, len(self._strings))
+            self._string_refs += 1
+            return f' t="s"><v>{idx}</v>'
+        return f' t="inlineStr"><is><t xml:space="preserve">{_xml_text(text)}</t></is>'
+
+    def _close_sheet(self) -> None:
+        if self._sheet is not None:
+            self._sheet.write(b"</sheetData></worksheet>")
+            self._sheet.close()
+            self._sheet = None
+
+    def close(self) -> None:
+        """写入 sharedStrings、workbook 等元数据并关闭 zip。"""
+        if not self._titles:
+            self.add_sheet("sheet1")
+        self._close_sheet()
+
+        with self._zip.open("xl/sharedStrings.xml", mode="w") as f:
+            f.write(
+                f'{_XML_HEADER}<sst xmlns="{_MAIN_NS}" count="{self._string_refs}" '
+                f'uniqueCount="{len(self._strings)}">'.encode()
+            )
+            for text in self._strings:
+                f.write(
+                    f'<si><t xml:space="preserve">{_xml_text(text)}</t></si>'.encode()
+                )
+            f.write(b"</sst>")
+        self._strings.clear()
+
+        sheet_ids = range(1, len(self._titles) + 1)
+        sheets = "".join(
+            f'<sheet name="{escape(title)}" sheetId="{i}" r:id="rId{i}"/>'
+            for i, title in zip(sheet_ids, self._titles)
+        )
+        self._zip.writestr(
+            "xl/workbook.xml",
+            f'{_XML_HEADER}<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+            f"<sheets>{sheets}</sheets></workbook>",
+        )
+        n = len(self._titles)
+        rels = "".join(
+            f'<Relationship Id="rId{i}" Type="{_REL_NS}/worksheet" '
+            f'Target="worksheets/sheet{i}.xml"/>'
+            for i in sheet_ids
+        )
+        self._zip.writestr(
+            "xl/_rels/workbook.xml.rels",
+            f'{_XML_HEADER}<Relationships xmlns="{_PKG_REL_NS}">{rels}'
+            f'<Relationship Id="rId{n + 1}" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+            f'<Relationship Id="rId{n + 2}" Type="{_REL_NS}/sharedStrings" '
+            f'Target="sharedStrings.xml"/></Relationships>',
+        )
+        overrides = "".join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+            f'ContentType="{_CT_PREFIX}.worksheet+xml"/>'
+            for i in sheet_ids
+        )
+        self._zip.writestr(
+            "[Content_Types].xml",
+            f'{_XML_HEADER}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            f'<Override PartName="/xl/workbook.xml" ContentType="{_CT_PREFIX}.sheet.main+xml"/>'
+            f"{overrides}"
+            f'<Override PartName="/xl/styles.xml" ContentType="{_CT_PREFIX}.styles+xml"/>'
+            f'<Override PartName="/xl/sharedStrings.xml" ContentType="{_CT_PREFIX}.sharedStrings+xml"/>'
+            "</Types>",
+        )
+        self._zip.writestr("_rels/.rels", _ROOT_RELS)
+        self._zip.writestr("xl/styles.xml", _STYLES)
+        self._zip.close()
 
 
 def build_xlsx(*, rows: list[list[str]], sheet_name: str = "export") -> bytes:
-    # sheet_name 暂不用于 workbook.xml（使用固定 sheet1），保留参数以便未来扩展
-    _ = sheet_name
-
-    content_types = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
-  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
-  <Default Extension="xml" ContentType="application/xml"/>
-  <Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
-  <Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>
-  <Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>
-</Types>
-"""
-
-    rels = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
-  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
-</Relationships>
-"""
-
-    workbook = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"
-          xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
-  <sheets>
-    <sheet name="sheet1" sheetId="1" r:id="rId1"/>
-  </sheets>
-</workbook>
-"""
-
-    workbook_rels = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
-  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>
-  <Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
-</Relationships>
-"""
-
-    styles = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
-  <fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>
-  <fills count="1"><fill><patternFill patternType="none"/></fill></fills>
-  <borders count="1"><border/></borders>
-  <cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>
-  <cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>
-</styleSheet>
-"""
-
-    sheet1 = _sheet_xml(rows)
-
     buf = io.BytesIO()
-    with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as z:
-        z.writestr("[Content_Types].xml", content_types)
-        z.writestr("_rels/.rels", rels)
-        z.writestr("xl/workbook.xml", workbook)
-        z.writestr("xl/_rels/workbook.xml.rels", workbook_rels)
-        z.writestr("xl/styles.xml", styles)
-        z.writestr("xl/worksheets/sheet1.xml", sheet1)
+    writer = XlsxWriter(buf)
+    writer.add_sheet(sheet_name)
+    writer.write_rows(rows)
+    writer.close()
     return buf.getvalue()
-
@@ -3,7 +3,17 @@
 from __future__ import annotations
 
 from interview_system.application.dto.interview_dto import InterviewResultDTO
-from interview_system.application.dto.message_dto import MessageDTO
+from interview_system.application.dto.message_dto import (
+    MessageCursor,
+    MessageDTO,
+    MessageSyncDTO,
+)
 from interview_system.application.dto.session_dto import SessionDTO
 
-__all__ = ["InterviewResultDTO", "MessageDTO", "SessionDTO"]
+__all__ = [
+    "InterviewResultDTO",
+    "MessageCursor",
+    "MessageDTO",
+    "MessageSyncDTO",
+    "SessionDTO",
+]
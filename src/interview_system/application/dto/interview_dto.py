@@ -4,8 +4,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from interview_system.application.dto.message_dto import PENDING_MESSAGE_ID
+
 
 @dataclass(frozen=True, slots=True)
 class InterviewResultDTO:
     assistant_message: str
     is_finished: bool = False
+    # 助手消息的 id，与 /messages 中同一条消息一致（下一题/追问即待回答问题）
+    message_id: str = PENDING_MESSAGE_ID
+    # 撤销时被删除的第一条消息 id（该消息及其之后的消息均已删除）
+    truncate_from: str | None = None
+    # 由幂等键命中的已保存结果（未重新处理）
+    replayed: bool = False
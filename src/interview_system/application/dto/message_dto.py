@@ -3,6 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
+
+# 当前待回答问题的消息 id（回答后该问题以 log{id}-q 出现在对话记录中）
+PENDING_MESSAGE_ID = "pending"
+# 访谈结束语的消息 id（结束语不写入对话记录）
+FINISHED_MESSAGE_ID = "finished"
+
+
+def entry_message_ids(entry_id: int) -> tuple[str, str]:
+    """对话记录 id -> (问题, 回答) 的消息 id，重复读取时保持不变。"""
+    return f"log{entry_id}-q", f"log{entry_id}-a"
 
 
 @dataclass(frozen=True, slots=True)
@@ -11,3 +22,37 @@ class MessageDTO:
     role: str
     content: str
     timestamp: int
+
+
+@dataclass(frozen=True, slots=True)
+class MessageCursor:
+    """增量同步游标：客户端已同步到的会话版本与最后一条对话记录 id。"""
+
+    version: int
+    last_id: int = 0
+
+    def encode(self) -> str:
+        return f"{self.version}.{self.last_id}"
+
+    @classmethod
+    def decode(cls, raw: str) -> MessageCursor:
+        """解析游标，格式不合法时抛出 ValueError。"""
+        version, _, last_id = raw.partition(".")
+        cursor = cls(version=int(version), last_id=int(last_id))
+        if cursor.version < 0 or cursor.last_id < 0:
+            raise ValueError(raw)
+        return cursor
+
+
+@dataclass(frozen=True, slots=True)
+class MessageSyncDTO:
+    """消息增量同步结果。
+
+    - reset=False：messages 为游标之后新增的消息（末尾附带当前待回答问题，客户端替换旧的待回答问题）
+    - reset=True：游标之后有记录被撤销/重开删除，messages 为完整对话，客户端整体替换
+    """
+
+    messages: list[dict[str, Any]]
+    cursor: MessageCursor
+    reset: bool = False
+    is_finished: bool = False
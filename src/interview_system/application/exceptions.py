@@ -19,3 +19,14 @@ class SessionAlreadyCompletedError(Exception):
 @dataclass(frozen=True, slots=True)
 class NothingToUndoError(Exception):
     session_id: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class InvalidCursorError(Exception):
+    cursor: str
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyKeyReusedError(Exception):
+    session_id: UUID
+    idempotency_key: str
@@ -2,17 +2,40 @@
 
 from __future__ import annotations
 
-import csv
-import io
+import asyncio
 import json
-from dataclasses import asdict
-from datetime import datetime
-from typing import Any, Literal
+from collections.abc import AsyncIterator, Hashable
+from dataclasses import asdict, fields
+from datetime import UTC, datetime
+from typing import Any, Literal, Protocol, cast
 
+from interview_system.application.exceptions import InvalidCursorError
+from interview_system.application.services.export_encoding import (
+    ColumnChunk,
+    encode_csv,
+    encode_json,
+    encode_ndjson,
+    json_array_end,
+)
 from interview_system.domain.repositories.admin_repository import (
     AdminConversationRow,
+    AdminPage,
     AdminRepository,
     AdminSessionRow,
+    CountMode,
+)
+
+
+# 精确毫秒时间仅用于构造列式导出的时间列，不出现在接口与文本导出中
+_EPOCH_MS_FIELDS = frozenset({"start_time_ms", "timestamp_ms"})
+_SESSION_EXPORT_FIELDS = tuple(
+    f.name for f in fields(AdminSessionRow) if f.name not in _EPOCH_MS_FIELDS
+)
+# 高亮片段仅用于页面展示，不进入导出文件
+_CONVERSATION_EXPORT_FIELDS = tuple(
+    f.name
+    for f in fields(AdminConversationRow)
+    if f.name != "snippet" and f.name not in _EPOCH_MS_FIELDS
 )
 
 
@@ -25,9 +48,30 @@ def _safe_json_loads(raw: str | None) -> Any:
         return raw
 
 
+def _row_dict(row: Any) -> dict[str, Any]:
+    return {k: v for k, v in asdict(row).items() if k not in _EPOCH_MS_FIELDS}
+
+
+def _cache_time_key(dt: datetime | None) -> str | None:
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.astimezone(UTC).isoformat()
+
+
+class ResultCache(Protocol):
+    def get(self, key: Hashable) -> Any | None: ...
+
+    def set(self, key: Hashable, value: Any) -> None: ...
+
+
 class AdminService:
-    def __init__(self, repository: AdminRepository) -> None:
+    def __init__(
+        self, repository: AdminRepository, *, cache: ResultCache | None = None
+    ) -> None:
         self._repo = repository
+        self._cache = cache
 
     async def overview(
         self,
@@ -37,9 +81,25 @@ class AdminService:
         bucket: Literal["day", "hour"] = "day",
         top_n: int = 10,
     ) -> dict[str, Any]:
-        ts = await self._repo.get_time_series(start=start, end=end, bucket=bucket)
-        users = await self._repo.get_user_activity(start=start, end=end, limit=top_n)
-        topics = await self._repo.get_top_topics(start=start, end=end, limit=top_n)
+        # 键中包含写入版本号：有新写入即失效，无写入时多个管理员轮询共享同一结果
+        key = (
+            "overview",
+            _cache_time_key(start),
+            _cache_time_key(end),
+            bucket,
+            int(top_n),
+            await self._repo.data_version(),
+        )
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        ts, users, topics = await asyncio.gather(
+            self._repo.get_time_series(start=start, end=end, bucket=bucket),
+            self._repo.get_user_activity(start=start, end=end, limit=top_n),
+            self._repo.get_top_topics(start=start, end=end, limit=top_n),
+        )
 
         total_sessions = sum(p.sessions for p in ts)
         total_messages = sum(p.messages for p in ts)
@@ -56,7 +116,7 @@ class AdminService:
             else 0.0
         )
 
-        return {
+        result = {
             "summary": {
                 "total_sessions": total_sessions,
                 "total_messages": total_messages,
@@ -67,6 +127,9 @@ class AdminService:
             "top_users": [asdict(u) for u in users],
             "top_topics": [asdict(t) for t in topics],
         }
+        if self._cache is not None:
+            self._cache.set(key, result)
+        return result
 
     async def list_sessions(
         self,
@@ -77,24 +140,31 @@ class AdminService:
         is_finished: bool | None,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        count: CountMode = "exact",
     ) -> dict[str, Any]:
-        total, rows = await self._repo.list_sessions(
-            start=start,
-            end=end,
-            user_name=user_name,
-            is_finished=is_finished,
-            limit=limit,
-            offset=offset,
-        )
+        try:
+            page = await self._repo.list_sessions(
+                start=start,
+                end=end,
+                user_name=user_name,
+                is_finished=is_finished,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                count=count,
+            )
+        except ValueError as exc:
+            raise InvalidCursorError(cursor=cursor or "") from exc
         items: list[dict[str, Any]] = []
-        for r in rows:
+        for r in page.items:
             items.append(
                 {
-                    **asdict(r),
+                    **_row_dict(r),
                     "selected_topics": _safe_json_loads(r.selected_topics_json),
                 }
             )
-        return {"total": total, "items": items}
+        return {"total": page.total, "items": items, "next_cursor": page.next_cursor}
 
     async def search_conversations(
         self,
@@ -108,21 +178,162 @@ class AdminService:
         max_depth: int | None,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        count: CountMode = "exact",
     ) -> dict[str, Any]:
-        total, rows = await self._repo.search_conversations(
+        try:
+            page = await self._repo.search_conversations(
+                start=start,
+                end=end,
+                user_name=user_name,
+                topic=topic,
+                keyword=keyword,
+                min_depth=min_depth,
+                max_depth=max_depth,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                count=count,
+            )
+        except ValueError as exc:
+            raise InvalidCursorError(cursor=cursor or "") from exc
+        return {
+            "total": page.total,
+            "items": [_row_dict(r) for r in page.items],
+            "next_cursor": page.next_cursor,
+        }
+
+    async def count_export_items(
+        self,
+        *,
+        scope: Literal["sessions", "conversations"],
+        start: datetime | None,
+        end: datetime | None,
+        user_name: str | None,
+        keyword: str | None,
+        topic: str | None,
+        min_depth: int | None,
+        max_depth: int | None,
+        limit: int | None,
+        offset: int,
+    ) -> int:
+        """估算导出行数（总数走 count=cached 缓存），用于后台导出任务的进度展示。"""
+        if scope == "sessions":
+            page: AdminPage[Any] = await self._repo.list_sessions(
+                start=start,
+                end=end,
+                user_name=user_name,
+                is_finished=None,
+                limit=1,
+                offset=0,
+                count="cached",
+            )
+        else:
+            page = await self._repo.search_conversations(
+                start=start,
+                end=end,
+                user_name=user_name,
+                topic=topic,
+                keyword=keyword,
+                min_depth=min_depth,
+                max_depth=max_depth,
+                limit=1,
+                offset=0,
+                count="cached",
+            )
+        total = max(0, (page.total or 0) - offset)
+        return total if limit is None else min(total, limit)
+
+    async def iter_export_items(
+        self,
+        *,
+        scope: Literal["sessions", "conversations"],
+        start: datetime | None,
+        end: datetime | None,
+        user_name: str | None,
+        keyword: str | None,
+        topic: str | None,
+        min_depth: int | None,
+        max_depth: int | None,
+        limit: int | None,
+        offset: int,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """按块产出导出行（dict），数据库侧使用服务端游标，内存占用与总行数无关。"""
+        async for rows in self.iter_export_rows(
+            scope=scope,
             start=start,
             end=end,
             user_name=user_name,
+            keyword=keyword,
             topic=topic,
+            min_depth=min_depth,
+            max_depth=max_depth,
+            limit=limit,
+            offset=offset,
+            chunk_size=chunk_size,
+        ):
+            if scope == "sessions":
+                yield [
+                    {
+                        **_row_dict(r),
+                        "selected_topics": _safe_json_loads(r.selected_topics_json),
+                    }
+                    for r in cast("list[AdminSessionRow]", rows)
+                ]
+            else:
+                # 高亮片段仅用于页面展示，不进入导出文件
+                yield [
+                    {k: v for k, v in _row_dict(r).items() if k != "snippet"}
+                    for r in rows
+                ]
+
+    async def iter_export_columns(
+        self,
+        *,
+        scope: Literal["sessions", "conversations"],
+        start: datetime | None,
+        end: datetime | None,
+        user_name: str | None,
+        keyword: str | None,
+        topic: str | None,
+        min_depth: int | None,
+        max_depth: int | None,
+        limit: int | None,
+        offset: int,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[ColumnChunk]:
+        """与 iter_export_items 相同的数据，按列产出（不构造逐行 dict），供进程池编码。"""
+        async for rows in self.iter_export_rows(
+            scope=scope,
+            start=start,
+            end=end,
+            user_name=user_name,
             keyword=keyword,
+            topic=topic,
             min_depth=min_depth,
             max_depth=max_depth,
             limit=limit,
             offset=offset,
-        )
-        return {"total": total, "items": [asdict(r) for r in rows]}
+            chunk_size=chunk_size,
+        ):
+            extra: tuple[tuple[Any, ...], ...] = ()
+            if scope == "sessions":
+                sessions = cast("list[AdminSessionRow]", rows)
+                columns = _SESSION_EXPORT_FIELDS
+                extra = (
+                    tuple(_safe_json_loads(r.selected_topics_json) for r in sessions),
+                )
+                names = (*columns, "selected_topics")
+            else:
+                columns = _CONVERSATION_EXPORT_FIELDS
+                names = columns
+            yield ColumnChunk(
+                columns=names,
+                values=(*(tuple(getattr(r, c) for r in rows) for c in columns), *extra),
+            )
 
-    async def export_rows(
+    async def iter_export_rows(
         self,
         *,
         scope: Literal["sessions", "conversations"],
@@ -133,21 +344,25 @@ class AdminService:
         topic: str | None,
         min_depth: int | None,
         max_depth: int | None,
-        limit: int,
+        limit: int | None,
         offset: int,
-    ) -> tuple[str, list[dict[str, Any]]]:
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[list[AdminSessionRow] | list[AdminConversationRow]]:
+        """按块产出仓储行对象（含精确毫秒时间，列式导出使用）。"""
         if scope == "sessions":
-            payload = await self.list_sessions(
+            async for rows in self._repo.iter_sessions(
                 start=start,
                 end=end,
                 user_name=user_name,
                 is_finished=None,
                 limit=limit,
                 offset=offset,
-            )
-            return "sessions", list(payload["items"])
+                chunk_size=chunk_size,
+            ):
+                yield rows
+            return
 
-        payload = await self.search_conversations(
+        async for conversations in self._repo.iter_conversations(
             start=start,
             end=end,
             user_name=user_name,
@@ -157,23 +372,39 @@ class AdminService:
             max_depth=max_depth,
             limit=limit,
             offset=offset,
-        )
-        return "conversations", list(payload["items"])
+            chunk_size=chunk_size,
+        ):
+            yield conversations
 
     @staticmethod
-    def to_csv(items: list[dict[str, Any]]) -> bytes:
-        if not items:
-            return b""
-
-        headers = list(items[0].keys())
-        buf = io.StringIO()
-        writer = csv.DictWriter(buf, fieldnames=headers, extrasaction="ignore")
-        writer.writeheader()
-        for item in items:
-            writer.writerow({k: json.dumps(v, ensure_ascii=False) if isinstance(v, (dict, list)) else v for k, v in item.items()})
-        return buf.getvalue().encode("utf-8-sig")
+    async def iter_csv(
+        chunks: AsyncIterator[list[dict[str, Any]]],
+    ) -> AsyncIterator[bytes]:
+        """增量编码 CSV（UTF-8 BOM，表头取首行的键；无数据时不输出）。"""
+        first = True
+        async for items in chunks:
+            if items:
+                yield encode_csv(ColumnChunk.from_items(items), header=first)
+                first = False
 
     @staticmethod
-    def to_json(items: list[dict[str, Any]]) -> bytes:
-        return json.dumps(items, ensure_ascii=False, indent=2).encode("utf-8")
+    async def iter_ndjson(
+        chunks: AsyncIterator[list[dict[str, Any]]],
+    ) -> AsyncIterator[bytes]:
+        async for items in chunks:
+            if items:
+                yield encode_ndjson(ColumnChunk.from_items(items))
 
+    @staticmethod
+    async def iter_json(
+        chunks: AsyncIterator[list[dict[str, Any]]],
+    ) -> AsyncIterator[bytes]:
+        """增量输出 JSON 数组（每行一个对象）。"""
+        yield b"["
+        first = True
+        async for items in chunks:
+            if not items:
+                continue
+            yield encode_json(ColumnChunk.from_items(items), first=first)
+            first = False
+        yield json_array_end(empty=first)
@@ -0,0 +1,95 @@
+"""导出文本编码（CSV/JSON/NDJSON）的纯函数实现。
+
+说明：
+- 编码是导出中最耗 CPU 的部分，函数均为无状态的模块级函数，可直接提交到进程池执行
+- 行以按列存放的 ColumnChunk 传递：列名只出现一次，跨进程传递时比 dict 列表紧凑
+- 同步流式导出与后台导出任务共用，输出与逐行编码完全一致
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+TextFormat = Literal["csv", "json", "ndjson"]
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnChunk:
+    """一块导出行（按列存放）。"""
+
+    columns: tuple[str, ...]
+    values: tuple[tuple[Any, ...], ...]
+
+    @classmethod
+    def from_items(cls, items: Sequence[dict[str, Any]]) -> ColumnChunk:
+        """由 dict 行构造（列取首行的键，缺失的值为 None）。"""
+        if not items:
+            return cls(columns=(), values=())
+        columns = tuple(items[0].keys())
+        return cls(
+            columns=columns,
+            values=tuple(tuple(item.get(c) for item in items) for c in columns),
+        )
+
+    def __len__(self) -> int:
+        return len(self.values[0]) if self.values else 0
+
+    def rows(self) -> Iterator[tuple[Any, ...]]:
+        return zip(*self.values)
+
+    def items(self) -> Iterator[dict[str, Any]]:
+        for row in self.rows():
+            yield dict(zip(self.columns, row))
+
+
+def _csv_value(value: Any) -> Any:
+    return (
+        json.dumps(value, ensure_ascii=False)
+        if isinstance(value, (dict, list))
+        else value
+    )
+
+
+def encode_csv(chunk: ColumnChunk, *, header: bool) -> bytes:
+    """编码 CSV 行；header=True 时先输出 UTF-8 BOM 与表头。"""
+    if not chunk:
+        return b""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    if header:
+        buf.write("\ufeff")
+        writer.writerow(chunk.columns)
+    writer.writerows([_csv_value(v) for v in row] for row in chunk.rows())
+    return buf.getvalue().encode("utf-8")
+
+
+def encode_ndjson(chunk: ColumnChunk) -> bytes:
+    return "".join(
+        json.dumps(item, ensure_ascii=False) + "\n" for item in chunk.items()
+    ).encode("utf-8")
+
+
+def encode_json(chunk: ColumnChunk, *, first: bool) -> bytes:
+    """编码 JSON 数组中的一段对象（不含首尾括号），first=False 时以逗号衔接上一段。"""
+    if not chunk:
+        return b""
+    body = ",\n".join(json.dumps(item, ensure_ascii=False) for item in chunk.items())
+    return (("\n" if first else ",\n") + body).encode("utf-8")
+
+
+def encode_chunk(format: TextFormat, chunk: ColumnChunk, *, first: bool) -> bytes:
+    """按格式编码一块数据；first 表示这是第一块非空数据（决定 CSV 表头与 JSON 分隔符）。"""
+    if format == "csv":
+        return encode_csv(chunk, header=first)
+    if format == "json":
+        return encode_json(chunk, first=first)
+    return encode_ndjson(chunk)
+
+
+def json_array_end(*, empty: bool) -> bytes:
+    return b"]" if empty else b"\n]"
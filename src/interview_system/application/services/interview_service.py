@@ -3,16 +3,28 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import hashlib
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Protocol
 from uuid import UUID
 
 from interview_system.application.dto.interview_dto import InterviewResultDTO
+from interview_system.application.dto.message_dto import (
+    FINISHED_MESSAGE_ID,
+    PENDING_MESSAGE_ID,
+    MessageCursor,
+    MessageSyncDTO,
+    entry_message_ids,
+)
 from interview_system.application.exceptions import (
+    IdempotencyKeyReusedError,
     NothingToUndoError,
     SessionAlreadyCompletedError,
     SessionNotFoundError,
 )
+from interview_system.application.services.session_locks import SessionLocks
 from interview_system.domain.entities.session import Session, SessionStatus
 from interview_system.domain.repositories.session_repository import SessionRepository
 from interview_system.domain.services.answer_processor import AnswerProcessor
@@ -21,6 +33,40 @@ from interview_system.domain.services.question_selector import select_questions
 from interview_system.domain.value_objects.conversation_entry import ConversationEntry
 
 
+class IdempotencyStore(Protocol):
+    """幂等键登记与结果存储（有界、带 TTL）；多 worker 部署时须为各 worker 共享的存储。
+
+    键为 (session_id, Idempotency-Key)，登记内容为 (请求指纹, 结果)，
+    结果为 None 表示首个请求仍在处理。
+    """
+
+    async def claim(
+        self, key: tuple[str, str], fingerprint: str
+    ) -> tuple[str, dict[str, Any] | None] | None:
+        """键未登记时登记为处理中并返回 None；已登记时返回现有登记。"""
+        ...
+
+    async def complete(
+        self, key: tuple[str, str], fingerprint: str, result: dict[str, Any]
+    ) -> None: ...
+
+    async def release(self, key: tuple[str, str]) -> None:
+        """撤销处理中的登记（处理失败时），重试按当前状态重新处理。"""
+        ...
+
+
+class BlockingRunner(Protocol):
+    """在专用线程池中执行阻塞调用（如 LLM 追问）。"""
+
+    async def run(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Any: ...
+
+
+# 其他 worker 正在处理同一幂等键时，轮询其结果的间隔（秒）
+_IDEMPOTENCY_POLL_SECONDS = 0.1
+
+
 class InterviewService:
     """访谈用例编排。"""
 
@@ -32,12 +78,22 @@ class InterviewService:
         followup_generator: FollowupGenerator,
         topics_source: dict[str, Any],
         total_questions: int,
+        idempotency_store: IdempotencyStore | None = None,
+        session_locks: SessionLocks | None = None,
+        llm_executor: BlockingRunner | None = None,
     ) -> None:
         self._repository = repository
         self._answer_processor = answer_processor
         self._followup_generator = followup_generator
         self._topics_source = topics_source
         self._total_questions = int(total_questions)
+        self._idempotency = idempotency_store
+        self._locks = session_locks or SessionLocks()
+        self._llm_executor = llm_executor
+        # 处理中的幂等请求：key -> (请求指纹, 完成时写入结果的 future；失败时结果为 None)
+        self._inflight: dict[
+            tuple[str, str], tuple[str, asyncio.Future[InterviewResultDTO | None]]
+        ] = {}
 
     async def start_session(
         self, *, user_name: str | None, topics: list[str] | None = None
@@ -47,36 +103,64 @@ class InterviewService:
             topics=topics, seed=int(session.id.int & 0xFFFFFFFF)
         )
         session.selected_topics = selected
-        await self._repository.save(session)
+        await self._save(session)
         return session
 
     async def get_messages(self, session_id: UUID) -> list[dict[str, Any]]:
-        session = await self._repository.get(session_id)
-        if session is None:
-            raise SessionNotFoundError(session_id)
-
+        session = await self._get_session(session_id)
         entries = await self._repository.list_conversation_entries(session_id)
-        messages: list[dict[str, Any]] = []
-
-        for entry in entries:
-            ts = int(entry.timestamp.timestamp() * 1000)
-            messages.append(
-                {"role": "assistant", "content": entry.question, "timestamp": ts}
-            )
-            messages.append({"role": "user", "content": entry.answer, "timestamp": ts})
-
-        if not session.is_finished():
-            messages.append(
-                {
-                    "role": "assistant",
-                    "content": self._current_question_text(session),
-                    "timestamp": int(datetime.now(timezone.utc).timestamp() * 1000),
-                }
-            )
-
-        return messages
+        return self._to_messages(session, entries)
+
+    async def get_version(self, session_id: UUID) -> int:
+        """当前会话状态版本（用于 ETag，命中会话缓存时不访问数据库）。"""
+        session = await self._get_session(session_id)
+        return session.version
+
+    async def sync_messages(
+        self, session_id: UUID, *, since: MessageCursor | None = None
+    ) -> MessageSyncDTO:
+        """按游标增量同步消息：版本未变时不查询对话记录，有记录被删除时返回完整对话。"""
+        session = await self._get_session(session_id)
+        finished = session.is_finished()
+        if since is not None and since.version == session.version:
+            return MessageSyncDTO(messages=[], cursor=since, is_finished=finished)
+
+        # 撤销/重开会删除记录，之后新记录可能复用被删除的 id，只能整体重发
+        reset = (
+            since is None
+            or since.version > session.version
+            or session.rewound_version > since.version
+        )
+        after_id = None if reset or since is None else since.last_id
+        entries = await self._repository.list_conversation_entries(
+            session_id, after_id=after_id
+        )
+        last_id = after_id or 0
+        if entries and entries[-1].id is not None:
+            last_id = entries[-1].id
+        return MessageSyncDTO(
+            messages=self._to_messages(session, entries),
+            cursor=MessageCursor(version=session.version, last_id=last_id),
+            reset=since is not None and reset,
+            is_finished=finished,
+        )
 
     async def process_answer(
+        self, *, session_id: UUID, answer: str, idempotency_key: str | None = None
+    ) -> InterviewResultDTO:
+        """处理回答；带幂等键的重试直接返回首次结果（不再评分、写库或调用 LLM）。"""
+        fingerprint = "answer:" + hashlib.sha256(answer.encode("utf-8")).hexdigest()
+        return await self._idempotent(
+            session_id,
+            idempotency_key,
+            fingerprint,
+            lambda: self._serialized(
+                session_id,
+                lambda: self._process_answer(session_id=session_id, answer=answer),
+            ),
+        )
+
+    async def _process_answer(
         self, *, session_id: UUID, answer: str
     ) -> InterviewResultDTO:
         session = await self._repository.get(session_id)
@@ -89,10 +173,8 @@ class InterviewService:
         topic = self._get_current_topic(session)
         if topic is None:
             session.finish()
-            await self._repository.save(session)
-            return InterviewResultDTO(
-                assistant_message="访谈已结束，感谢您的参与！", is_finished=True
-            )
+            await self._save(session)
+            return self._finished_result()
 
         if session.is_followup:
             return await self._process_followup_answer(
@@ -103,7 +185,20 @@ class InterviewService:
             session=session, topic=topic, answer=answer
         )
 
-    async def skip_question(self, *, session_id: UUID) -> InterviewResultDTO:
+    async def skip_question(
+        self, *, session_id: UUID, idempotency_key: str | None = None
+    ) -> InterviewResultDTO:
+        """跳过当前问题；带幂等键的重试不会连续跳过多道题。"""
+        return await self._idempotent(
+            session_id,
+            idempotency_key,
+            "skip",
+            lambda: self._serialized(
+                session_id, lambda: self._skip_question(session_id=session_id)
+            ),
+        )
+
+    async def _skip_question(self, *, session_id: UUID) -> InterviewResultDTO:
         session = await self._repository.get(session_id)
         if session is None:
             raise SessionNotFoundError(session_id)
@@ -114,10 +209,8 @@ class InterviewService:
         topic = self._get_current_topic(session)
         if topic is None:
             session.finish()
-            await self._repository.save(session)
-            return InterviewResultDTO(
-                assistant_message="访谈已结束，感谢您的参与！", is_finished=True
-            )
+            await self._save(session)
+            return self._finished_result()
 
         question_text = self._current_question_text(session)
         entry = ConversationEntry(
@@ -129,7 +222,6 @@ class InterviewService:
             depth_score=0,
             is_ai_generated=bool(session.current_followup_is_ai),
         )
-        await self._repository.append_conversation_entry(session_id, entry)
 
         # 状态前进
         if session.is_followup:
@@ -141,23 +233,26 @@ class InterviewService:
         session.current_question_idx += 1
         if session.current_question_idx >= self._total_questions:
             session.finish()
-            await self._repository.save(session)
-            return InterviewResultDTO(
-                assistant_message="访谈已结束，感谢您的参与！", is_finished=True
-            )
+            await self._save(session, entry=entry)
+            return self._finished_result()
 
-        await self._repository.save(session)
+        await self._save(session, entry=entry)
         return InterviewResultDTO(
             assistant_message=self._current_question_text(session), is_finished=False
         )
 
-    async def undo_last(self, *, session_id: UUID) -> None:
+    async def undo_last(self, *, session_id: UUID) -> InterviewResultDTO:
+        """撤销最后一条对话，返回需要重新回答的问题。"""
+        async with self._locks.lock(session_id):
+            return await self._undo_last(session_id=session_id)
+
+    async def _undo_last(self, *, session_id: UUID) -> InterviewResultDTO:
         session = await self._repository.get(session_id)
         if session is None:
             raise SessionNotFoundError(session_id)
 
-        last = await self._repository.delete_last_conversation_entry(session_id)
-        if last is None:
+        last = await self._repository.get_last_conversation_entry(session_id)
+        if last is None or last.id is None:
             raise NothingToUndoError(session_id)
 
         # 退回到“刚刚那道题/追问”处，等待重新回答
@@ -176,19 +271,23 @@ class InterviewService:
         if session.is_finished():
             session.status = SessionStatus.ACTIVE
 
-        await self._repository.save(session)
+        # 记录删除与状态回退在同一事务：期间会话被其他请求推进时两者都不生效
+        await self._save(session, rewound=True, delete_entries_from=last.id)
+        return InterviewResultDTO(
+            assistant_message=self._current_question_text(session),
+            is_finished=False,
+            truncate_from=entry_message_ids(last.id)[0],
+        )
 
     async def restart(self, *, session_id: UUID) -> Session:
+        async with self._locks.lock(session_id):
+            return await self._restart(session_id=session_id)
+
+    async def _restart(self, *, session_id: UUID) -> Session:
         session = await self._repository.get(session_id)
         if session is None:
             raise SessionNotFoundError(session_id)
 
-        # 删除全部日志（逐条删除直到空）
-        while True:
-            deleted = await self._repository.delete_last_conversation_entry(session_id)
-            if deleted is None:
-                break
-
         session.current_question_idx = 0
         session.is_followup = False
         session.current_followup_is_ai = False
@@ -196,9 +295,128 @@ class InterviewService:
         session.current_followup_question = ""
         session.status = SessionStatus.ACTIVE
 
-        await self._repository.save(session)
+        # 删除全部对话记录，与状态重置在同一事务提交
+        await self._save(session, rewound=True, delete_entries_from=0)
         return session
 
+    async def _idempotent(
+        self,
+        session_id: UUID,
+        idempotency_key: str | None,
+        fingerprint: str,
+        run: Callable[[], Awaitable[InterviewResultDTO]],
+    ) -> InterviewResultDTO:
+        if idempotency_key is None or self._idempotency is None:
+            return await run()
+
+        key = (str(session_id), idempotency_key)
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                # 同一请求仍在本进程处理（客户端超时后立即重发）：等待其结果，失败时重新检查并自行处理
+                self._check_fingerprint(
+                    session_id, idempotency_key, inflight[0], fingerprint
+                )
+                result = await asyncio.shield(inflight[1])
+                if result is not None:
+                    return dataclasses.replace(result, replayed=True)
+                continue
+            stored = await self._idempotency.claim(key, fingerprint)
+            if stored is None:
+                break
+            self._check_fingerprint(session_id, idempotency_key, stored[0], fingerprint)
+            if stored[1] is not None:
+                return InterviewResultDTO(**{**stored[1], "replayed": True})
+            # 其他 worker 正在处理：等待其写入结果（失败时登记被撤销，由本请求重新处理）
+            await asyncio.sleep(_IDEMPOTENCY_POLL_SECONDS)
+
+        future: asyncio.Future[InterviewResultDTO | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = (fingerprint, future)
+        saved: InterviewResultDTO | None = None
+        try:
+            result = await run()
+            # 只保存成功结果；业务错误不缓存，重试时按当前状态重新处理
+            await self._idempotency.complete(
+                key, fingerprint, dataclasses.asdict(result)
+            )
+            saved = result
+            return result
+        finally:
+            del self._inflight[key]
+            future.set_result(saved)
+            if saved is None:
+                await self._idempotency.release(key)
+
+    async def _serialized(
+        self, session_id: UUID, run: Callable[[], Awaitable[InterviewResultDTO]]
+    ) -> InterviewResultDTO:
+        # 同一会话的推进串行执行：后到的请求基于前一个请求保存后的状态处理
+        async with self._locks.lock(session_id):
+            return await run()
+
+    @staticmethod
+    def _check_fingerprint(
+        session_id: UUID, idempotency_key: str, stored: str, fingerprint: str
+    ) -> None:
+        if stored != fingerprint:
+            raise IdempotencyKeyReusedError(
+                session_id=session_id, idempotency_key=idempotency_key
+            )
+
+    async def _get_session(self, session_id: UUID) -> Session:
+        session = await self._repository.get(session_id)
+        if session is None:
+            raise SessionNotFoundError(session_id)
+        return session
+
+    async def _run_blocking(self, fn: Callable[..., Any], /, **kwargs: Any) -> Any:
+        # 追问生成可能调用 LLM：未配置专用线程池时使用默认线程池
+        if self._llm_executor is None:
+            return await asyncio.to_thread(fn, **kwargs)
+        return await self._llm_executor.run(fn, **kwargs)
+
+    async def _save(
+        self,
+        session: Session,
+        *,
+        rewound: bool = False,
+        entry: ConversationEntry | None = None,
+        delete_entries_from: int | None = None,
+    ) -> None:
+        # 对话记录与状态在同一事务写入/删除：版本冲突时两者都不落库
+        session.mark_changed(rewound=rewound)
+        await self._repository.save(
+            session, new_entry=entry, delete_entries_from=delete_entries_from
+        )
+
+    def _to_messages(
+        self, session: Session, entries: list[ConversationEntry]
+    ) -> list[dict[str, Any]]:
+        """对话记录 -> 消息（id 由记录 id 派生，重复读取时保持不变），末尾附带待回答问题。"""
+        messages: list[dict[str, Any]] = []
+        for entry in entries:
+            ts = int(entry.timestamp.timestamp() * 1000)
+            question = {"role": "assistant", "content": entry.question, "timestamp": ts}
+            answer = {"role": "user", "content": entry.answer, "timestamp": ts}
+            if entry.id is not None:
+                question["id"], answer["id"] = entry_message_ids(entry.id)
+            messages.append(question)
+            messages.append(answer)
+
+        if not session.is_finished():
+            asked_at = session.updated_at or session.created_at
+            messages.append(
+                {
+                    "id": PENDING_MESSAGE_ID,
+                    "role": "assistant",
+                    "content": self._current_question_text(session),
+                    "timestamp": int(asked_at.timestamp() * 1000),
+                }
+            )
+        return messages
+
     def _select_topics(
         self, *, topics: list[str] | None, seed: int
     ) -> list[dict[str, Any]]:
@@ -255,6 +473,14 @@ class InterviewService:
             return "访谈已结束，感谢您的参与！"
         return self._format_core_question(session=session, topic=topic)
 
+    @staticmethod
+    def _finished_result() -> InterviewResultDTO:
+        return InterviewResultDTO(
+            assistant_message="访谈已结束，感谢您的参与！",
+            is_finished=True,
+            message_id=FINISHED_MESSAGE_ID,
+        )
+
     async def _process_core_answer(
         self, *, session: Session, topic: dict[str, Any], answer: str
     ) -> InterviewResultDTO:
@@ -272,9 +498,8 @@ class InterviewService:
             depth_score=result.depth_score,
             is_ai_generated=False,
         )
-        await self._repository.append_conversation_entry(session.id, entry)
 
-        followup = await asyncio.to_thread(
+        followup = await self._run_blocking(
             self._followup_generator.should_followup,
             answer=result.answer,
             topic=topic,
@@ -289,7 +514,7 @@ class InterviewService:
             session.current_followup_is_ai = followup.is_ai_generated
             session.current_followup_count = session.current_followup_count + 1
             session.current_followup_question = followup.followup_question
-            await self._repository.save(session)
+            await self._save(session, entry=entry)
             return InterviewResultDTO(
                 assistant_message=followup.followup_question, is_finished=False
             )
@@ -303,12 +528,10 @@ class InterviewService:
 
         if session.current_question_idx >= self._total_questions:
             session.finish()
-            await self._repository.save(session)
-            return InterviewResultDTO(
-                assistant_message="访谈已结束，感谢您的参与！", is_finished=True
-            )
+            await self._save(session, entry=entry)
+            return self._finished_result()
 
-        await self._repository.save(session)
+        await self._save(session, entry=entry)
         return InterviewResultDTO(
             assistant_message=self._current_question_text(session), is_finished=False
         )
@@ -333,9 +556,8 @@ class InterviewService:
             depth_score=result.depth_score,
             is_ai_generated=result.is_ai_generated,
         )
-        await self._repository.append_conversation_entry(session.id, entry)
 
-        followup = await asyncio.to_thread(
+        followup = await self._run_blocking(
             self._followup_generator.should_followup,
             answer=result.answer,
             topic=topic,
@@ -350,7 +572,7 @@ class InterviewService:
             session.current_followup_is_ai = followup.is_ai_generated
             session.current_followup_count = session.current_followup_count + 1
             session.current_followup_question = followup.followup_question
-            await self._repository.save(session)
+            await self._save(session, entry=entry)
             return InterviewResultDTO(
                 assistant_message=followup.followup_question, is_finished=False
             )
@@ -364,12 +586,10 @@ class InterviewService:
 
         if session.current_question_idx >= self._total_questions:
             session.finish()
-            await self._repository.save(session)
-            return InterviewResultDTO(
-                assistant_message="访谈已结束，感谢您的参与！", is_finished=True
-            )
+            await self._save(session, entry=entry)
+            return self._finished_result()
 
-        await self._repository.save(session)
+        await self._save(session, entry=entry)
         return InterviewResultDTO(
             assistant_message=self._current_question_text(session), is_finished=False
         )
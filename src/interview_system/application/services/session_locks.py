@@ -0,0 +1,20 @@
+"""按会话串行化的 asyncio 锁。"""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID
+
+
+class SessionLocks:
+    """分片锁：session id 映射到固定数量的锁之一，内存占用与会话数无关。
+
+    不同会话偶尔落在同一分片时只是多等一轮，不影响正确性；只保证单进程内的串行，
+    跨进程的并发由仓储的版本校验兜底。
+    """
+
+    def __init__(self, stripes: int = 256) -> None:
+        self._locks = [asyncio.Lock() for _ in range(max(1, int(stripes)))]
+
+    def lock(self, session_id: UUID) -> asyncio.Lock:
+        return self._locks[session_id.int % len(self._locks)]
@@ -14,6 +14,7 @@ class SessionService:
 
     async def create(self, user_name: str | None = None) -> Session:
         session = Session(user_name=user_name or "访谈者")
+        session.mark_changed()
         await self._repository.save(session)
         return session
 
@@ -7,7 +7,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -49,6 +49,234 @@ class Settings(BaseSettings):
         description="后台监管接口 Token（使用 X-Admin-Token 访问）。为空则禁用后台监管接口。",
     )
 
+    sqlite_tuning: bool = Field(
+        default=True,
+        validation_alias="SQLITE_TUNING",
+        description="是否在每个 SQLite 新连接上应用下列调优参数（false 使用 SQLite 默认值）",
+    )
+
+    sqlite_journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"] = (
+        Field(
+            default="WAL",
+            validation_alias="SQLITE_JOURNAL_MODE",
+            description="SQLite journal_mode（WAL 允许读写并发）",
+        )
+    )
+
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        default="NORMAL",
+        validation_alias="SQLITE_SYNCHRONOUS",
+        description="SQLite synchronous（WAL 下 NORMAL 可避免每次提交 fsync）",
+    )
+
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000,
+        ge=0,
+        validation_alias="SQLITE_BUSY_TIMEOUT_MS",
+        description="SQLite busy_timeout（毫秒），写锁冲突时等待而非立即报 database is locked",
+    )
+
+    sqlite_mmap_size: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        validation_alias="SQLITE_MMAP_SIZE",
+        description="SQLite mmap_size（字节），0 表示关闭内存映射",
+    )
+
+    sqlite_cache_size: int = Field(
+        default=-20000,
+        validation_alias="SQLITE_CACHE_SIZE",
+        description="SQLite cache_size（正数为页数，负数为 KiB）",
+    )
+
+    sqlite_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = Field(
+        default="MEMORY",
+        validation_alias="SQLITE_TEMP_STORE",
+        description="SQLite temp_store（临时表/排序的存放位置）",
+    )
+
+    admin_read_engine: bool = Field(
+        default=True,
+        validation_alias="ADMIN_READ_ENGINE",
+        description="后台统计/导出是否使用独立只读连接池（SQLite 文件库或 ADMIN_DATABASE_URL）",
+    )
+
+    admin_database_url: str = Field(
+        default="",
+        validation_alias="ADMIN_DATABASE_URL",
+        description="后台只读查询使用的副本连接串（为空则复用 DATABASE_URL 的只读连接）",
+    )
+
+    admin_read_pool_size: int = Field(
+        default=3,
+        ge=1,
+        validation_alias="ADMIN_READ_POOL_SIZE",
+        description="后台只读连接池大小",
+    )
+
+    admin_statement_timeout_ms: int = Field(
+        default=30000,
+        ge=0,
+        validation_alias="ADMIN_STATEMENT_TIMEOUT_MS",
+        description="后台只读查询单条语句超时（毫秒，0 表示不限制；仅 SQLite 生效）",
+    )
+
+    admin_query_cache_ttl_seconds: float = Field(
+        default=30,
+        gt=0,
+        validation_alias="ADMIN_QUERY_CACHE_TTL_SECONDS",
+        description="后台查询结果缓存时长（秒）：列表/检索总数（count=cached）与概览",
+    )
+
+    export_dir: str = Field(
+        default="./exports",
+        validation_alias="EXPORT_DIR",
+        description="后台导出任务的文件目录（启动时清理不属于任何任务的残留文件；多 worker 时需共用）",
+    )
+
+    export_max_concurrency: int = Field(
+        default=1,
+        ge=1,
+        validation_alias="EXPORT_MAX_CONCURRENCY",
+        description="同时执行的后台导出任务数（其余任务排队）",
+    )
+
+    export_max_pending: int = Field(
+        default=20,
+        ge=1,
+        validation_alias="EXPORT_MAX_PENDING",
+        description="排队与执行中的导出任务上限（超出时返回 429）",
+    )
+
+    export_ttl_seconds: float = Field(
+        default=3600,
+        gt=0,
+        validation_alias="EXPORT_TTL_SECONDS",
+        description="导出任务结束后文件的保留时长（秒）",
+    )
+
+    llm_executor_workers: int = Field(
+        default=16,
+        ge=1,
+        validation_alias="LLM_EXECUTOR_WORKERS",
+        description="LLM 追问调用专用线程池的线程数（同时进行的 LLM 请求上限）",
+    )
+
+    cpu_executor_workers: int = Field(
+        default=2,
+        ge=1,
+        validation_alias="CPU_EXECUTOR_WORKERS",
+        description="导出编码/压缩等 CPU 密集任务专用线程池的线程数",
+    )
+
+    file_io_executor_workers: int = Field(
+        default=4,
+        ge=1,
+        validation_alias="FILE_IO_EXECUTOR_WORKERS",
+        description="导出文件读写专用线程池的线程数",
+    )
+
+    export_process_workers: int = Field(
+        default=2,
+        ge=0,
+        validation_alias="EXPORT_PROCESS_WORKERS",
+        description="CSV/JSON/NDJSON 导出编码进程池的进程数（首次导出时启动；0 表示在 CPU 线程池中编码）",
+    )
+
+    server_workers: int = Field(
+        default=0,
+        ge=0,
+        validation_alias="SERVER_WORKERS",
+        description="生产模式（run --prod）的 worker 进程数，0 表示按 CPU 核数（直接用 uvicorn --workers 或 gunicorn 启动时按多 worker 处理）；大于 1 时停用 memory 会话缓存与写回缓冲，幂等键与导出任务改存数据库",
+    )
+
+    server_keep_alive_seconds: int = Field(
+        default=15,
+        ge=1,
+        validation_alias="SERVER_KEEP_ALIVE_SECONDS",
+        description="生产模式 HTTP keep-alive 空闲超时（秒）",
+    )
+
+    server_backlog: int = Field(
+        default=2048,
+        ge=1,
+        validation_alias="SERVER_BACKLOG",
+        description="生产模式监听 socket 的 backlog（等待 accept 的连接数上限）",
+    )
+
+    server_graceful_shutdown_seconds: int = Field(
+        default=30,
+        ge=0,
+        validation_alias="SERVER_GRACEFUL_SHUTDOWN_SECONDS",
+        description="停止时等待进行中的请求与 LLM 调用完成的最长时间（秒）",
+    )
+
+    fast_json_responses: bool = Field(
+        default=False,
+        validation_alias="FAST_JSON_RESPONSES",
+        description="热点接口（访谈消息/会话/后台列表）是否跳过 response_model 二次校验，直接序列化（安装 orjson 时使用 orjson）",
+    )
+
+    idempotency_ttl_seconds: float = Field(
+        default=3600,
+        gt=0,
+        validation_alias="IDEMPOTENCY_TTL_SECONDS",
+        description="回答/跳过请求的幂等结果保留时长（秒），期间携带相同 Idempotency-Key 的重试直接返回首次结果",
+    )
+
+    idempotency_max_keys: int = Field(
+        default=10000,
+        ge=0,
+        validation_alias="IDEMPOTENCY_MAX_KEYS",
+        description="单 worker 时内存中保留的幂等结果数上限（超出时淘汰最早的；多 worker 时保存在数据库中；0 表示不处理 Idempotency-Key）",
+    )
+
+    session_cache_backend: Literal["memory", "sqlite", "redis"] = Field(
+        default="memory",
+        validation_alias="SESSION_CACHE_BACKEND",
+        description="会话缓存后端：memory（进程内，仅单 worker）/ sqlite（本机共享文件）/ redis",
+    )
+
+    session_cache_url: str = Field(
+        default="",
+        validation_alias="SESSION_CACHE_URL",
+        description="sqlite 后端的文件路径或 redis 后端的连接串（为空时分别为 ./session_cache.db 与 redis://localhost:6379/0）",
+    )
+
+    session_cache_max_entries: int = Field(
+        default=10000,
+        ge=1,
+        validation_alias="SESSION_CACHE_MAX_ENTRIES",
+        description="会话缓存条目数上限（memory/sqlite 后端；redis 由其自身的内存策略淘汰）",
+    )
+
+    session_cache_ttl_seconds: int = Field(
+        default=300,
+        ge=1,
+        validation_alias="SESSION_CACHE_TTL_SECONDS",
+        description="会话缓存条目的有效期（秒）",
+    )
+
+    session_write_behind: bool = Field(
+        default=False,
+        validation_alias="SESSION_WRITE_BEHIND",
+        description="是否启用 session 状态写回缓冲（状态更新批量延迟落库，对话日志仍同步写入）",
+    )
+
+    session_flush_interval_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        validation_alias="SESSION_FLUSH_INTERVAL_SECONDS",
+        description="写回缓冲的周期刷盘间隔（秒）",
+    )
+
+    session_flush_max_pending: int = Field(
+        default=100,
+        ge=1,
+        validation_alias="SESSION_FLUSH_MAX_PENDING",
+        description="写回缓冲积压多少个 session 时立即刷盘",
+    )
+
     @field_validator("allowed_origins", mode="before")
     @classmethod
     def _parse_allowed_origins(cls, value: Any) -> list[str]:
@@ -60,6 +288,15 @@ class Settings(BaseSettings):
             return [str(v).strip() for v in value if str(v).strip()]
         raise TypeError("ALLOWED_ORIGINS 必须为逗号分隔字符串或字符串列表")
 
+    @field_validator(
+        "sqlite_journal_mode", "sqlite_synchronous", "sqlite_temp_store", mode="before"
+    )
+    @classmethod
+    def _normalize_sqlite_keyword(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return value.upper().strip()
+        return value
+
     @field_validator("log_level", mode="before")
     @classmethod
     def _normalize_log_level(cls, value: Any) -> str:
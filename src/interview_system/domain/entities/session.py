@@ -30,6 +30,11 @@ class Session:
     current_followup_count: int = 0
     current_followup_question: str = ""
 
+    # 状态版本：每次保存成功后加一（乐观并发校验）；rewound_version 记录最近一次删除对话记录时的版本
+    version: int = 0
+    rewound_version: int = 0
+    updated_at: datetime | None = None
+
     def is_finished(self) -> bool:
         return self.status == SessionStatus.COMPLETED
 
@@ -38,3 +43,13 @@ class Session:
 
     def can_undo(self) -> bool:
         return self.current_question_idx > 0 or self.current_followup_count > 0
+
+    def mark_changed(self, *, rewound: bool = False) -> None:
+        """标记状态已变化（保存前调用）；rewound=True 表示本次删除了已有的对话记录。
+
+        version 由仓储在保存成功后加一，rewound_version 记为本次保存后的版本。
+        """
+        if rewound:
+            self.rewound_version = self.version + 1
+        # 与库中 updated_at 的秒级精度一致，缓存命中与否读到的值相同
+        self.updated_at = datetime.now(timezone.utc).replace(microsecond=0)
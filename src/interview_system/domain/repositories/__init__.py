@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from interview_system.domain.repositories.admin_repository import AdminRepository
-from interview_system.domain.repositories.session_repository import SessionRepository
+from interview_system.domain.repositories.session_repository import (
+    SessionRepository,
+    StaleSessionError,
+)
 
-__all__ = ["AdminRepository", "SessionRepository"]
+__all__ = ["AdminRepository", "SessionRepository", "StaleSessionError"]
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Protocol
+from typing import Generic, Literal, Protocol, TypeVar
+
+RowT = TypeVar("RowT")
+
+# exact: 每次精确计数；cached: 相同筛选条件短时间内复用计数；none: 不计数（total 为 None）
+CountMode = Literal["exact", "cached", "none"]
 
 
 @dataclass(frozen=True, slots=True)
@@ -22,6 +28,8 @@ class AdminSessionRow:
     current_followup_is_ai: bool
     current_followup_count: int
     current_followup_question: str
+    # start_time 的精确 UTC 毫秒值（列式导出使用；未回填的旧数据为 None）
+    start_time_ms: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -36,6 +44,9 @@ class AdminConversationRow:
     answer: str
     depth_score: int
     is_ai_generated: bool
+    snippet: str | None = None
+    # timestamp 的精确 UTC 毫秒值（列式导出使用；未回填的旧数据为 None）
+    timestamp_ms: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -61,7 +72,20 @@ class AdminTopicRow:
     avg_depth_score: float
 
 
+@dataclass(frozen=True, slots=True)
+class AdminPage(Generic[RowT]):
+    """分页结果；next_cursor 为空表示没有下一页。"""
+
+    total: int | None
+    items: list[RowT] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
 class AdminRepository(Protocol):
+    async def data_version(self) -> int:
+        """数据写入版本号（有写入提交后变化），用于查询结果缓存失效。"""
+        ...
+
     async def list_sessions(
         self,
         *,
@@ -71,7 +95,9 @@ class AdminRepository(Protocol):
         is_finished: bool | None,
         limit: int,
         offset: int,
-    ) -> tuple[int, list[AdminSessionRow]]: ...
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> AdminPage[AdminSessionRow]: ...
 
     async def search_conversations(
         self,
@@ -85,7 +111,40 @@ class AdminRepository(Protocol):
         max_depth: int | None,
         limit: int,
         offset: int,
-    ) -> tuple[int, list[AdminConversationRow]]: ...
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> AdminPage[AdminConversationRow]: ...
+
+    def iter_sessions(
+        self,
+        *,
+        start: datetime | None,
+        end: datetime | None,
+        user_name: str | None,
+        is_finished: bool | None,
+        limit: int | None = None,
+        offset: int = 0,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[list[AdminSessionRow]]:
+        """按块流式读取会话（用于导出，内存占用与总行数无关）。"""
+        ...
+
+    def iter_conversations(
+        self,
+        *,
+        start: datetime | None,
+        end: datetime | None,
+        user_name: str | None,
+        topic: str | None,
+        keyword: str | None,
+        min_depth: int | None,
+        max_depth: int | None,
+        limit: int | None = None,
+        offset: int = 0,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[list[AdminConversationRow]]:
+        """按块流式读取对话记录（按 id 递减）。"""
+        ...
 
     async def get_time_series(
         self,
@@ -110,4 +169,3 @@ class AdminRepository(Protocol):
         end: datetime | None,
         limit: int,
     ) -> list[AdminTopicRow]: ...
-
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Protocol
 from uuid import UUID
 
@@ -9,21 +10,40 @@ from interview_system.domain.entities.session import Session
 from interview_system.domain.value_objects.conversation_entry import ConversationEntry
 
 
+@dataclass(frozen=True, slots=True)
+class StaleSessionError(Exception):
+    """保存时会话已被其他请求更新（乐观并发冲突）。"""
+
+    session_id: UUID
+
+
 class SessionRepository(Protocol):
     async def get(self, session_id: UUID) -> Session | None: ...
 
-    async def save(self, session: Session) -> None: ...
+    # 可同时追加一条对话记录、删除 id 不小于 delete_entries_from 的对话记录（撤销/重开），
+    # 与状态在同一事务写入；版本冲突时抛出 StaleSessionError，记录均不变
+    async def save(
+        self,
+        session: Session,
+        *,
+        new_entry: ConversationEntry | None = None,
+        delete_entries_from: int | None = None,
+    ) -> None: ...
 
     async def delete(self, session_id: UUID) -> bool: ...
 
     async def list_conversation_entries(
-        self, session_id: UUID
+        self, session_id: UUID, *, after_id: int | None = None
     ) -> list[ConversationEntry]: ...
 
     async def append_conversation_entry(
         self, session_id: UUID, entry: ConversationEntry
     ) -> None: ...
 
+    async def get_last_conversation_entry(
+        self, session_id: UUID
+    ) -> ConversationEntry | None: ...
+
     async def delete_last_conversation_entry(
         self, session_id: UUID
     ) -> ConversationEntry | None: ...
@@ -18,3 +18,5 @@ class ConversationEntry:
     answer: str
     depth_score: int = 0
     is_ai_generated: bool = False
+    # 落库后的记录 id（单调递增，用作消息 id 与增量同步游标）；未落库时为 None
+    id: int | None = None
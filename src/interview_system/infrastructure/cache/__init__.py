@@ -2,6 +2,20 @@
 
 from __future__ import annotations
 
+from interview_system.infrastructure.cache.backends import (
+    CacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    SqliteCacheBackend,
+)
 from interview_system.infrastructure.cache.memory_cache import SessionCache
+from interview_system.infrastructure.cache.query_cache import QueryCache
 
-__all__ = ["SessionCache"]
+__all__ = [
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "QueryCache",
+    "RedisCacheBackend",
+    "SessionCache",
+    "SqliteCacheBackend",
+]
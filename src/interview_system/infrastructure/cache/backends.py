@@ -0,0 +1,225 @@
+"""SessionCache 的存储后端。
+
+说明：
+- memory：进程内 TTLCache，仅适用于单 worker
+- sqlite：本机共享的 SQLite 文件（WAL + mmap），同一台机器上的多个 worker 共用；
+  sqlite3 为阻塞调用，在文件 I/O 线程池中执行
+- redis：Redis（依赖可选的 redis 包），可跨机器共用
+- 条目带版本号，写入为比较后写入：仅当新版本不低于已缓存的版本时覆盖，
+  延迟到达的旧版本写入不会覆盖新版本；value 为 None 的条目是占位（表示该版本之前的内容已失效）
+- 缓存只是加速：后端出错时按未命中处理，由调用方回退到数据库
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Protocol, TypeVar
+
+from cachetools import TTLCache
+
+from interview_system.infrastructure.executors import BoundedExecutor
+
+T = TypeVar("T")
+
+# Redis 比较后写入：KEYS[1]=key，ARGV = version, value（空串表示占位）, ttl_ms
+_REDIS_SET_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], 'v')
+if current and tonumber(current) > tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'v', ARGV[1], 'd', ARGV[2])
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+
+class CacheBackend(Protocol):
+    """带版本的键值缓存。"""
+
+    async def get(self, key: str) -> bytes | None:
+        """返回缓存内容；未命中、已过期或为占位时返回 None。"""
+        ...
+
+    async def set(self, key: str, version: int, value: bytes | None) -> bool:
+        """version 不低于已缓存版本时写入并返回 True；value=None 写入占位。"""
+        ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryCacheBackend:
+    """进程内后端（默认）。"""
+
+    def __init__(self, *, maxsize: int = 256, ttl_seconds: float = 300) -> None:
+        self._cache: TTLCache[str, tuple[int, bytes | None]] = TTLCache(
+            maxsize=maxsize, ttl=ttl_seconds
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._cache.get(key)
+        return entry[1] if entry is not None else None
+
+    async def set(self, key: str, version: int, value: bytes | None) -> bool:
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > version:
+            return False
+        self._cache[key] = (version, value)
+        return True
+
+    async def close(self) -> None:
+        self._cache.clear()
+
+
+class SqliteCacheBackend:
+    """本机共享的 SQLite 文件后端。
+
+    sqlite3 调用会阻塞（锁等待最长 busy_timeout_ms，周期清理需扫描整表），不在事件循环中执行：
+    传入 executor 时使用该线程池（应用中为文件 I/O 线程池），否则使用默认线程池；
+    每个线程使用各自的连接。锁等待超时按未命中/未写入处理。过期条目在写入时按批清理，
+    条目数超过上限时淘汰最早过期的。
+    """
+
+    _PURGE_EVERY = 256
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        ttl_seconds: float = 300,
+        max_entries: int = 100_000,
+        busy_timeout_ms: int = 50,
+        mmap_size: int = 64 * 1024 * 1024,
+        executor: BoundedExecutor | None = None,
+    ) -> None:
+        self._path = path
+        self._ttl = float(ttl_seconds)
+        self._max_entries = max(1, int(max_entries))
+        self._busy_timeout = busy_timeout_ms / 1000
+        self._mmap_size = int(mmap_size)
+        self._executor = executor
+        self._writes = itertools.count(1)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        # 启动时建表（仅执行一次）
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, version INTEGER NOT NULL, value BLOB, "
+            "expires_at REAL NOT NULL) WITHOUT ROWID"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_cache_entries_expires_at ON cache_entries (expires_at)"
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._run(self._get, key)
+
+    async def set(self, key: str, version: int, value: bytes | None) -> bool:
+        return await self._run(self._set, key, version, value)
+
+    async def close(self) -> None:
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        if self._executor is None:
+            return await asyncio.to_thread(fn, *args)
+        return await self._executor.run(fn, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self._path,
+                timeout=self._busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            # 缓存内容可随时丢弃，不需要落盘保证
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute(f"PRAGMA mmap_size={self._mmap_size}")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _get(self, key: str) -> bytes | None:
+        row = (
+            self._connect()
+            .execute(
+                "SELECT value FROM cache_entries WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return row[0] if row is not None else None
+
+    def _set(self, key: str, version: int, value: bytes | None) -> bool:
+        now = time.time()
+        cursor = self._connect().execute(
+            "INSERT INTO cache_entries (key, version, value, expires_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET version = excluded.version, "
+            "value = excluded.value, expires_at = excluded.expires_at "
+            "WHERE excluded.version >= cache_entries.version OR cache_entries.expires_at <= ?",
+            (key, version, value, now + self._ttl, now),
+        )
+        if next(self._writes) % self._PURGE_EVERY == 0:
+            self._purge(now)
+        return cursor.rowcount > 0
+
+    def _purge(self, now: float) -> None:
+        conn = self._connect()
+        conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        (count,) = conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+        if count > self._max_entries:
+            conn.execute(
+                "DELETE FROM cache_entries WHERE key IN ("
+                "SELECT key FROM cache_entries ORDER BY expires_at LIMIT ?)",
+                (count - self._max_entries,),
+            )
+
+
+class RedisCacheBackend:
+    """Redis 后端（``pip install interview-system[redis]``）。"""
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        ttl_seconds: float = 300,
+        key_prefix: str = "interview:session:",
+        client: Any | None = None,
+    ) -> None:
+        if client is None:
+            import redis.asyncio as redis
+
+            client = redis.from_url(url)
+        self._client = client
+        self._ttl_ms = max(1, int(ttl_seconds * 1000))
+        self._prefix = key_prefix
+        self._set_script = client.register_script(_REDIS_SET_SCRIPT)
+
+    async def get(self, key: str) -> bytes | None:
+        version, value = await self._client.hmget(self._prefix + key, ["v", "d"])
+        if version is None or not value:
+            return None
+        return bytes(value)
+
+    async def set(self, key: str, version: int, value: bytes | None) -> bool:
+        written = await self._set_script(
+            keys=[self._prefix + key], args=[version, value or b"", self._ttl_ms]
+        )
+        return bool(written)
+
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,42 @@
+"""进程内幂等键存储（单 worker）。
+
+多 worker 部署时各进程的内存互不可见，改用数据库中的共享存储
+（见 ``infrastructure.database.idempotency_store``）。
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from cachetools import TTLCache
+
+# (请求指纹, 首次处理结果)；结果为 None 表示首个请求仍在处理
+IdempotencyEntry = tuple[str, dict[str, Any] | None]
+
+
+class MemoryIdempotencyStore:
+    """有界、带 TTL 的进程内幂等结果存储；超出上限时淘汰最早的键。"""
+
+    def __init__(self, *, maxsize: int = 10000, ttl_seconds: float = 3600) -> None:
+        self._cache: TTLCache[tuple[str, str], IdempotencyEntry] = TTLCache(
+            maxsize=maxsize, ttl=ttl_seconds
+        )
+
+    async def claim(
+        self, key: tuple[str, str], fingerprint: str
+    ) -> IdempotencyEntry | None:
+        entry = self._cache.get(key)
+        if entry is not None:
+            return entry
+        self._cache[key] = (fingerprint, None)
+        return None
+
+    async def complete(
+        self, key: tuple[str, str], fingerprint: str, result: dict[str, Any]
+    ) -> None:
+        self._cache[key] = (fingerprint, result)
+
+    async def release(self, key: tuple[str, str]) -> None:
+        entry = self._cache.get(key)
+        if entry is not None and entry[1] is None:
+            del self._cache[key]
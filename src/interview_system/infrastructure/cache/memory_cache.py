@@ -1,21 +1,120 @@
-"""内存缓存（TTL）。"""
+"""会话缓存（TTL，带版本）。
+
+说明：
+- 存储由可替换的后端负责（见 ``backends.py``）：进程内、共享 SQLite 文件或 Redis
+- 会话按状态版本写入：旧版本不会覆盖新版本；保存冲突或删除时写入占位，
+  延迟到达的旧版本写入不会使其重新可见
+- 缓存不保证读到最新状态：数据库提交与缓存写入之间，其他 worker 仍可能读到上一版本
+  （基于旧版本的保存会因版本校验被拒绝）；缓存写入失败时尽量使该会话的旧条目失效，
+  失效也失败时旧条目最长保留到 TTL
+- 条目序列化为 JSON，每次读取都得到独立的对象
+"""
 
 from __future__ import annotations
 
-from cachetools import TTLCache
+import json
+import logging
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from interview_system.domain.entities.session import Session, SessionStatus
+from interview_system.infrastructure.cache.backends import (
+    CacheBackend,
+    MemoryCacheBackend,
+)
+
+logger = logging.getLogger(__name__)
+
+# 已删除会话的占位版本：高于任何实际版本
+_DELETED_VERSION = 2**62
+
 
-from interview_system.domain.entities.session import Session
+def encode_session(session: Session) -> bytes:
+    return json.dumps(
+        {
+            "id": str(session.id),
+            "user_name": session.user_name,
+            "created_at": session.created_at.isoformat(),
+            "status": session.status.value,
+            "current_question_idx": session.current_question_idx,
+            "selected_topics": session.selected_topics,
+            "is_followup": session.is_followup,
+            "current_followup_is_ai": session.current_followup_is_ai,
+            "current_followup_count": session.current_followup_count,
+            "current_followup_question": session.current_followup_question,
+            "version": session.version,
+            "rewound_version": session.rewound_version,
+            "updated_at": session.updated_at.isoformat()
+            if session.updated_at
+            else None,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def decode_session(raw: bytes) -> Session:
+    data: dict[str, Any] = json.loads(raw)
+    updated_at = data["updated_at"]
+    return Session(
+        id=UUID(data["id"]),
+        user_name=data["user_name"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        status=SessionStatus(data["status"]),
+        current_question_idx=data["current_question_idx"],
+        selected_topics=data["selected_topics"],
+        is_followup=data["is_followup"],
+        current_followup_is_ai=data["current_followup_is_ai"],
+        current_followup_count=data["current_followup_count"],
+        current_followup_question=data["current_followup_question"],
+        version=data["version"],
+        rewound_version=data["rewound_version"],
+        updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+    )
 
 
 class SessionCache:
-    def __init__(self, *, maxsize: int = 256, ttl_seconds: int = 300) -> None:
-        self._cache: TTLCache[str, Session] = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+    def __init__(
+        self,
+        *,
+        maxsize: int = 256,
+        ttl_seconds: int = 300,
+        backend: CacheBackend | None = None,
+    ) -> None:
+        self._backend = backend or MemoryCacheBackend(
+            maxsize=maxsize, ttl_seconds=ttl_seconds
+        )
+
+    async def get(self, session_id: str) -> Session | None:
+        try:
+            raw = await self._backend.get(session_id)
+            return decode_session(raw) if raw is not None else None
+        except Exception:
+            logger.warning("读取会话缓存失败: %s", session_id, exc_info=True)
+            return None
+
+    async def set(self, session: Session) -> None:
+        key = str(session.id)
+        if not await self._write(key, session.version, encode_session(session)):
+            # 未写入新版本：丢弃更早版本的条目，避免其他 worker 在 TTL 内一直读到旧状态
+            await self.invalidate(key, min_version=session.version)
+
+    async def invalidate(self, session_id: str, *, min_version: int) -> None:
+        """库中已有不低于 min_version 的版本：丢弃更早版本的缓存内容。"""
+        await self._write(session_id, min_version, None)
 
-    def get(self, session_id: str) -> Session | None:
-        return self._cache.get(session_id)
+    async def delete(self, session_id: str) -> None:
+        await self._write(session_id, _DELETED_VERSION, None)
 
-    def set(self, session: Session) -> None:
-        self._cache[str(session.id)] = session
+    async def close(self) -> None:
+        await self._backend.close()
 
-    def delete(self, session_id: str) -> None:
-        self._cache.pop(session_id, None)
+    async def _write(self, session_id: str, version: int, value: bytes | None) -> bool:
+        """写入失败（后端出错）时返回 False；版本较旧而未覆盖不算失败。"""
+        try:
+            await self._backend.set(session_id, version, value)
+        except Exception:
+            logger.warning("写入会话缓存失败: %s", session_id, exc_info=True)
+            return False
+        return True
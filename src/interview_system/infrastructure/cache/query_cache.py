@@ -0,0 +1,24 @@
+"""查询结果缓存（TTL），用于后台统计等可容忍短暂过期的结果。"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from typing import Any
+
+from cachetools import TTLCache
+
+
+class QueryCache:
+    def __init__(self, *, maxsize: int = 512, ttl_seconds: float = 30) -> None:
+        self._cache: TTLCache[Hashable, Any] = TTLCache(
+            maxsize=maxsize, ttl=ttl_seconds
+        )
+
+    def get(self, key: Hashable) -> Any | None:
+        return self._cache.get(key)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._cache[key] = value
+
+    def clear(self) -> None:
+        self._cache.clear()
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
-from interview_system.infrastructure.database.connection import AsyncDatabase
+from interview_system.infrastructure.database.connection import (
+    AsyncDatabase,
+    SqlitePragmas,
+)
+from interview_system.infrastructure.database.write_buffer import SessionStateBuffer
 
-__all__ = ["AsyncDatabase"]
+__all__ = ["AsyncDatabase", "SessionStateBuffer", "SqlitePragmas"]
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any, AsyncIterator
 
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -13,8 +16,41 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.pool import StaticPool
+from sqlalchemy.util import await_only
 
-from interview_system.infrastructure.database.migrations import run_migrations
+from interview_system.infrastructure.database.migrations import (
+    FTS_TABLE,
+    run_migrations,
+)
+
+
+_SYNCHRONOUS_NAMES = {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"}
+_WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE", "REPLACE", "CREATE", "DROP", "ALTER")
+_TEMP_STORE_NAMES = {0: "DEFAULT", 1: "FILE", 2: "MEMORY"}
+
+
+@dataclass(frozen=True, slots=True)
+class SqlitePragmas:
+    """SQLite 连接级调优参数（每个新连接建立时执行）。"""
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5000
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size: int = -20000  # 负数表示 KiB
+    temp_store: str = "MEMORY"
+
+    def statements(self, *, include_journal_mode: bool = True) -> list[str]:
+        out = (
+            [f"PRAGMA journal_mode={self.journal_mode}"] if include_journal_mode else []
+        )
+        return out + [
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}",
+            f"PRAGMA mmap_size={int(self.mmap_size)}",
+            f"PRAGMA cache_size={int(self.cache_size)}",
+            f"PRAGMA temp_store={self.temp_store}",
+        ]
 
 
 class AsyncDatabase:
@@ -27,6 +63,11 @@ class AsyncDatabase:
         echo: bool = False,
         pool_size: int = 5,
         max_overflow: int = 10,
+        sqlite_pragmas: SqlitePragmas | None = None,
+        read_database_url: str | None = None,
+        read_engine: bool = True,
+        read_pool_size: int = 3,
+        read_statement_timeout_ms: int = 0,
     ) -> None:
         self._database_url = self._normalize_url(database_url)
         self.engine = self._create_engine(
@@ -35,11 +76,97 @@ class AsyncDatabase:
             pool_size=pool_size,
             max_overflow=max_overflow,
         )
+        self._sqlite_pragmas = sqlite_pragmas if self.is_sqlite else None
+        if self._sqlite_pragmas is not None:
+            _install_pragmas(self.engine, self._sqlite_pragmas)
         self._sessionmaker: async_sessionmaker[AsyncSession] = async_sessionmaker(
             self.engine,
             expire_on_commit=False,
         )
 
+        # 写入版本号：主引擎上执行过写语句的事务提交时递增，用于查询结果缓存失效
+        # （健康检查等只读事务提交不影响缓存命中）
+        self._write_version = 0
+        event.listen(self.engine.sync_engine, "after_cursor_execute", _track_writes)
+        event.listen(self.engine.sync_engine, "commit", self._bump_write_version)
+        event.listen(self.engine.sync_engine, "rollback", _reset_writes)
+
+        self.fts_enabled = False
+        self._read_mode = "shared"
+        self.read_engine: AsyncEngine | None = None
+        if read_engine:
+            self.read_engine = self._create_read_engine(
+                read_database_url,
+                echo=echo,
+                pool_size=read_pool_size,
+                statement_timeout_ms=read_statement_timeout_ms,
+            )
+        self._read_sessionmaker = (
+            async_sessionmaker(self.read_engine, expire_on_commit=False)
+            if self.read_engine is not None
+            else self._sessionmaker
+        )
+        # :memory: 库所有会话共用同一连接，并发的只读会话需串行执行
+        self._shared_read_lock = (
+            asyncio.Lock() if self.read_engine is None and self.is_memory else None
+        )
+
+    @property
+    def is_sqlite(self) -> bool:
+        return self._database_url.startswith("sqlite+aiosqlite://")
+
+    @property
+    def is_memory(self) -> bool:
+        return self.is_sqlite and ":memory:" in self._database_url
+
+    @property
+    def write_version(self) -> int:
+        return self._write_version
+
+    def _bump_write_version(self, conn) -> None:
+        if conn.info.pop("wrote", False):
+            self._write_version += 1
+
+    @property
+    def read_engine_mode(self) -> str:
+        """只读查询所用连接：replica / readonly（同库只读连接池）/ shared（与写共用）。"""
+        return self._read_mode
+
+    def _create_read_engine(
+        self,
+        read_database_url: str | None,
+        *,
+        echo: bool,
+        pool_size: int,
+        statement_timeout_ms: int,
+    ) -> AsyncEngine | None:
+        if read_database_url:
+            url = self._normalize_url(read_database_url)
+            self._read_mode = "replica"
+        elif self.is_sqlite and not self.is_memory:
+            # WAL 模式下读连接不阻塞写入；:memory: 库无法跨连接共享，仍走主连接
+            url = self._database_url
+            self._read_mode = "readonly"
+        else:
+            return None
+
+        engine = create_async_engine(
+            url,
+            echo=echo,
+            pool_size=max(1, int(pool_size)),
+            max_overflow=0,
+            connect_args={"check_same_thread": False}
+            if url.startswith("sqlite+aiosqlite://")
+            else {},
+        )
+        if url.startswith("sqlite+aiosqlite://"):
+            _install_read_only(
+                engine,
+                pragmas=self._sqlite_pragmas,
+                statement_timeout_ms=int(statement_timeout_ms),
+            )
+        return engine
+
     @staticmethod
     def _normalize_url(url: str) -> str:
         if url.startswith("sqlite://"):
@@ -77,6 +204,12 @@ class AsyncDatabase:
     async def init(self) -> None:
         """初始化数据库（建表/迁移）。"""
         await run_migrations(engine=self.engine)
+        if self.is_sqlite:
+            result = await self.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name",
+                {"name": FTS_TABLE},
+            )
+            self.fts_enabled = result.first() is not None
 
     @asynccontextmanager
     async def session(self) -> AsyncIterator[AsyncSession]:
@@ -84,6 +217,22 @@ class AsyncDatabase:
         async with self._sessionmaker() as session:
             yield session
 
+    @asynccontextmanager
+    async def read_session(self) -> AsyncIterator[AsyncSession]:
+        """获取只读 AsyncSession（后台统计/导出等重查询，使用独立连接池）。
+
+        SQLite 只读连接上可通过 ``execution_options(statement_timeout_ms=...)``
+        覆盖单条语句的超时（0 表示不限制）。
+        """
+        if self._shared_read_lock is None:
+            async with self._read_sessionmaker() as session:
+                yield session
+            return
+
+        async with self._shared_read_lock:
+            async with self._read_sessionmaker() as session:
+                yield session
+
     @asynccontextmanager
     async def transaction(self) -> AsyncIterator[AsyncSession]:
         """获取带事务的 AsyncSession（自动 commit/rollback）。"""
@@ -101,6 +250,106 @@ class AsyncDatabase:
         await self.execute("SELECT 1")
         return True
 
+    async def sqlite_settings(self) -> dict[str, Any] | None:
+        """读取当前连接上实际生效的 SQLite 参数（非 SQLite 返回 None）。"""
+        if not self.is_sqlite:
+            return None
+
+        async with self.engine.connect() as conn:
+
+            async def pragma(name: str) -> Any:
+                return (await conn.execute(text(f"PRAGMA {name}"))).scalar()
+
+            synchronous = await pragma("synchronous")
+            temp_store = await pragma("temp_store")
+            return {
+                "tuned": self._sqlite_pragmas is not None,
+                "journal_mode": str(await pragma("journal_mode")).upper(),
+                "synchronous": _SYNCHRONOUS_NAMES.get(synchronous, synchronous),
+                "busy_timeout_ms": await pragma("busy_timeout"),
+                "mmap_size": await pragma("mmap_size"),
+                "cache_size": await pragma("cache_size"),
+                "temp_store": _TEMP_STORE_NAMES.get(temp_store, temp_store),
+            }
+
     async def dispose(self) -> None:
         """释放连接池。"""
+        if self.read_engine is not None:
+            await self.read_engine.dispose()
         await self.engine.dispose()
+
+
+def _track_writes(conn, _cursor, statement, _params, context, _executemany):
+    if conn.info.get("wrote"):
+        return
+    if context is not None and (
+        context.isinsert or context.isupdate or context.isdelete
+    ):
+        conn.info["wrote"] = True
+    elif statement.lstrip()[:7].upper().startswith(_WRITE_PREFIXES):
+        # text() 原生 SQL 不带语句类型标记
+        conn.info["wrote"] = True
+
+
+def _reset_writes(conn) -> None:
+    conn.info.pop("wrote", None)
+
+
+def _install_pragmas(engine: AsyncEngine, pragmas: SqlitePragmas) -> None:
+    statements = pragmas.statements()
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def _install_read_only(
+    engine: AsyncEngine,
+    *,
+    pragmas: SqlitePragmas | None,
+    statement_timeout_ms: int,
+) -> None:
+    """SQLite 只读连接：query_only + 基于 progress handler 的语句超时。"""
+    statements = (
+        pragmas.statements(include_journal_mode=False) if pragmas is not None else []
+    )
+    statements.append("PRAGMA query_only=ON")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+        deadline: list[float | None] = [None]
+        connection_record.info["statement_deadline"] = deadline
+
+        def _check_deadline() -> int:
+            expires = deadline[0]
+            return 1 if expires is not None and time.monotonic() > expires else 0
+
+        await_only(
+            dbapi_connection.driver_connection.set_progress_handler(
+                _check_deadline, 1000
+            )
+        )
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _arm_deadline(conn, _cursor, _statement, _params, context, _executemany):
+        deadline = conn.info.get("statement_deadline")
+        if deadline is None:
+            return
+        timeout_ms = statement_timeout_ms
+        if context is not None:
+            timeout_ms = int(
+                context.execution_options.get("statement_timeout_ms", timeout_ms)
+            )
+        deadline[0] = time.monotonic() + timeout_ms / 1000 if timeout_ms > 0 else None
@@ -0,0 +1,126 @@
+"""数据库中的导出任务状态（多 worker 共享）。
+
+说明：
+- 任务由提交它的 worker 执行，执行方把状态与进度写入 export_jobs 表并定期刷新心跳；
+  其他 worker 上的查询、下载与删除请求按表中的状态处理（导出文件位于各 worker 共用的 EXPORT_DIR）
+- 排队与执行中的任务数上限按全部 worker 合计检查
+- 执行方异常退出后心跳不再刷新，超时的任务标记为失败，由任一 worker 清理其文件
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import delete, func, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from interview_system.infrastructure.database.connection import AsyncDatabase
+from interview_system.infrastructure.database.models import ExportJobModel
+
+_PENDING_STATUSES = ("queued", "running")
+_FIELDS = [c.name for c in ExportJobModel.__table__.columns if c.name != "heartbeat_at"]
+
+
+class SqlExportJobStore:
+    """导出任务记录为字典，键与 ExportJob 字段一致（filters 以 JSON 存储）。"""
+
+    def __init__(self, db: AsyncDatabase) -> None:
+        self._db = db
+
+    async def insert(self, record: dict[str, Any], *, max_pending: int) -> bool:
+        """排队与执行中的任务少于 max_pending 时登记任务并返回 True。"""
+        values = {
+            **record,
+            "filters": json.dumps(record["filters"], default=str),
+            "heartbeat_at": time.time(),
+        }
+        pending = (
+            select(func.count())
+            .select_from(ExportJobModel)
+            .where(ExportJobModel.status.in_(_PENDING_STATUSES))
+            .scalar_subquery()
+        )
+        # 计数与插入在同一条语句中完成，多个 worker 同时提交时不会超过上限
+        stmt = insert(ExportJobModel).from_select(
+            list(values),
+            select(*(literal(v) for v in values.values())).where(pending < max_pending),
+        )
+        async with self._db.engine.begin() as conn:
+            result = await conn.execute(stmt)
+        return bool(result.rowcount)
+
+    async def update(self, job_id: str, fields: dict[str, Any]) -> bool:
+        """更新状态与进度并刷新心跳；任务已被删除时返回 False。"""
+        async with self._db.engine.begin() as conn:
+            result = await conn.execute(
+                update(ExportJobModel)
+                .where(ExportJobModel.id == job_id)
+                .values(**fields, heartbeat_at=time.time())
+            )
+        return bool(result.rowcount)
+
+    async def get(self, job_id: str) -> dict[str, Any] | None:
+        async with self._db.engine.connect() as conn:
+            row = (
+                await conn.execute(
+                    select(
+                        *(ExportJobModel.__table__.c[name] for name in _FIELDS)
+                    ).where(ExportJobModel.id == job_id)
+                )
+            ).first()
+        if row is None:
+            return None
+        record = dict(row._mapping)
+        record["filters"] = json.loads(record["filters"])
+        return record
+
+    async def delete(self, job_id: str) -> bool:
+        async with self._db.engine.begin() as conn:
+            result = await conn.execute(
+                delete(ExportJobModel).where(ExportJobModel.id == job_id)
+            )
+        return bool(result.rowcount)
+
+    async def existing_ids(self, job_ids: Iterable[str]) -> set[str]:
+        ids = list(job_ids)
+        if not ids:
+            return set()
+        async with self._db.engine.connect() as conn:
+            result = await conn.execute(
+                select(ExportJobModel.id).where(ExportJobModel.id.in_(ids))
+            )
+            return set(result.scalars())
+
+    async def fail_stale(self, *, heartbeat_before: float, now: float) -> list[str]:
+        """把心跳早于 heartbeat_before 的排队/执行中任务标记为失败，返回其 id。"""
+        async with self._db.engine.begin() as conn:
+            ids = await self._ids(
+                conn,
+                ExportJobModel.status.in_(_PENDING_STATUSES),
+                ExportJobModel.heartbeat_at < heartbeat_before,
+            )
+            if ids:
+                await conn.execute(
+                    update(ExportJobModel)
+                    .where(ExportJobModel.id.in_(ids))
+                    .values(status="failed", error="worker exited", finished_at=now)
+                )
+        return ids
+
+    async def expire(self, *, finished_before: float) -> list[str]:
+        """删除结束时间不晚于 finished_before 的任务，返回其 id。"""
+        async with self._db.engine.begin() as conn:
+            ids = await self._ids(conn, ExportJobModel.finished_at <= finished_before)
+            if ids:
+                await conn.execute(
+                    delete(ExportJobModel).where(ExportJobModel.id.in_(ids))
+                )
+        return ids
+
+    @staticmethod
+    async def _ids(conn: AsyncConnection, *conditions: Any) -> list[str]:
+        result = await conn.execute(select(ExportJobModel.id).where(*conditions))
+        return list(result.scalars())
@@ -0,0 +1,119 @@
+"""数据库中的幂等键存储（多 worker 共享）。
+
+说明：
+- 首个请求插入一条结果为空的登记（租约），其他 worker 上的重试看到登记后等待结果，
+  不会重复处理（重复调用 LLM、重复写入对话）
+- 处理成功后写入结果并按 TTL 保留；处理失败时删除登记，重试按当前状态重新处理
+- 持有登记的 worker 异常退出时，登记在租约到期后可被重新获取
+- 过期登记在获取时顺带清理（每隔若干次执行一次全表清理）
+- 登记依赖 INSERT ... ON CONFLICT DO NOTHING，按连接的方言生成（SQLite / PostgreSQL）
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import and_, delete, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from interview_system.infrastructure.cache.idempotency import IdempotencyEntry
+from interview_system.infrastructure.database.connection import AsyncDatabase
+from interview_system.infrastructure.database.models import IdempotencyKeyModel
+
+_PURGE_EVERY = 256
+
+# 支持 ON CONFLICT DO NOTHING 的方言
+_INSERTS: dict[str, Callable[..., Any]] = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _match(key: tuple[str, str]) -> Any:
+    return and_(
+        IdempotencyKeyModel.session_id == key[0],
+        IdempotencyKeyModel.idempotency_key == key[1],
+    )
+
+
+class SqlIdempotencyStore:
+    """幂等键登记与结果保存在主库 idempotency_keys 表中。"""
+
+    def __init__(
+        self,
+        db: AsyncDatabase,
+        *,
+        ttl_seconds: float = 3600,
+        lease_seconds: float = 300,
+    ) -> None:
+        dialect = db.engine.dialect.name
+        if dialect not in _INSERTS:
+            raise ValueError(f"数据库共享的幂等键存储不支持 {dialect}")
+        self._insert = _INSERTS[dialect]
+        self._db = db
+        self._ttl_ms = int(ttl_seconds * 1000)
+        self._lease_ms = int(lease_seconds * 1000)
+        self._claims = itertools.count(1)
+
+    async def claim(
+        self, key: tuple[str, str], fingerprint: str
+    ) -> IdempotencyEntry | None:
+        now = _now_ms()
+        purge_all = next(self._claims) % _PURGE_EVERY == 0
+        async with self._db.engine.begin() as conn:
+            expired = IdempotencyKeyModel.expires_at_ms <= now
+            await conn.execute(
+                delete(IdempotencyKeyModel).where(
+                    expired if purge_all else and_(_match(key), expired)
+                )
+            )
+            inserted = await conn.execute(
+                self._insert(IdempotencyKeyModel)
+                .values(
+                    session_id=key[0],
+                    idempotency_key=key[1],
+                    fingerprint=fingerprint,
+                    result=None,
+                    expires_at_ms=now + self._lease_ms,
+                )
+                .on_conflict_do_nothing()
+            )
+            if inserted.rowcount == 1:
+                return None
+            row = (
+                await conn.execute(
+                    select(
+                        IdempotencyKeyModel.fingerprint, IdempotencyKeyModel.result
+                    ).where(_match(key))
+                )
+            ).one()
+        return row.fingerprint, None if row.result is None else json.loads(row.result)
+
+    async def complete(
+        self, key: tuple[str, str], fingerprint: str, result: dict[str, Any]
+    ) -> None:
+        async with self._db.engine.begin() as conn:
+            await conn.execute(
+                update(IdempotencyKeyModel)
+                .where(_match(key), IdempotencyKeyModel.fingerprint == fingerprint)
+                .values(
+                    result=json.dumps(result, ensure_ascii=False),
+                    expires_at_ms=_now_ms() + self._ttl_ms,
+                )
+            )
+
+    async def release(self, key: tuple[str, str]) -> None:
+        async with self._db.engine.begin() as conn:
+            await conn.execute(
+                delete(IdempotencyKeyModel).where(
+                    _match(key), IdempotencyKeyModel.result.is_(None)
+                )
+            )
@@ -1,41 +1,559 @@
-"""轻量迁移脚本（SQLite）。
+"""版本化迁移（SQLite）。
 
 说明：
-- 该项目当前未引入 Alembic；这里提供最小可用的迁移/建表能力
-- 对于已存在的表，仅补齐缺失字段与索引（幂等）
+- 该项目当前未引入 Alembic；这里提供最小可用的版本化迁移能力
+- schema_version 表记录已执行的迁移步骤；库结构已是最新时启动只需一次查询
+- 每个步骤必须幂等：中途中断后重启会从未完成的步骤继续
+- 数据回填按批次执行，每批独立事务，避免长时间持有写锁
 """
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
 from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from interview_system.infrastructure.database.models import (
+    Base,
+    DataVersionModel,
+    ExportJobModel,
+    IdempotencyKeyModel,
+    MessageRollupModel,
+    SessionRollupModel,
+)
+
+DEFAULT_BACKFILL_BATCH_SIZE = 1000
+
+# 字符串时间（"%Y-%m-%d %H:%M:%S"，UTC）-> 毫秒时间戳；无法解析时为 NULL（不参与时间筛选与汇总）
+_EPOCH_MS_SQL = "CAST(strftime('%s', {column}) AS INTEGER) * 1000"
+# 回填条件：无法解析的行保持 NULL，不再被选中，分批回填得以结束
+_EPOCH_MS_PENDING_SQL = "{target} IS NULL AND strftime('%s', {column}) IS NOT NULL"
+
+# 所属会话开始时间未知（NULL 或会话不存在）时，对话汇总行的会话小时取该值（不是任何整点）
+UNKNOWN_SESSION_HOUR_MS = -1
+
+_CREATE_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    applied_at TEXT NOT NULL
+)
+"""
+
+
+_CREATE_PROGRESS_TABLE = """
+CREATE TABLE IF NOT EXISTS migration_progress (
+    name TEXT PRIMARY KEY,
+    last_id INTEGER NOT NULL,
+    upper_id INTEGER NOT NULL
+)
+"""
+
+FTS_TABLE = "conversation_fts"
+
+_FTS_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS conversation_fts_ai AFTER INSERT ON conversation_logs BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, question, answer)
+        VALUES (new.id, new.question, new.answer);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS conversation_fts_ad AFTER DELETE ON conversation_logs BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, question, answer)
+        VALUES ('delete', old.id, old.question, old.answer);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS conversation_fts_au
+    AFTER UPDATE OF question, answer ON conversation_logs BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, question, answer)
+        VALUES ('delete', old.id, old.question, old.answer);
+        INSERT INTO {FTS_TABLE}(rowid, question, answer)
+        VALUES (new.id, new.question, new.answer);
+    END
+    """,
+]
+
+# 后台概览的小时汇总表：触发器随写入增量维护，聚合查询只需扫描汇总行
+_HOUR_SQL = "(({value}) / 3600000) * 3600000"
+_SESSION_HOUR_SQL = f"COALESCE({_HOUR_SQL}, {UNKNOWN_SESSION_HOUR_MS})"
+
+_SESSION_ROLLUP_UPSERT = """
+INSERT INTO admin_rollup_sessions (hour_ms, user_name, sessions)
+SELECT {hour}, {ref}.user_name, {sign}1 WHERE {ref}.start_time_ms IS NOT NULL
+ON CONFLICT (hour_ms, user_name) DO UPDATE SET sessions = sessions + excluded.sessions;
+"""
+
+_MESSAGE_ROLLUP_UPSERT = """
+INSERT INTO admin_rollup_messages
+    (hour_ms, session_hour_ms, user_name, topic, messages, depth_sum)
+SELECT {hour}, {session_hour}, COALESCE(s.user_name, ''), {ref}.topic,
+       {sign}1, {sign}{ref}.depth_score
+FROM (SELECT 1) LEFT JOIN sessions AS s ON s.session_id = {ref}.session_id
+WHERE {ref}.timestamp_ms IS NOT NULL
+ON CONFLICT (hour_ms, session_hour_ms, user_name, topic) DO UPDATE SET
+    messages = messages + excluded.messages, depth_sum = depth_sum + excluded.depth_sum;
+"""
+
+# 会话改名/改开始时间时，整体迁移该会话已有消息的汇总行
+_MESSAGE_ROLLUP_MOVE = """
+INSERT INTO admin_rollup_messages
+    (hour_ms, session_hour_ms, user_name, topic, messages, depth_sum)
+SELECT {log_hour}, {session_hour}, {ref}.user_name, l.topic,
+       {sign}COUNT(*), {sign}SUM(l.depth_score)
+FROM conversation_logs AS l
+WHERE l.session_id = {ref}.session_id AND l.timestamp_ms IS NOT NULL
+GROUP BY 1, 4
+ON CONFLICT (hour_ms, session_hour_ms, user_name, topic) DO UPDATE SET
+    messages = messages + excluded.messages, depth_sum = depth_sum + excluded.depth_sum;
+"""
+
+_SESSION_LOG_HOURS = (
+    "SELECT DISTINCT ((timestamp_ms) / 3600000) * 3600000 "
+    "FROM conversation_logs WHERE session_id = old.session_id"
+)
+
+
+def _session_rollup(ref: str, sign: str) -> str:
+    return _SESSION_ROLLUP_UPSERT.format(
+        hour=_HOUR_SQL.format(value=f"{ref}.start_time_ms"), ref=ref, sign=sign
+    )
+
 
-from interview_system.infrastructure.database.models import Base
+def _message_rollup(ref: str, sign: str) -> str:
+    return _MESSAGE_ROLLUP_UPSERT.format(
+        hour=_HOUR_SQL.format(value=f"{ref}.timestamp_ms"),
+        session_hour=_SESSION_HOUR_SQL.format(value="s.start_time_ms"),
+        ref=ref,
+        sign=sign,
+    )
 
 
-async def run_migrations(*, engine) -> None:
-    """执行迁移（幂等）。"""
+def _session_rollup_cleanup(ref: str) -> str:
+    hour = _HOUR_SQL.format(value=f"{ref}.start_time_ms")
+    return (
+        f"DELETE FROM admin_rollup_sessions WHERE hour_ms = {hour} "
+        f"AND user_name = {ref}.user_name AND sessions <= 0;"
+    )
+
+
+def _message_rollup_cleanup(hours: str) -> str:
+    # 仅清理受影响小时内计数归零的行（按主键前缀定位，避免全表扫描）
+    return f"DELETE FROM admin_rollup_messages WHERE hour_ms IN ({hours}) AND messages <= 0;"
+
+
+def _message_rollup_move(ref: str, sign: str) -> str:
+    return _MESSAGE_ROLLUP_MOVE.format(
+        log_hour=_HOUR_SQL.format(value="l.timestamp_ms"),
+        session_hour=_SESSION_HOUR_SQL.format(value=f"{ref}.start_time_ms"),
+        ref=ref,
+        sign=sign,
+    )
+
+
+_ROLLUP_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS admin_rollup_sessions_ai AFTER INSERT ON sessions BEGIN
+        {_session_rollup("new", "")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS admin_rollup_sessions_ad AFTER DELETE ON sessions BEGIN
+        {_session_rollup("old", "-")}
+        {_session_rollup_cleanup("old")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS admin_rollup_sessions_au
+    AFTER UPDATE OF user_name, start_time_ms ON sessions
+    WHEN old.user_name IS NOT new.user_name OR old.start_time_ms IS NOT new.start_time_ms
+    BEGIN
+        {_session_rollup("old", "-")}
+        {_session_rollup("new", "")}
+        {_message_rollup_move("old", "-")}
+        {_message_rollup_move("new", "")}
+        {_session_rollup_cleanup("old")}
+        {_message_rollup_cleanup(_SESSION_LOG_HOURS)}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS admin_rollup_messages_ai
+    AFTER INSERT ON conversation_logs BEGIN
+        {_message_rollup("new", "")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS admin_rollup_messages_ad
+    AFTER DELETE ON conversation_logs BEGIN
+        {_message_rollup("old", "-")}
+        {_message_rollup_cleanup(_HOUR_SQL.format(value="old.timestamp_ms"))}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS admin_rollup_messages_au
+    AFTER UPDATE OF session_id, timestamp_ms, topic, depth_score ON conversation_logs
+    BEGIN
+        {_message_rollup("old", "-")}
+        {_message_rollup("new", "")}
+        {_message_rollup_cleanup(_HOUR_SQL.format(value="old.timestamp_ms"))}
+    END
+    """,
+]
+
+
+# 会话/对话的任何写入都递增 data_version（多 worker 的后台查询缓存据此失效）
+_DATA_VERSION_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS data_version_{table}_{suffix}
+    AFTER {event} ON {table} BEGIN
+        UPDATE data_version SET version = version + 1 WHERE id = 1;
+    END
+    """
+    for table in ("sessions", "conversation_logs")
+    for suffix, event in (("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE"))
+]
+
+
+@dataclass(frozen=True, slots=True)
+class Migration:
+    version: int
+    name: str
+    apply: Callable[[AsyncEngine, int], Awaitable[None]]
+
+
+async def _add_missing_columns(
+    conn: AsyncConnection, table: str, required: dict[str, str]
+) -> None:
+    result = await conn.execute(text(f"PRAGMA table_info({table})"))
+    existing = {row[1] for row in result.fetchall()}  # row[1] = name
+    for column_name, column_def in required.items():
+        if column_name not in existing:
+            await conn.execute(
+                text(f"ALTER TABLE {table} ADD COLUMN {column_name} {column_def}")
+            )
+
+
+async def _create_index(engine: AsyncEngine, ddl: str) -> None:
+    # 每个索引单独事务，缩短写锁持有时间
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text(ddl))
+
+
+async def backfill_in_batches(
+    engine: AsyncEngine, *, table: str, assignment: str, pending: str, batch_size: int
+) -> int:
+    """分批执行 ``UPDATE table SET assignment WHERE pending``，返回更新行数。
 
-        # sessions 表补齐追问相关字段（幂等）
-        result = await conn.execute(text("PRAGMA table_info(sessions)"))
-        existing = {row[1] for row in result.fetchall()}  # row[1] = name
-
-        required = {
-            "is_followup": "INTEGER DEFAULT 0",
-            "current_followup_is_ai": "INTEGER DEFAULT 0",
-            "current_followup_count": "INTEGER DEFAULT 0",
-            "current_followup_question": "TEXT DEFAULT ''",
-        }
-        for column_name, column_def in required.items():
-            if column_name not in existing:
+    ``pending`` 条件必须在行被回填后不再成立，以保证可中断、可重跑。
+    """
+    statement = text(
+        f"UPDATE {table} SET {assignment} "
+        f"WHERE rowid IN (SELECT rowid FROM {table} WHERE {pending} LIMIT :batch)"
+    )
+    total = 0
+    while True:
+        async with engine.begin() as conn:
+            result = await conn.execute(statement, {"batch": int(batch_size)})
+        if not result.rowcount:
+            return total
+        total += int(result.rowcount)
+
+
+async def backfill_by_id(
+    engine: AsyncEngine, *, name: str, statement: str, batch_size: int
+) -> int:
+    """按主键区间分批执行 ``statement``（绑定 :lo/:hi），进度与每批在同一事务提交。
+
+    适用于非幂等的回填（如向 FTS 索引插入）：中断后从 migration_progress 记录处继续，
+    不会重复处理。区间上界需在调用前由 ``migration_progress.upper_id`` 记录。
+    """
+    total = 0
+    while True:
+        async with engine.begin() as conn:
+            row = (
                 await conn.execute(
-                    text(f"ALTER TABLE sessions ADD COLUMN {column_name} {column_def}")
+                    text(
+                        "SELECT last_id, upper_id FROM migration_progress WHERE name = :name"
+                    ),
+                    {"name": name},
+                )
+            ).one()
+            lo, upper = int(row[0]), int(row[1])
+            if lo >= upper:
+                return total
+            hi = min(lo + int(batch_size), upper)
+            await conn.execute(text(statement), {"lo": lo, "hi": hi})
+            await conn.execute(
+                text("UPDATE migration_progress SET last_id = :hi WHERE name = :name"),
+                {"hi": hi, "name": name},
+            )
+        total += hi - lo
+
+
+async def _v1_baseline(engine: AsyncEngine, _batch_size: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+        # sessions 表补齐追问相关字段（兼容早期库）
+        await _add_missing_columns(
+            conn,
+            "sessions",
+            {
+                "is_followup": "INTEGER DEFAULT 0",
+                "current_followup_is_ai": "INTEGER DEFAULT 0",
+                "current_followup_count": "INTEGER DEFAULT 0",
+                "current_followup_question": "TEXT DEFAULT ''",
+            },
+        )
+
+    await _create_index(
+        engine, "CREATE INDEX IF NOT EXISTS idx_session_time ON sessions(start_time)"
+    )
+    await _create_index(
+        engine, "CREATE INDEX IF NOT EXISTS idx_topic ON conversation_logs(topic)"
+    )
+
+
+async def _v2_epoch_ms(engine: AsyncEngine, batch_size: int) -> None:
+    async with engine.begin() as conn:
+        await _add_missing_columns(conn, "sessions", {"start_time_ms": "INTEGER"})
+        await _add_missing_columns(
+            conn, "conversation_logs", {"timestamp_ms": "INTEGER"}
+        )
+
+    await backfill_in_batches(
+        engine,
+        table="sessions",
+        assignment=f"start_time_ms = {_EPOCH_MS_SQL.format(column='start_time')}",
+        pending=_EPOCH_MS_PENDING_SQL.format(
+            target="start_time_ms", column="start_time"
+        ),
+        batch_size=batch_size,
+    )
+    await backfill_in_batches(
+        engine,
+        table="conversation_logs",
+        assignment=f"timestamp_ms = {_EPOCH_MS_SQL.format(column='timestamp')}",
+        pending=_EPOCH_MS_PENDING_SQL.format(target="timestamp_ms", column="timestamp"),
+        batch_size=batch_size,
+    )
+
+    # 回填完成后再建范围索引，避免回填期间逐行维护索引
+    await _create_index(
+        engine,
+        "CREATE INDEX IF NOT EXISTS idx_session_start_ms ON sessions(start_time_ms)",
+    )
+    await _create_index(
+        engine,
+        "CREATE INDEX IF NOT EXISTS idx_log_timestamp_ms ON conversation_logs(timestamp_ms)",
+    )
+
+
+async def _v3_query_indexes(engine: AsyncEngine, _batch_size: int) -> None:
+    await _create_index(
+        engine,
+        "CREATE INDEX IF NOT EXISTS idx_session_user_time "
+        "ON sessions(user_name, start_time_ms)",
+    )
+    await _create_index(
+        engine,
+        "CREATE INDEX IF NOT EXISTS idx_session_finished_time "
+        "ON sessions(is_finished, start_time_ms)",
+    )
+    await _create_index(
+        engine,
+        "CREATE INDEX IF NOT EXISTS idx_log_topic_time "
+        "ON conversation_logs(topic, timestamp_ms)",
+    )
+    # 被上面的组合索引/毫秒列索引取代，减少写入时的索引维护
+    await _create_index(engine, "DROP INDEX IF EXISTS idx_topic")
+    await _create_index(engine, "DROP INDEX IF EXISTS idx_session_time")
+
+
+async def _v4_conversation_fts(engine: AsyncEngine, batch_size: int) -> None:
+    """对话全文索引（FTS5 trigram，支持中文子串匹配）；SQLite 不支持时跳过。"""
+    async with engine.begin() as conn:
+        try:
+            await conn.execute(
+                text(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                    "question, answer, content='conversation_logs', content_rowid='id', "
+                    "tokenize='trigram')"
                 )
+            )
+        except OperationalError:
+            return
 
+    async with engine.begin() as conn:
+        await conn.execute(text(_CREATE_PROGRESS_TABLE))
+        # 触发器与回填上界在同一事务内确定：此后新写入由触发器同步，之前的数据分批回填
+        for ddl in _FTS_TRIGGERS:
+            await conn.execute(text(ddl))
         await conn.execute(
-            text("CREATE INDEX IF NOT EXISTS idx_session_time ON sessions(start_time)")
+            text(
+                "INSERT OR IGNORE INTO migration_progress (name, last_id, upper_id) "
+                "SELECT :name, 0, COALESCE(MAX(id), 0) FROM conversation_logs"
+            ),
+            {"name": FTS_TABLE},
+        )
+
+    await backfill_by_id(
+        engine,
+        name=FTS_TABLE,
+        statement=(
+            f"INSERT INTO {FTS_TABLE}(rowid, question, answer) "
+            "SELECT id, question, answer FROM conversation_logs "
+            "WHERE id > :lo AND id <= :hi"
+        ),
+        batch_size=batch_size,
+    )
+
+
+async def _v5_admin_rollups(engine: AsyncEngine, batch_size: int) -> None:
+    """后台概览小时汇总表：触发器维护新写入，存量数据按主键区间分批回填。"""
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[
+                Base.metadata.tables[model.__tablename__]
+                for model in (SessionRollupModel, MessageRollupModel)
+            ],
         )
+        await conn.execute(text(_CREATE_PROGRESS_TABLE))
+        for ddl in _ROLLUP_TRIGGERS:
+            await conn.execute(text(ddl))
         await conn.execute(
-            text("CREATE INDEX IF NOT EXISTS idx_topic ON conversation_logs(topic)")
+            text(
+                "INSERT OR IGNORE INTO migration_progress (name, last_id, upper_id) "
+                "SELECT 'admin_rollup_sessions', 0, COALESCE(MAX(rowid), 0) FROM sessions"
+            )
         )
+        await conn.execute(
+            text(
+                "INSERT OR IGNORE INTO migration_progress (name, last_id, upper_id) "
+                "SELECT 'admin_rollup_messages', 0, COALESCE(MAX(id), 0) "
+                "FROM conversation_logs"
+            )
+        )
+
+    session_hour = _HOUR_SQL.format(value="start_time_ms")
+    await backfill_by_id(
+        engine,
+        name="admin_rollup_sessions",
+        statement=(
+            "INSERT INTO admin_rollup_sessions (hour_ms, user_name, sessions) "
+            f"SELECT {session_hour}, user_name, COUNT(*) FROM sessions "
+            "WHERE rowid > :lo AND rowid <= :hi AND start_time_ms IS NOT NULL "
+            "GROUP BY 1, 2 "
+            "ON CONFLICT (hour_ms, user_name) DO UPDATE SET "
+            "sessions = sessions + excluded.sessions"
+        ),
+        batch_size=batch_size,
+    )
+    await backfill_by_id(
+        engine,
+        name="admin_rollup_messages",
+        statement=(
+            "INSERT INTO admin_rollup_messages "
+            "(hour_ms, session_hour_ms, user_name, topic, messages, depth_sum) "
+            f"SELECT {_HOUR_SQL.format(value='l.timestamp_ms')}, "
+            f"{_SESSION_HOUR_SQL.format(value='s.start_time_ms')}, "
+            "COALESCE(s.user_name, ''), l.topic, COUNT(*), SUM(l.depth_score) "
+            "FROM conversation_logs AS l "
+            "LEFT JOIN sessions AS s ON s.session_id = l.session_id "
+            "WHERE l.id > :lo AND l.id <= :hi AND l.timestamp_ms IS NOT NULL "
+            "GROUP BY 1, 2, 3, 4 "
+            "ON CONFLICT (hour_ms, session_hour_ms, user_name, topic) DO UPDATE SET "
+            "messages = messages + excluded.messages, "
+            "depth_sum = depth_sum + excluded.depth_sum"
+        ),
+        batch_size=batch_size,
+    )
+
+
+async def _v6_session_version(engine: AsyncEngine, _batch_size: int) -> None:
+    """会话状态版本号（消息增量同步与 ETag）；存量会话从 0 开始，无需回填。"""
+    async with engine.begin() as conn:
+        await _add_missing_columns(
+            conn,
+            "sessions",
+            {
+                "version": "INTEGER NOT NULL DEFAULT 0",
+                "rewound_version": "INTEGER NOT NULL DEFAULT 0",
+            },
+        )
+
+
+async def _v7_shared_worker_state(engine: AsyncEngine, _batch_size: int) -> None:
+    """多 worker 共享的状态：数据版本号、导出任务与幂等键（无需回填）。"""
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[
+                Base.metadata.tables[model.__tablename__]
+                for model in (DataVersionModel, ExportJobModel, IdempotencyKeyModel)
+            ],
+        )
+        await conn.execute(
+            text("INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0)")
+        )
+        for ddl in _DATA_VERSION_TRIGGERS:
+            await conn.execute(text(ddl))
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "baseline_schema", _v1_baseline),
+    Migration(2, "epoch_ms_columns", _v2_epoch_ms),
+    Migration(3, "query_shape_indexes", _v3_query_indexes),
+    Migration(4, "conversation_fts", _v4_conversation_fts),
+    Migration(5, "admin_rollups", _v5_admin_rollups),
+    Migration(6, "session_version", _v6_session_version),
+    Migration(7, "shared_worker_state", _v7_shared_worker_state),
+]
+
+LATEST_SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+async def current_schema_version(engine: AsyncEngine) -> int:
+    async with engine.begin() as conn:
+        await conn.execute(text(_CREATE_VERSION_TABLE))
+        result = await conn.execute(text("SELECT MAX(version) FROM schema_version"))
+        return int(result.scalar() or 0)
+
+
+async def run_migrations(
+    *,
+    engine: AsyncEngine,
+    backfill_batch_size: int = DEFAULT_BACKFILL_BATCH_SIZE,
+    migrations: list[Migration] | None = None,
+) -> list[int]:
+    """执行尚未应用的迁移步骤，返回本次应用的版本号。"""
+    steps = MIGRATIONS if migrations is None else migrations
+    current = await current_schema_version(engine)
+    if steps and current >= steps[-1].version:
+        return []
+
+    applied: list[int] = []
+    for migration in steps:
+        if migration.version <= current:
+            continue
+        await migration.apply(engine, backfill_batch_size)
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "INSERT INTO schema_version (version, name, applied_at) "
+                    "VALUES (:version, :name, :applied_at)"
+                ),
+                {
+                    "version": migration.version,
+                    "name": migration.name,
+                    "applied_at": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S"),
+                },
+            )
+        applied.append(migration.version)
+    return applied
@@ -7,7 +7,7 @@
 
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Index, Integer, String, Text
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -24,6 +24,7 @@ class SessionModel(Base):
     user_name: Mapped[str] = mapped_column(String, nullable=False)
 
     start_time: Mapped[str] = mapped_column(String, nullable=False)
+    start_time_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
     end_time: Mapped[str | None] = mapped_column(String, nullable=True)
 
     is_finished: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -47,6 +48,9 @@ class SessionModel(Base):
         String, nullable=False, default=""
     )
 
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rewound_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
     conversation_logs: Mapped[list["ConversationLogModel"]] = relationship(
         back_populates="session",
         cascade="all, delete-orphan",
@@ -64,6 +68,7 @@ class ConversationLogModel(Base):
     )
 
     timestamp: Mapped[str] = mapped_column(String, nullable=False)
+    timestamp_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
     topic: Mapped[str] = mapped_column(String, nullable=False, default="")
     question_type: Mapped[str] = mapped_column(String, nullable=False, default="")
     question: Mapped[str] = mapped_column(Text, nullable=False, default="")
@@ -75,5 +80,78 @@ class ConversationLogModel(Base):
     session: Mapped[SessionModel] = relationship(back_populates="conversation_logs")
 
 
-Index("idx_session_time", SessionModel.start_time)
-Index("idx_topic", ConversationLogModel.topic)
+class SessionRollupModel(Base):
+    """会话小时汇总（由触发器增量维护，见 migrations._ROLLUP_TRIGGERS）。"""
+
+    __tablename__ = "admin_rollup_sessions"
+
+    hour_ms: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_name: Mapped[str] = mapped_column(String, primary_key=True)
+    sessions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class MessageRollupModel(Base):
+    """对话小时汇总：按消息所在小时、所属会话开始小时、用户、主题聚合。"""
+
+    __tablename__ = "admin_rollup_messages"
+
+    hour_ms: Mapped[int] = mapped_column(Integer, primary_key=True)
+    session_hour_ms: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_name: Mapped[str] = mapped_column(String, primary_key=True)
+    topic: Mapped[str] = mapped_column(String, primary_key=True)
+    messages: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    depth_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class DataVersionModel(Base):
+    """会话/对话写入计数（单行，由触发器递增），多 worker 共用的查询缓存版本号。"""
+
+    __tablename__ = "data_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class ExportJobModel(Base):
+    """后台导出任务状态（多 worker 共享；执行任务的 worker 定期刷新 heartbeat_at）。"""
+
+    __tablename__ = "export_jobs"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    scope: Mapped[str] = mapped_column(String, nullable=False)
+    format: Mapped[str] = mapped_column(String, nullable=False)
+    compression: Mapped[str] = mapped_column(String, nullable=False, default="none")
+    filters: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    filename: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[float] = mapped_column(Float, nullable=False)
+    started_at: Mapped[float | None] = mapped_column(Float, nullable=True)
+    finished_at: Mapped[float | None] = mapped_column(Float, nullable=True)
+    rows_written: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_rows: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    heartbeat_at: Mapped[float] = mapped_column(Float, nullable=False)
+
+
+class IdempotencyKeyModel(Base):
+    """幂等键登记（多 worker 共享）：result 为空表示首个请求仍在处理。"""
+
+    __tablename__ = "idempotency_keys"
+
+    session_id: Mapped[str] = mapped_column(String, primary_key=True)
+    idempotency_key: Mapped[str] = mapped_column(String, primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String, nullable=False)
+    result: Mapped[str | None] = mapped_column(Text, nullable=True)
+    expires_at_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+# 索引按实际查询形态规划（见 tests/integration/test_query_plans.py）：
+# - conversation_logs.session_id 的单列索引在 SQLite 中隐含 rowid(id)，已覆盖“按会话按 id 排序”
+Index("idx_session_start_ms", SessionModel.start_time_ms)
+Index("idx_session_user_time", SessionModel.user_name, SessionModel.start_time_ms)
+Index("idx_session_finished_time", SessionModel.is_finished, SessionModel.start_time_ms)
+Index("idx_log_timestamp_ms", ConversationLogModel.timestamp_ms)
+Index(
+    "idx_log_topic_time", ConversationLogModel.topic, ConversationLogModel.timestamp_ms
+)
+Index("idx_idempotency_expires", IdempotencyKeyModel.expires_at_ms)
@@ -2,118 +2,382 @@
 
 from __future__ import annotations
 
+import base64
+import json
+from collections.abc import AsyncIterator, Hashable, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timezone
-
-from sqlalchemy import and_, func, or_, select
+from typing import Any
+
+from sqlalchemy import (
+    and_,
+    column,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnClause
+from sqlalchemy.sql.selectable import Select, Subquery
 
 from interview_system.domain.repositories.admin_repository import (
     AdminConversationRow,
+    AdminPage,
     AdminRepository,
     AdminSessionRow,
     AdminTimeSeriesPoint,
     AdminTopicRow,
     AdminUserActivityRow,
+    CountMode,
 )
+from interview_system.infrastructure.cache.query_cache import QueryCache
 from interview_system.infrastructure.database.connection import AsyncDatabase
+from interview_system.infrastructure.database.migrations import (
+    FTS_TABLE,
+    UNKNOWN_SESSION_HOUR_MS,
+)
 from interview_system.infrastructure.database.models import (
     ConversationLogModel,
+    DataVersionModel,
+    MessageRollupModel,
     SessionModel,
+    SessionRollupModel,
 )
 
-_TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+# trigram 分词：关键字至少 3 个字符才能走全文索引，更短的回退到 LIKE
+_FTS_MIN_KEYWORD_LENGTH = 3
+_fts = table(FTS_TABLE, column("rowid"))
+_fts_ref: ColumnClause[Any] = literal_column(FTS_TABLE)
+
+_HOUR_MS = 3600 * 1000
+_DAY_MS = 24 * _HOUR_MS
+_BUCKET_LABEL_FORMATS = {"hour": "%Y-%m-%d %H", "day": "%Y-%m-%d"}
 
 
-def _to_utc_text(dt: datetime) -> str:
+def _to_epoch_ms(dt: datetime) -> int:
     normalized = dt
     if dt.tzinfo is None:
         normalized = dt.replace(tzinfo=timezone.utc)
-    return normalized.astimezone(timezone.utc).strftime(_TS_FORMAT)
+    return int(normalized.timestamp() * 1000)
 
 
 def _bucket_expr(column, bucket: str):  # noqa: ANN001
-    if bucket == "hour":
-        return func.substr(column, 1, 13)
-    return func.substr(column, 1, 10)
+    # 整数除法截断到桶起点（UTC），避免逐行解析字符串时间；
+    # SQLAlchemy 2 中 `/` 为真除法（同一桶内的行会得到不同的值），必须用 `//`
+    size = _HOUR_MS if bucket == "hour" else _DAY_MS
+    return (column // size) * size
+
+
+def _fts_phrase(keyword: str) -> str:
+    """将关键字转为 FTS5 短语（整体按子串匹配，转义双引号）。"""
+    return '"' + keyword.replace('"', '""') + '"'
+
+
+def _encode_cursor(payload: dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(
+    cursor: str, kind: str, fields: dict[str, type | tuple[type, ...]]
+) -> dict[str, Any]:
+    """解析不透明游标；格式不符、缺少字段或字段类型不符时抛出 ValueError。"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except ValueError as exc:
+        raise ValueError("invalid cursor") from exc
+    if not isinstance(payload, dict) or payload.get("k") != kind:
+        raise ValueError("invalid cursor")
+    for name, expected in fields.items():
+        value = payload.get(name)
+        # bool 是 int 的子类，需单独排除
+        if not isinstance(value, expected) or isinstance(value, bool):
+            raise ValueError("invalid cursor")
+    return payload
+
+
+def _bucket_label(bucket_ms: int, bucket: str) -> str:
+    return datetime.fromtimestamp(bucket_ms / 1000, tz=timezone.utc).strftime(
+        _BUCKET_LABEL_FORMATS[bucket]
+    )
+
+
+def _hour_floor(ms: int) -> int:
+    return (ms // _HOUR_MS) * _HOUR_MS
+
+
+def _hour_ceil(ms: int) -> int:
+    return -(-ms // _HOUR_MS) * _HOUR_MS
+
+
+def _ms_range(column, lo: int | None, hi: int | None) -> list[Any]:
+    conditions = []
+    if lo is not None:
+        conditions.append(column >= lo)
+    if hi is not None:
+        conditions.append(column < hi)
+    return conditions
+
+
+@dataclass(frozen=True, slots=True)
+class _RollupWindow:
+    """查询区间拆分：整点对齐的 interior 由小时汇总表回答，首尾不足一小时的 edges 回查明细。"""
+
+    start_ms: int | None
+    end_ms: int | None
+    interior: tuple[int | None, int | None] | None
+    edges: tuple[tuple[int, int], ...]
+
+
+def _rollup_window(start: datetime | None, end: datetime | None) -> _RollupWindow:
+    start_ms = _to_epoch_ms(start) if start is not None else None
+    end_ms = _to_epoch_ms(end) if end is not None else None
+    lo = _hour_ceil(start_ms) if start_ms is not None else None
+    hi = _hour_floor(end_ms) if end_ms is not None else None
+    edges: list[tuple[int, int]] = []
+    if start_ms is not None and lo is not None:
+        if end_ms is not None and hi is not None and lo > hi:
+            # 区间落在同一小时内，全部回查明细
+            return _RollupWindow(start_ms, end_ms, None, ((start_ms, end_ms),))
+        if start_ms < lo:
+            edges.append((start_ms, lo))
+    if end_ms is not None and hi is not None and hi < end_ms:
+        edges.append((hi, end_ms))
+    return _RollupWindow(start_ms, end_ms, (lo, hi), tuple(edges))
+
+
+def _union(parts: list[Select[Any]]) -> Subquery:
+    if len(parts) == 1:
+        return parts[0].subquery()
+    return union_all(*parts).subquery()
+
+
+def _session_parts(window: _RollupWindow, key_of) -> list[Any]:
+    """(key, user_name, n) 行：汇总表覆盖 interior，明细表覆盖 edges。"""
+    rollup = SessionRollupModel
+    parts = []
+    if window.interior is not None:
+        parts.append(
+            select(
+                key_of(rollup.hour_ms, rollup.user_name).label("key"),
+                rollup.user_name.label("user_name"),
+                rollup.sessions.label("n"),
+            ).where(*_ms_range(rollup.hour_ms, *window.interior))
+        )
+    for lo, hi in window.edges:
+        parts.append(
+            select(
+                key_of(SessionModel.start_time_ms, SessionModel.user_name).label("key"),
+                SessionModel.user_name.label("user_name"),
+                literal(1).label("n"),
+            ).where(*_ms_range(SessionModel.start_time_ms, lo, hi))
+        )
+    return parts
+
+
+def _message_parts(window: _RollupWindow, key_of) -> list[Any]:
+    """(key, n, depth) 行：按消息时间筛选（与会话无关）。"""
+    rollup = MessageRollupModel
+    log = ConversationLogModel
+    parts = []
+    if window.interior is not None:
+        parts.append(
+            select(
+                key_of(rollup.hour_ms, rollup.topic).label("key"),
+                rollup.messages.label("n"),
+                rollup.depth_sum.label("depth"),
+            ).where(*_ms_range(rollup.hour_ms, *window.interior))
+        )
+    for lo, hi in window.edges:
+        parts.append(
+            select(
+                key_of(log.timestamp_ms, log.topic).label("key"),
+                literal(1).label("n"),
+                log.depth_score.label("depth"),
+            ).where(*_ms_range(log.timestamp_ms, lo, hi))
+        )
+    return parts
+
+
+def _user_message_parts(window: _RollupWindow) -> list[Any]:
+    """(user_name, n) 行：消息时间与所属会话开始时间均需落在区间内。
+
+    每个 (消息, 会话) 组合只归入一处：两者都在 interior 的取汇总表；
+    消息在 edges 的、或消息在 interior 但会话在 edges 的回查明细。
+    """
+    rollup = MessageRollupModel
+    log = ConversationLogModel
+    joined = log.__table__.join(
+        SessionModel.__table__, SessionModel.session_id == log.session_id
+    )
+    parts = []
+    if window.interior is not None:
+        parts.append(
+            select(
+                rollup.user_name.label("user_name"), rollup.messages.label("n")
+            ).where(
+                *_ms_range(rollup.hour_ms, *window.interior),
+                *_ms_range(rollup.session_hour_ms, *window.interior),
+                # 开始时间未知的会话不计入会话数，其消息也不计入按会话统计的消息数
+                rollup.session_hour_ms != UNKNOWN_SESSION_HOUR_MS,
+            )
+        )
+    for lo, hi in window.edges:
+        parts.append(
+            select(SessionModel.user_name.label("user_name"), literal(1).label("n"))
+            .select_from(joined)
+            .where(
+                *_ms_range(log.timestamp_ms, lo, hi),
+                *_ms_range(SessionModel.start_time_ms, window.start_ms, window.end_ms),
+            )
+        )
+        if window.interior is not None:
+            parts.append(
+                select(SessionModel.user_name.label("user_name"), literal(1).label("n"))
+                .select_from(joined)
+                .where(
+                    *_ms_range(SessionModel.start_time_ms, lo, hi),
+                    *_ms_range(log.timestamp_ms, *window.interior),
+                )
+            )
+    return parts
+
+
+_SESSION_ORDER = (SessionModel.start_time_ms.desc(), SessionModel.session_id.desc())
+_CONVERSATION_COLUMNS = (*ConversationLogModel.__table__.c, SessionModel.user_name)
+
+
+def _session_filters(
+    start_ms: int | None,
+    end_ms: int | None,
+    user_name: str | None,
+    is_finished: bool | None,
+) -> list[Any]:
+    where = _ms_range(SessionModel.start_time_ms, start_ms, end_ms)
+    if user_name:
+        where.append(SessionModel.user_name == user_name)
+    if is_finished is not None:
+        where.append(SessionModel.is_finished == (1 if is_finished else 0))
+    return where
+
+
+def _join_conversation(stmt, use_fts: bool):
+    stmt = stmt.join(
+        SessionModel, SessionModel.session_id == ConversationLogModel.session_id
+    )
+    if use_fts:
+        stmt = stmt.join(_fts, _fts.c.rowid == ConversationLogModel.id)
+    return stmt
+
+
+def _sliced(stmt, limit: int | None, offset: int):
+    if limit is not None:
+        stmt = stmt.limit(int(limit))
+    return stmt.offset(int(offset)) if offset else stmt
+
+
+def _to_session_row(m: Any) -> AdminSessionRow:
+    return AdminSessionRow(
+        session_id=m.session_id,
+        user_name=m.user_name,
+        start_time=m.start_time,
+        end_time=m.end_time,
+        is_finished=bool(m.is_finished),
+        current_question_idx=int(m.current_question_idx or 0),
+        selected_topics_json=m.selected_topics,
+        created_at=m.created_at,
+        updated_at=m.updated_at,
+        is_followup=bool(m.is_followup),
+        current_followup_is_ai=bool(m.current_followup_is_ai),
+        current_followup_count=int(m.current_followup_count or 0),
+        current_followup_question=m.current_followup_question or "",
+        start_time_ms=m.start_time_ms,
+    )
+
+
+def _to_conversation_row(r: Any, *, snippet: str | None = None) -> AdminConversationRow:
+    return AdminConversationRow(
+        id=int(r.id),
+        session_id=r.session_id,
+        user_name=str(r.user_name or ""),
+        timestamp=r.timestamp,
+        topic=r.topic or "",
+        question_type=r.question_type or "",
+        question=r.question or "",
+        answer=r.answer or "",
+        depth_score=int(r.depth_score or 0),
+        is_ai_generated=bool(r.is_ai_generated),
+        snippet=snippet,
+        timestamp_ms=r.timestamp_ms,
+    )
 
 
 class AdminRepositoryImpl(AdminRepository):
-    def __init__(self, db: AsyncDatabase) -> None:
-        self._db = db
+    """后台查询均走只读连接池，避免重聚合/导出挤占访谈写入连接。"""
 
-    async def list_sessions(
+    def __init__(
         self,
+        db: AsyncDatabase,
         *,
-        start: datetime | None,
-        end: datetime | None,
-        user_name: str | None,
-        is_finished: bool | None,
-        limit: int,
-        offset: int,
-    ) -> tuple[int, list[AdminSessionRow]]:
-        where = []
-        if start is not None:
-            where.append(SessionModel.start_time >= _to_utc_text(start))
-        if end is not None:
-            where.append(SessionModel.start_time < _to_utc_text(end))
-        if user_name:
-            where.append(SessionModel.user_name == user_name)
-        if is_finished is not None:
-            where.append(SessionModel.is_finished == (1 if is_finished else 0))
-
-        where_clause = and_(*where) if where else None
+        count_cache: QueryCache | None = None,
+        shared_data_version: bool = False,
+    ) -> None:
+        self._db = db
+        self._count_cache = count_cache
+        self._shared_data_version = shared_data_version
 
+    async def data_version(self) -> int:
+        """本进程的写入版本号；多 worker 时读取库中由触发器维护的计数（各 worker 共用）。"""
+        if not self._shared_data_version:
+            return self._db.write_version
         async with self._db.session() as session:
-            total_stmt = select(func.count()).select_from(SessionModel)
-            if where_clause is not None:
-                total_stmt = total_stmt.where(where_clause)
-            total = int((await session.execute(total_stmt)).scalar_one())
-
-            stmt = select(SessionModel).order_by(SessionModel.start_time.desc())
-            if where_clause is not None:
-                stmt = stmt.where(where_clause)
-            stmt = stmt.limit(int(limit)).offset(int(offset))
-            models = (await session.execute(stmt)).scalars().all()
-
-        rows: list[AdminSessionRow] = []
-        for m in models:
-            rows.append(
-                AdminSessionRow(
-                    session_id=m.session_id,
-                    user_name=m.user_name,
-                    start_time=m.start_time,
-                    end_time=m.end_time,
-                    is_finished=bool(m.is_finished),
-                    current_question_idx=int(m.current_question_idx or 0),
-                    selected_topics_json=m.selected_topics,
-                    created_at=m.created_at,
-                    updated_at=m.updated_at,
-                    is_followup=bool(m.is_followup),
-                    current_followup_is_ai=bool(m.current_followup_is_ai),
-                    current_followup_count=int(m.current_followup_count or 0),
-                    current_followup_question=m.current_followup_question or "",
-                )
+            version = await session.scalar(
+                select(DataVersionModel.version).where(DataVersionModel.id == 1)
             )
+        return int(version or 0)
 
-        return total, rows
-
-    async def search_conversations(
+    async def _count(
         self,
+        session: AsyncSession,
+        stmt,
         *,
-        start: datetime | None,
-        end: datetime | None,
+        key: Hashable,
+        mode: CountMode,
+    ) -> int | None:
+        if mode == "none":
+            return None
+        if self._count_cache is None:
+            return int((await session.execute(stmt)).scalar_one())
+        # 与概览缓存相同，键中带数据版本号：有新写入后 cached 模式不再返回旧计数
+        key = (key, await self.data_version())
+        if mode == "cached":
+            cached = self._count_cache.get(key)
+            if cached is not None:
+                return int(cached)
+        total = int((await session.execute(stmt)).scalar_one())
+        self._count_cache.set(key, total)
+        return total
+
+    def _conversation_filters(
+        self,
+        *,
+        start_ms: int | None,
+        end_ms: int | None,
         user_name: str | None,
         topic: str | None,
-        keyword: str | None,
+        keyword: str,
         min_depth: int | None,
         max_depth: int | None,
-        limit: int,
-        offset: int,
-    ) -> tuple[int, list[AdminConversationRow]]:
-        where = []
-        if start is not None:
-            where.append(ConversationLogModel.timestamp >= _to_utc_text(start))
-        if end is not None:
-            where.append(ConversationLogModel.timestamp < _to_utc_text(end))
+    ) -> tuple[list[Any], bool]:
+        """返回 (筛选条件, 是否走全文索引)。"""
+        where = _ms_range(ConversationLogModel.timestamp_ms, start_ms, end_ms)
         if user_name:
             where.append(SessionModel.user_name == user_name)
         if topic:
@@ -122,53 +386,253 @@ class AdminRepositoryImpl(AdminRepository):
             where.append(ConversationLogModel.depth_score >= int(min_depth))
         if max_depth is not None:
             where.append(ConversationLogModel.depth_score <= int(max_depth))
-        if keyword:
-            kw = f"%{keyword.strip().lower()}%"
+        use_fts = self._db.fts_enabled and len(keyword) >= _FTS_MIN_KEYWORD_LENGTH
+        if use_fts:
+            where.append(
+                text(f"{FTS_TABLE} MATCH :fts_query").bindparams(
+                    fts_query=_fts_phrase(keyword)
+                )
+            )
+        elif keyword:
+            pattern = f"%{keyword.lower()}%"
             where.append(
                 or_(
-                    func.lower(ConversationLogModel.question).like(kw),
-                    func.lower(ConversationLogModel.answer).like(kw),
+                    func.lower(ConversationLogModel.question).like(pattern),
+                    func.lower(ConversationLogModel.answer).like(pattern),
                 )
             )
+        return where, use_fts
+
+    async def list_sessions(
+        self,
+        *,
+        start: datetime | None,
+        end: datetime | None,
+        user_name: str | None,
+        is_finished: bool | None,
+        limit: int,
+        offset: int,
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> AdminPage[AdminSessionRow]:
+        start_ms = _to_epoch_ms(start) if start is not None else None
+        end_ms = _to_epoch_ms(end) if end is not None else None
+        where = _session_filters(start_ms, end_ms, user_name, is_finished)
+
+        # 游标分页：(start_time_ms, session_id) 严格递减，翻页成本与页码无关；
+        # 开始时间未知（NULL）的会话排在最后，游标中 t 为 null
+        page_where = list(where)
+        if cursor:
+            after = _decode_cursor(cursor, "s", {"t": (int, type(None)), "id": str})
+            if after["t"] is None:
+                page_where.append(
+                    and_(
+                        SessionModel.start_time_ms.is_(None),
+                        SessionModel.session_id < after["id"],
+                    )
+                )
+            else:
+                page_where.append(
+                    or_(
+                        tuple_(SessionModel.start_time_ms, SessionModel.session_id)
+                        < tuple_(after["t"], after["id"]),
+                        SessionModel.start_time_ms.is_(None),
+                    )
+                )
 
-        where_clause = and_(*where) if where else None
+        async with self._db.read_session() as session:
+            total_stmt = select(func.count()).select_from(SessionModel)
+            if where:
+                total_stmt = total_stmt.where(and_(*where))
+            total = await self._count(
+                session,
+                total_stmt,
+                key=("sessions", start_ms, end_ms, user_name or None, is_finished),
+                mode=count,
+            )
 
-        async with self._db.session() as session:
-            base = (
-                select(ConversationLogModel, SessionModel.user_name)
-                .join(SessionModel, SessionModel.session_id == ConversationLogModel.session_id)
+            stmt = select(SessionModel).order_by(*_SESSION_ORDER)
+            if page_where:
+                stmt = stmt.where(and_(*page_where))
+            # 多取一行用于判断是否还有下一页
+            stmt = stmt.limit(int(limit) + 1)
+            if not cursor:
+                stmt = stmt.offset(int(offset))
+            models = list((await session.execute(stmt)).scalars().all())
+
+        next_cursor = None
+        if len(models) > int(limit):
+            models = models[: int(limit)]
+            last = models[-1]
+            next_cursor = _encode_cursor(
+                {"k": "s", "t": last.start_time_ms, "id": last.session_id}
             )
+
+        rows = [_to_session_row(m) for m in models]
+        return AdminPage(total=total, items=rows, next_cursor=next_cursor)
+
+    async def search_conversations(
+        self,
+        *,
+        start: datetime | None,
+        end: datetime | None,
+        user_name: str | None,
+        topic: str | None,
+        keyword: str | None,
+        min_depth: int | None,
+        max_depth: int | None,
+        limit: int,
+        offset: int,
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> AdminPage[AdminConversationRow]:
+        start_ms = _to_epoch_ms(start) if start is not None else None
+        end_ms = _to_epoch_ms(end) if end is not None else None
+        kw = (keyword or "").strip()
+        where, use_fts = self._conversation_filters(
+            start_ms=start_ms,
+            end_ms=end_ms,
+            user_name=user_name,
+            topic=topic,
+            keyword=kw,
+            min_depth=min_depth,
+            max_depth=max_depth,
+        )
+
+        snippet = (
+            func.snippet(_fts_ref, -1, "<mark>", "</mark>", "…", 16)
+            if use_fts
+            else literal_column("NULL")
+        ).label("snippet")
+        order_by = [ConversationLogModel.id.desc()]
+        if use_fts:
+            # 全文检索：按 bm25 相关度排序（值越小越相关），并返回高亮片段
+            order_by.insert(0, func.bm25(_fts_ref).asc())
+
+        # 按 id 递减时用 id 作游标；相关度排序没有稳定的键，游标中记录偏移量
+        page_where: list[Any] = []
+        page_offset = int(offset)
+        if cursor:
+            if use_fts:
+                page_offset = _decode_cursor(cursor, "r", {"o": int})["o"]
+            else:
+                page_offset = 0
+                after = _decode_cursor(cursor, "c", {"id": int})
+                page_where.append(ConversationLogModel.id < after["id"])
+
+        def _filtered(stmt, extra=()):
+            conditions = [*where, *extra]
+            stmt = _join_conversation(stmt, use_fts)
+            return stmt.where(and_(*conditions)) if conditions else stmt
+
+        async with self._db.read_session() as session:
             total_stmt = select(func.count()).select_from(
-                base.subquery()
+                _filtered(select(ConversationLogModel.id)).subquery()
+            )
+            total = await self._count(
+                session,
+                total_stmt,
+                key=(
+                    "conversations",
+                    start_ms,
+                    end_ms,
+                    user_name or None,
+                    topic or None,
+                    kw or None,
+                    min_depth,
+                    max_depth,
+                ),
+                mode=count,
             )
-            if where_clause is not None:
-                base = base.where(where_clause)
-                total_stmt = select(func.count()).select_from(base.subquery())
-            total = int((await session.execute(total_stmt)).scalar_one())
 
-            stmt = base.order_by(ConversationLogModel.id.desc()).limit(int(limit)).offset(
-                int(offset)
+            stmt = (
+                _filtered(
+                    select(*_CONVERSATION_COLUMNS, snippet),
+                    page_where,
+                )
+                .order_by(*order_by)
+                .limit(int(limit) + 1)
+                .offset(page_offset)
             )
             result = await session.execute(stmt)
-            items = result.all()
-
-        rows: list[AdminConversationRow] = []
-        for log, uname in items:
-            rows.append(
-                AdminConversationRow(
-                    id=int(log.id),
-                    session_id=log.session_id,
-                    user_name=str(uname or ""),
-                    timestamp=log.timestamp,
-                    topic=log.topic or "",
-                    question_type=log.question_type or "",
-                    question=log.question or "",
-                    answer=log.answer or "",
-                    depth_score=int(log.depth_score or 0),
-                    is_ai_generated=bool(log.is_ai_generated),
+            items = list(result.all())
+
+        next_cursor = None
+        if len(items) > int(limit):
+            items = items[: int(limit)]
+            if use_fts:
+                next_cursor = _encode_cursor({"k": "r", "o": page_offset + int(limit)})
+            else:
+                next_cursor = _encode_cursor({"k": "c", "id": int(items[-1].id)})
+
+        rows = [_to_conversation_row(r, snippet=r.snippet) for r in items]
+        return AdminPage(total=total, items=rows, next_cursor=next_cursor)
+
+    async def iter_sessions(
+        self,
+        *,
+        start: datetime | None,
+        end: datetime | None,
+        user_name: str | None,
+        is_finished: bool | None,
+        limit: int | None = None,
+        offset: int = 0,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[list[AdminSessionRow]]:
+        where = _session_filters(
+            _to_epoch_ms(start) if start is not None else None,
+            _to_epoch_ms(end) if end is not None else None,
+            user_name,
+            is_finished,
+        )
+        stmt = select(*SessionModel.__table__.c).order_by(*_SESSION_ORDER)
+        if where:
+            stmt = stmt.where(and_(*where))
+        async for rows in self._stream(_sliced(stmt, limit, offset), chunk_size):
+            yield [_to_session_row(r) for r in rows]
+
+    async def iter_conversations(
+        self,
+        *,
+        start: datetime | None,
+        end: datetime | None,
+        user_name: str | None,
+        topic: str | None,
+        keyword: str | None,
+        min_depth: int | None,
+        max_depth: int | None,
+        limit: int | None = None,
+        offset: int = 0,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[list[AdminConversationRow]]:
+        # 导出按 id 递减输出（不做相关度排序，避免对全部命中行排序）
+        where, use_fts = self._conversation_filters(
+            start_ms=_to_epoch_ms(start) if start is not None else None,
+            end_ms=_to_epoch_ms(end) if end is not None else None,
+            user_name=user_name,
+            topic=topic,
+            keyword=(keyword or "").strip(),
+            min_depth=min_depth,
+            max_depth=max_depth,
+        )
+        stmt = _join_conversation(select(*_CONVERSATION_COLUMNS), use_fts).order_by(
+            ConversationLogModel.id.desc()
+        )
+        if where:
+            stmt = stmt.where(and_(*where))
+        async for rows in self._stream(_sliced(stmt, limit, offset), chunk_size):
+            yield [_to_conversation_row(r) for r in rows]
+
+    async def _stream(self, stmt, chunk_size: int) -> AsyncIterator[Sequence[Any]]:
+        """服务端游标分块读取；导出可能持续较久，不受只读连接的语句超时限制。"""
+        async with self._db.read_session() as session:
+            result = await session.stream(
+                stmt.execution_options(
+                    yield_per=max(1, int(chunk_size)), statement_timeout_ms=0
                 )
             )
-        return total, rows
+            async for rows in result.partitions():
+                yield rows
 
     async def get_time_series(
         self,
@@ -178,62 +642,52 @@ class AdminRepositoryImpl(AdminRepository):
         bucket: str,
     ) -> list[AdminTimeSeriesPoint]:
         bucket = "hour" if bucket == "hour" else "day"
-
-        session_where = []
-        log_where = []
-        if start is not None:
-            session_where.append(SessionModel.start_time >= _to_utc_text(start))
-            log_where.append(ConversationLogModel.timestamp >= _to_utc_text(start))
-        if end is not None:
-            session_where.append(SessionModel.start_time < _to_utc_text(end))
-            log_where.append(ConversationLogModel.timestamp < _to_utc_text(end))
-
-        async with self._db.session() as session:
-            sess_bucket = _bucket_expr(SessionModel.start_time, bucket).label("bucket")
-            sess_stmt = (
-                select(
-                    sess_bucket,
-                    func.count().label("sessions"),
-                    func.count(func.distinct(SessionModel.user_name)).label("users"),
-                )
-                .select_from(SessionModel)
-                .group_by(sess_bucket)
-                .order_by(sess_bucket.asc())
+        window = _rollup_window(start, end)
+
+        sess = _union(
+            _session_parts(window, lambda hour, _user: _bucket_expr(hour, bucket))
+        )
+        sess_stmt = (
+            select(
+                sess.c.key,
+                func.sum(sess.c.n),
+                func.count(func.distinct(sess.c.user_name)),
             )
-            if session_where:
-                sess_stmt = sess_stmt.where(and_(*session_where))
+            .group_by(sess.c.key)
+            .order_by(sess.c.key.asc())
+        )
+        logs = _union(
+            _message_parts(window, lambda hour, _topic: _bucket_expr(hour, bucket))
+        )
+        log_stmt = (
+            select(logs.c.key, func.sum(logs.c.n), func.sum(logs.c.depth))
+            .group_by(logs.c.key)
+            .order_by(logs.c.key.asc())
+        )
+
+        async with self._db.read_session() as session:
             sess_rows = (await session.execute(sess_stmt)).all()
-
-            log_bucket = _bucket_expr(ConversationLogModel.timestamp, bucket).label("bucket")
-            log_stmt = (
-                select(
-                    log_bucket,
-                    func.count().label("messages"),
-                    func.avg(ConversationLogModel.depth_score).label("avg_depth"),
-                )
-                .select_from(ConversationLogModel)
-                .group_by(log_bucket)
-                .order_by(log_bucket.asc())
-            )
-            if log_where:
-                log_stmt = log_stmt.where(and_(*log_where))
             log_rows = (await session.execute(log_stmt)).all()
 
-        sessions_by_bucket: dict[str, tuple[int, int]] = {
-            str(b): (int(s or 0), int(u or 0)) for b, s, u in sess_rows
+        sessions_by_bucket: dict[int, tuple[int, int]] = {
+            int(b): (int(s or 0), int(u or 0)) for b, s, u in sess_rows if b is not None
         }
-        logs_by_bucket: dict[str, tuple[int, float]] = {
-            str(b): (int(m or 0), float(d or 0.0)) for b, m, d in log_rows
+        logs_by_bucket: dict[int, tuple[int, float]] = {
+            int(b): (int(m or 0), float(d or 0) / int(m)) if m else (0, 0.0)
+            for b, m, d in log_rows
+            if b is not None
         }
 
-        all_buckets = sorted(set(sessions_by_bucket.keys()) | set(logs_by_bucket.keys()))
+        all_buckets = sorted(
+            set(sessions_by_bucket.keys()) | set(logs_by_bucket.keys())
+        )
         out: list[AdminTimeSeriesPoint] = []
         for b in all_buckets:
             s, u = sessions_by_bucket.get(b, (0, 0))
             m, d = logs_by_bucket.get(b, (0, 0.0))
             out.append(
                 AdminTimeSeriesPoint(
-                    bucket=b,
+                    bucket=_bucket_label(b, bucket),
                     sessions=int(s),
                     messages=int(m),
                     unique_users=int(u),
@@ -249,36 +703,34 @@ class AdminRepositoryImpl(AdminRepository):
         end: datetime | None,
         limit: int,
     ) -> list[AdminUserActivityRow]:
-        session_where = []
-        log_where = []
-        if start is not None:
-            session_where.append(SessionModel.start_time >= _to_utc_text(start))
-            log_where.append(ConversationLogModel.timestamp >= _to_utc_text(start))
-        if end is not None:
-            session_where.append(SessionModel.start_time < _to_utc_text(end))
-            log_where.append(ConversationLogModel.timestamp < _to_utc_text(end))
-
-        async with self._db.session() as session:
-            join_on = [ConversationLogModel.session_id == SessionModel.session_id]
-            if log_where:
-                join_on.extend(log_where)
-            stmt = (
-                select(
-                    SessionModel.user_name.label("user_name"),
-                    func.count(func.distinct(SessionModel.session_id)).label("sessions"),
-                    func.count(ConversationLogModel.id).label("messages"),
-                )
-                .select_from(SessionModel)
-                .outerjoin(
-                    ConversationLogModel,
-                    and_(*join_on),
+        window = _rollup_window(start, end)
+
+        sess = _union(_session_parts(window, lambda _hour, user: user))
+        sessions_by_user = (
+            select(sess.c.user_name, func.sum(sess.c.n).label("sessions"))
+            .group_by(sess.c.user_name)
+            .subquery()
+        )
+        msgs = _union(_user_message_parts(window))
+        messages_by_user = (
+            select(msgs.c.user_name, func.sum(msgs.c.n).label("messages"))
+            .group_by(msgs.c.user_name)
+            .subquery()
+        )
+        messages = func.coalesce(messages_by_user.c.messages, 0).label("messages")
+        stmt = (
+            select(sessions_by_user.c.user_name, sessions_by_user.c.sessions, messages)
+            .select_from(
+                sessions_by_user.outerjoin(
+                    messages_by_user,
+                    messages_by_user.c.user_name == sessions_by_user.c.user_name,
                 )
-                .group_by(SessionModel.user_name)
-                .order_by(func.count(ConversationLogModel.id).desc())
-                .limit(int(limit))
             )
-            if session_where:
-                stmt = stmt.where(and_(*session_where))
+            .order_by(messages.desc())
+            .limit(int(limit))
+        )
+
+        async with self._db.read_session() as session:
             rows = (await session.execute(stmt)).all()
 
         return [
@@ -297,33 +749,31 @@ class AdminRepositoryImpl(AdminRepository):
         end: datetime | None,
         limit: int,
     ) -> list[AdminTopicRow]:
-        where = []
-        if start is not None:
-            where.append(ConversationLogModel.timestamp >= _to_utc_text(start))
-        if end is not None:
-            where.append(ConversationLogModel.timestamp < _to_utc_text(end))
-
-        async with self._db.session() as session:
-            stmt = (
-                select(
-                    ConversationLogModel.topic.label("topic"),
-                    func.count().label("messages"),
-                    func.avg(ConversationLogModel.depth_score).label("avg_depth"),
-                )
-                .select_from(ConversationLogModel)
-                .group_by(ConversationLogModel.topic)
-                .order_by(func.count().desc())
-                .limit(int(limit))
+        window = _rollup_window(start, end)
+
+        logs = _union(_message_parts(window, lambda _hour, topic: topic))
+        messages = func.sum(logs.c.n)
+        stmt = (
+            select(
+                logs.c.key.label("topic"),
+                messages.label("messages"),
+                func.sum(logs.c.depth),
             )
-            if where:
-                stmt = stmt.where(and_(*where))
+            .group_by(logs.c.key)
+            .order_by(messages.desc())
+            .limit(int(limit))
+        )
+
+        async with self._db.read_session() as session:
             rows = (await session.execute(stmt)).all()
 
         return [
             AdminTopicRow(
-                topic=str(r.topic or ""),
-                messages=int(r.messages or 0),
-                avg_depth_score=float(round(float(r.avg_depth or 0.0), 4)),
+                topic=str(topic or ""),
+                messages=int(count or 0),
+                avg_depth_score=float(round(float(depth or 0) / count, 4))
+                if count
+                else 0.0,
             )
-            for r in rows
+            for topic, count, depth in rows
         ]
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, timezone
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import CursorResult, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from interview_system.domain.entities.session import Session, SessionStatus
-from interview_system.domain.repositories.session_repository import SessionRepository
+from interview_system.domain.repositories.session_repository import (
+    SessionRepository,
+    StaleSessionError,
+)
 from interview_system.domain.value_objects.conversation_entry import ConversationEntry
 from interview_system.infrastructure.cache.memory_cache import SessionCache
 from interview_system.infrastructure.database.connection import AsyncDatabase
@@ -17,19 +22,28 @@ from interview_system.infrastructure.database.models import (
     ConversationLogModel,
     SessionModel,
 )
+from interview_system.infrastructure.database.write_buffer import SessionStateBuffer
 
 _TS_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 class SessionRepositoryImpl(SessionRepository):
-    def __init__(self, db: AsyncDatabase, *, cache: SessionCache | None = None) -> None:
+    def __init__(
+        self,
+        db: AsyncDatabase,
+        *,
+        cache: SessionCache | None = None,
+        write_buffer: SessionStateBuffer | None = None,
+    ) -> None:
         self._db = db
         self._cache = cache
+        self._write_buffer = write_buffer
 
     async def get(self, session_id: UUID) -> Session | None:
         key = str(session_id)
         if self._cache is not None:
-            cached = self._cache.get(key)
+            # 缓存每次返回独立对象：并发请求各自修改，未保存成功的修改不会污染缓存
+            cached = await self._cache.get(key)
             if cached is not None:
                 return cached
 
@@ -37,48 +51,100 @@ class SessionRepositoryImpl(SessionRepository):
             model = await session.get(SessionModel, key)
             if model is None:
                 return None
+            if self._write_buffer is not None:
+                self._write_buffer.mark_persisted(key)
+                pending = self._write_buffer.pending_state(key)
+                if pending is not None:
+                    # 缓冲中的状态比数据库更新（仅覆盖内存对象，不提交）
+                    for column, value in pending.items():
+                        setattr(model, column, value)
             domain = _to_domain_session(model)
             if self._cache is not None:
-                self._cache.set(domain)
+                await self._cache.set(domain)
             return domain
 
-    async def save(self, session_obj: Session) -> None:
+    async def save(
+        self,
+        session_obj: Session,
+        *,
+        new_entry: ConversationEntry | None = None,
+        delete_entries_from: int | None = None,
+    ) -> None:
+        """保存状态（可同时追加一条对话记录、删除 id >= delete_entries_from 的对话记录）。
+
+        同步写入为乐观并发：仅当库中版本仍等于读取时的版本才更新，否则抛出
+        StaleSessionError（记录不会写入或删除）；成功后版本号加一。写回缓冲模式下状态由
+        单进程内存权威维护，不做版本校验。
+        """
         now = datetime.now(timezone.utc)
-        async with self._db.transaction() as session:
-            key = str(session_obj.id)
-            model = await session.get(SessionModel, key)
-            if model is None:
-                model = SessionModel(
-                    session_id=key,
-                    user_name=session_obj.user_name,
-                    start_time=session_obj.created_at.astimezone(timezone.utc).strftime(
-                        _TS_FORMAT
-                    ),
-                )
-                session.add(model)
+        key = str(session_obj.id)
+        next_version = session_obj.version + 1
+        values = _state_values(session_obj, now)
+        values["version"] = next_version
 
-            model.user_name = session_obj.user_name
-            model.is_finished = 1 if session_obj.is_finished() else 0
-            model.current_question_idx = int(session_obj.current_question_idx)
-            model.selected_topics = json.dumps(
-                session_obj.selected_topics, ensure_ascii=False
-            )
+        if self._write_buffer is not None and self._write_buffer.is_persisted(key):
+            if new_entry is not None or delete_entries_from is not None:
+                async with self._db.transaction() as session:
+                    await _write_entries(session, key, new_entry, delete_entries_from)
+            self._write_buffer.stage(key, values)
+            session_obj.version = next_version
+            if self._cache is not None:
+                await self._cache.set(session_obj)
+            return
 
-            model.is_followup = 1 if session_obj.is_followup else 0
-            model.current_followup_is_ai = (
-                1 if session_obj.current_followup_is_ai else 0
-            )
-            model.current_followup_count = int(session_obj.current_followup_count)
-            model.current_followup_question = (
-                session_obj.current_followup_question or ""
+        if self._cache is not None:
+            # 提交前先让其他 worker 缓存未命中（回退到数据库），提交后再写入新版本；
+            # 否则提交与写入缓存之间其他 worker 仍会命中旧版本
+            await self._cache.invalidate(key, min_version=next_version)
+
+        stale = False
+        async with self._db.transaction() as session:
+            result = cast(
+                "CursorResult[Any]",
+                await session.execute(
+                    update(SessionModel)
+                    .where(
+                        SessionModel.session_id == key,
+                        SessionModel.version == session_obj.version,
+                    )
+                    .values(**values)
+                ),
             )
+            if result.rowcount == 0:
+                exists = await session.scalar(
+                    select(SessionModel.session_id).where(
+                        SessionModel.session_id == key
+                    )
+                )
+                stale = exists is not None
+                if not stale:
+                    session.add(
+                        SessionModel(
+                            session_id=key,
+                            start_time=session_obj.created_at.astimezone(
+                                timezone.utc
+                            ).strftime(_TS_FORMAT),
+                            start_time_ms=_to_epoch_ms(session_obj.created_at),
+                            created_at=now.strftime(_TS_FORMAT),
+                            **values,
+                        )
+                    )
+            if not stale:
+                await _write_entries(session, key, new_entry, delete_entries_from)
 
-            if model.created_at is None:
-                model.created_at = now.strftime(_TS_FORMAT)
-            model.updated_at = now.strftime(_TS_FORMAT)
+        if stale:
+            # 其他请求/进程已更新该会话：丢弃该版本及之前的缓存，下次读取最新状态
+            if self._cache is not None:
+                await self._cache.invalidate(key, min_version=next_version)
+            raise StaleSessionError(session_id=session_obj.id)
 
+        session_obj.version = next_version
+        if self._write_buffer is not None:
+            # 同步写入已覆盖旧的积压状态
+            self._write_buffer.discard(key)
+            self._write_buffer.mark_persisted(key)
         if self._cache is not None:
-            self._cache.set(session_obj)
+            await self._cache.set(session_obj)
 
     async def delete(self, session_id: UUID) -> bool:
         key = str(session_id)
@@ -88,39 +154,42 @@ class SessionRepositoryImpl(SessionRepository):
                 return False
             await session.delete(model)
 
+        if self._write_buffer is not None:
+            self._write_buffer.discard(key)
         if self._cache is not None:
-            self._cache.delete(key)
+            await self._cache.delete(key)
         return True
 
     async def list_conversation_entries(
-        self, session_id: UUID
+        self, session_id: UUID, *, after_id: int | None = None
     ) -> list[ConversationEntry]:
         key = str(session_id)
+        stmt = select(ConversationLogModel).where(
+            ConversationLogModel.session_id == key
+        )
+        if after_id is not None:
+            stmt = stmt.where(ConversationLogModel.id > after_id)
         async with self._db.session() as session:
-            result = await session.execute(
-                select(ConversationLogModel)
-                .where(ConversationLogModel.session_id == key)
-                .order_by(ConversationLogModel.id.asc())
-            )
+            result = await session.execute(stmt.order_by(ConversationLogModel.id.asc()))
             return [_to_domain_entry(m) for m in result.scalars().all()]
 
     async def append_conversation_entry(
         self, session_id: UUID, entry: ConversationEntry
     ) -> None:
-        key = str(session_id)
         async with self._db.transaction() as session:
-            model = ConversationLogModel(
-                session_id=key,
-                timestamp=entry.timestamp.astimezone(timezone.utc).strftime(_TS_FORMAT),
-                topic=entry.topic,
-                question_type=entry.question_type,
-                question=entry.question,
-                answer=entry.answer,
-                depth_score=int(entry.depth_score),
-                is_ai_generated=1 if entry.is_ai_generated else 0,
-                created_at=datetime.now(timezone.utc).strftime(_TS_FORMAT),
+            session.add(_to_log_model(str(session_id), entry))
+
+    async def get_last_conversation_entry(
+        self, session_id: UUID
+    ) -> ConversationEntry | None:
+        async with self._db.session() as session:
+            model = await session.scalar(
+                select(ConversationLogModel)
+                .where(ConversationLogModel.session_id == str(session_id))
+                .order_by(ConversationLogModel.id.desc())
+                .limit(1)
             )
-            session.add(model)
+            return _to_domain_entry(model) if model is not None else None
 
     async def delete_last_conversation_entry(
         self, session_id: UUID
@@ -141,14 +210,80 @@ class SessionRepositoryImpl(SessionRepository):
             return entry
 
 
-def _to_domain_session(model: SessionModel) -> Session:
+async def _write_entries(
+    session: AsyncSession,
+    session_id: str,
+    new_entry: ConversationEntry | None,
+    delete_entries_from: int | None,
+) -> None:
+    if delete_entries_from is not None:
+        await session.execute(
+            delete(ConversationLogModel).where(
+                ConversationLogModel.session_id == session_id,
+                ConversationLogModel.id >= delete_entries_from,
+            )
+        )
+    if new_entry is not None:
+        session.add(_to_log_model(session_id, new_entry))
+
+
+def _to_log_model(session_id: str, entry: ConversationEntry) -> ConversationLogModel:
+    return ConversationLogModel(
+        session_id=session_id,
+        timestamp=entry.timestamp.astimezone(timezone.utc).strftime(_TS_FORMAT),
+        timestamp_ms=_to_epoch_ms(entry.timestamp),
+        topic=entry.topic,
+        question_type=entry.question_type,
+        question=entry.question,
+        answer=entry.answer,
+        depth_score=int(entry.depth_score),
+        is_ai_generated=1 if entry.is_ai_generated else 0,
+        created_at=datetime.now(timezone.utc).strftime(_TS_FORMAT),
+    )
+
+
+def _to_epoch_ms(dt: datetime) -> int:
+    return int(dt.timestamp() * 1000)
+
+
+def _from_epoch_ms(ms: int | None, fallback: str | None) -> datetime:
+    if ms is not None:
+        return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+    # 兼容尚未回填毫秒列的旧数据
     try:
-        created_at = datetime.strptime(model.start_time, _TS_FORMAT).replace(
+        return datetime.strptime(fallback or "", _TS_FORMAT).replace(
             tzinfo=timezone.utc
         )
     except ValueError:
-        created_at = datetime.now(timezone.utc)
+        return datetime.now(timezone.utc)
+
+
+def _parse_ts(value: str | None) -> datetime | None:
+    try:
+        return datetime.strptime(value or "", _TS_FORMAT).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
 
+def _state_values(session_obj: Session, now: datetime) -> dict[str, Any]:
+    """sessions 表中随访谈推进而变化的字段。"""
+    return {
+        "user_name": session_obj.user_name,
+        "is_finished": 1 if session_obj.is_finished() else 0,
+        "current_question_idx": int(session_obj.current_question_idx),
+        "selected_topics": json.dumps(session_obj.selected_topics, ensure_ascii=False),
+        "is_followup": 1 if session_obj.is_followup else 0,
+        "current_followup_is_ai": 1 if session_obj.current_followup_is_ai else 0,
+        "current_followup_count": int(session_obj.current_followup_count),
+        "current_followup_question": session_obj.current_followup_question or "",
+        "version": int(session_obj.version),
+        "rewound_version": int(session_obj.rewound_version),
+        "updated_at": (session_obj.updated_at or now).strftime(_TS_FORMAT),
+    }
+
+
+def _to_domain_session(model: SessionModel) -> Session:
+    created_at = _from_epoch_ms(model.start_time_ms, model.start_time)
     status = (
         SessionStatus.COMPLETED if bool(model.is_finished) else SessionStatus.ACTIVE
     )
@@ -170,15 +305,14 @@ def _to_domain_session(model: SessionModel) -> Session:
         current_followup_is_ai=bool(model.current_followup_is_ai),
         current_followup_count=int(model.current_followup_count or 0),
         current_followup_question=model.current_followup_question or "",
+        version=int(model.version or 0),
+        rewound_version=int(model.rewound_version or 0),
+        updated_at=_parse_ts(model.updated_at),
     )
 
 
 def _to_domain_entry(model: ConversationLogModel) -> ConversationEntry:
-    try:
-        ts = datetime.strptime(model.timestamp, _TS_FORMAT).replace(tzinfo=timezone.utc)
-    except ValueError:
-        ts = datetime.now(timezone.utc)
-
+    ts = _from_epoch_ms(model.timestamp_ms, model.timestamp)
     return ConversationEntry(
         timestamp=ts,
         topic=model.topic or "",
@@ -187,4 +321,5 @@ def _to_domain_entry(model: ConversationLogModel) -> ConversationEntry:
         answer=model.answer or "",
         depth_score=int(model.depth_score or 0),
         is_ai_generated=bool(model.is_ai_generated),
+        id=int(model.id),
     )
@@ -0,0 +1,155 @@
+"""Session 状态写回缓冲（write-behind）。
+
+说明：
+- 仅缓冲 sessions 表的状态字段（题号、追问标记等），对话日志仍同步落库
+- 缓冲中的状态视为权威值：读取时优先于数据库
+- 按时间间隔或积压阈值批量刷盘（单事务多行 UPDATE），关闭时强制刷盘
+- 刷盘时已被删除的 session 直接丢弃其积压状态，不影响同批其他 session
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from cachetools import TTLCache
+from sqlalchemy import bindparam, select, update
+
+from interview_system.infrastructure.database.connection import AsyncDatabase
+from interview_system.infrastructure.database.models import Base, SessionModel
+
+logger = logging.getLogger(__name__)
+
+_sessions = Base.metadata.tables[SessionModel.__tablename__]
+
+# Core executemany：按主键逐行 UPDATE，未命中的行（已删除）不会报错
+_UPDATE_STATE = update(_sessions).where(
+    _sessions.c.session_id == bindparam("b_session_id")
+)
+
+
+class SessionStateBuffer:
+    """按 session_id 合并的待写状态缓冲。"""
+
+    def __init__(
+        self,
+        db: AsyncDatabase,
+        *,
+        flush_interval_seconds: float = 1.0,
+        max_pending: int = 100,
+        known_maxsize: int = 4096,
+        known_ttl_seconds: int = 3600,
+    ) -> None:
+        self._db = db
+        self._flush_interval = max(0.01, float(flush_interval_seconds))
+        self._max_pending = max(1, int(max_pending))
+        self._pending: dict[str, dict[str, Any]] = {}
+        # 已确认存在于数据库中的 session（仅这些 session 的更新可以延迟写入）
+        self._known: TTLCache[str, bool] = TTLCache(
+            maxsize=known_maxsize, ttl=known_ttl_seconds
+        )
+        self._flush_lock = asyncio.Lock()
+        # 正在写入的批次（刷盘期间 discard 的 session 同时从中移除）
+        self._inflight: dict[str, dict[str, Any]] | None = None
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def is_persisted(self, session_id: str) -> bool:
+        return session_id in self._known
+
+    def mark_persisted(self, session_id: str) -> None:
+        self._known[session_id] = True
+
+    def pending_state(self, session_id: str) -> dict[str, Any] | None:
+        return self._pending.get(session_id)
+
+    def stage(self, session_id: str, values: dict[str, Any]) -> None:
+        """登记一次状态更新（同一 session 的多次更新会合并为最后一次）。"""
+        self._pending[session_id] = dict(values)
+        if len(self._pending) >= self._max_pending:
+            self._wakeup.set()
+
+    def discard(self, session_id: str) -> None:
+        self._pending.pop(session_id, None)
+        if self._inflight is not None:
+            # 刷盘进行中：写入失败时不再放回该 session 的状态
+            self._inflight.pop(session_id, None)
+        self._known.pop(session_id, None)
+
+    async def flush(self) -> int:
+        """将积压状态批量写入数据库，返回写入行数。"""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            batch = self._pending
+            self._pending = {}
+            self._inflight = batch
+            try:
+                return await self._write(batch)
+            except Exception:
+                # 写入失败时放回缓冲（不覆盖期间产生的更新，期间已丢弃的 session 不放回）
+                for key, values in batch.items():
+                    self._pending.setdefault(key, values)
+                raise
+            finally:
+                self._inflight = None
+
+    async def _write(self, batch: dict[str, dict[str, Any]]) -> int:
+        async with self._db.transaction() as session:
+            existing = set(
+                (
+                    await session.scalars(
+                        select(SessionModel.session_id).where(
+                            SessionModel.session_id.in_(list(batch))
+                        )
+                    )
+                ).all()
+            )
+            params = [
+                {"b_session_id": key, **values}
+                for key, values in batch.items()
+                if key in existing
+            ]
+            if params:
+                await session.execute(_UPDATE_STATE, params)
+
+        for key in batch.keys() - existing:
+            # 会话已被删除：丢弃积压状态，之后的保存走同步路径
+            self._known.pop(key, None)
+        return len(params)
+
+    def start(self) -> None:
+        """启动后台周期刷盘任务。"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """停止后台任务并强制刷盘。"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=self._flush_interval
+                )
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("session 状态批量写入失败，将在下个周期重试")
@@ -0,0 +1,207 @@
+"""按用途划分的阻塞任务线程池。
+
+说明：
+- ``asyncio.to_thread`` 共用事件循环的默认线程池（按 CPU 数确定大小），一批慢速 LLM 调用
+  就会占满线程，导出编码、文件读写随之排队
+- 此处按用途创建独立、固定大小的线程池（LLM I/O、导出编码/压缩、文件 I/O），互不挤占
+- 纯 Python 的导出编码受 GIL 限制，在线程中执行仍会拖慢事件循环，可选的进程池用于此类任务
+- 每个线程池记录执行中与排队中的任务数，供 ``/health`` 暴露
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """固定线程数的命名线程池（线程数即并发上限，超出的任务在池内排队）。"""
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        self._name = name
+        self._max_workers = max(1, int(max_workers))
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix=f"{name}-executor"
+        )
+        self._lock = threading.Lock()
+        self._active = 0
+        self._queued = 0
+        self._completed = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """在线程池中执行 fn（与 ``asyncio.to_thread`` 一样传递 contextvars）。"""
+        call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+        return await asyncio.wrap_future(self._submit(call))
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "max_workers": self._max_workers,
+                "active": self._active,
+                "queued": self._queued,
+                "completed": self._completed,
+            }
+
+    @property
+    def idle(self) -> bool:
+        with self._lock:
+            return self._active == 0 and self._queued == 0
+
+    def shutdown(self) -> None:
+        """丢弃尚未开始的任务；执行中的任务在各自线程中自然结束。"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, call: Callable[[], T]) -> Future[T]:
+        def _tracked() -> T:
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+            try:
+                return call()
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._completed += 1
+
+        with self._lock:
+            self._queued += 1
+        try:
+            future = self._pool.submit(_tracked)
+        except BaseException:
+            self._dequeue()
+            raise
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future[Any]) -> None:
+        # 排队中被取消（等待方被取消或线程池关闭）的任务不会执行 _tracked
+        if future.cancelled():
+            self._dequeue()
+
+    def _dequeue(self) -> None:
+        with self._lock:
+            self._queued -= 1
+
+
+class ProcessExecutor:
+    """固定进程数的命名进程池，用于受 GIL 限制的纯 Python CPU 任务。
+
+    说明：
+    - 使用 spawn 启动子进程（避免在多线程进程中 fork），子进程在首次提交任务时才创建
+    - fn 与参数需可 pickle（模块级函数、简单数据结构）
+    - 子进程内的执行状态无法直接观测：执行中数按 min(未完成数, 进程数) 估计，其余视为排队
+    """
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        self._name = name
+        self._max_workers = max(1, int(max_workers))
+        self._pool = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self._pool.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._on_done(None)
+            raise
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            active = min(self._pending, self._max_workers)
+            return {
+                "max_workers": self._max_workers,
+                "active": active,
+                "queued": self._pending - active,
+                "completed": self._completed,
+            }
+
+    @property
+    def idle(self) -> bool:
+        with self._lock:
+            return self._pending == 0
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _on_done(self, future: Future[Any] | None) -> None:
+        with self._lock:
+            self._pending -= 1
+            if future is not None and not future.cancelled():
+                self._completed += 1
+
+
+@dataclass(frozen=True, slots=True)
+class BlockingExecutors:
+    """应用级线程池/进程池集合（在 lifespan 中创建与关闭）。"""
+
+    llm: BoundedExecutor
+    cpu: BoundedExecutor
+    file_io: BoundedExecutor
+    # 导出编码进程池；为 None 时编码在 cpu 线程池执行
+    process: ProcessExecutor | None = None
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        llm_workers: int = 16,
+        cpu_workers: int = 2,
+        file_io_workers: int = 4,
+        process_workers: int = 0,
+    ) -> BlockingExecutors:
+        return cls(
+            llm=BoundedExecutor("llm", llm_workers),
+            cpu=BoundedExecutor("cpu", cpu_workers),
+            file_io=BoundedExecutor("file_io", file_io_workers),
+            process=ProcessExecutor("process", process_workers)
+            if process_workers > 0
+            else None,
+        )
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {executor.name: executor.stats() for executor in self._all()}
+
+    async def drain(self, timeout: float, *, poll_seconds: float = 0.05) -> bool:
+        """等待执行中与排队中的任务（如进行中的 LLM 调用）完成，最多 timeout 秒；返回是否已全部完成。"""
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        while not all(executor.idle for executor in self._all()):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(poll_seconds)
+        return True
+
+    def shutdown(self) -> None:
+        for executor in self._all():
+            executor.shutdown()
+
+    def _all(self) -> tuple[BoundedExecutor | ProcessExecutor, ...]:
+        if self.process is None:
+            return (self.llm, self.cpu, self.file_io)
+        return (self.llm, self.cpu, self.file_io, self.process)
@@ -126,7 +126,37 @@ def install_frontend_deps() -> bool:
     return result.returncode == 0
 
 
-def start_backend(*, enable_public: bool) -> subprocess.Popen | None:
+def _backend_command(src_dir: str, *, production: bool) -> list[str]:
+    if production:
+        # 生产模式：多 worker、uvloop/httptools、优雅停止（见 interview_system.api.run）
+        return [
+            sys.executable,
+            "-m",
+            "interview_system.api.run",
+            "--prod",
+            "--host",
+            "0.0.0.0",
+            "--port",
+            str(BACKEND_PORT),
+        ]
+    return [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "interview_system.api.main:app",
+        "--app-dir",
+        src_dir,
+        "--host",
+        "0.0.0.0",
+        "--port",
+        str(BACKEND_PORT),
+        "--reload",
+    ]
+
+
+def start_backend(
+    *, enable_public: bool, production: bool = False
+) -> subprocess.Popen | None:
     """启动后端服务"""
     log(3, 4, "启动后端服务", "wait")
     try:
@@ -145,20 +175,12 @@ def start_backend(*, enable_public: bool) -> subprocess.Popen | None:
                 ".trycloudflare.com,.ngrok-free.app,.ngrok.io",
             )
 
+        if not production:
+            # --reload 只运行一个 worker（否则按多 worker 启用共享状态）
+            env["SERVER_WORKERS"] = "1"
+
         proc = subprocess.Popen(
-            [
-                sys.executable,
-                "-m",
-                "uvicorn",
-                "interview_system.api.main:app",
-                "--app-dir",
-                src_dir,
-                "--host",
-                "0.0.0.0",
-                "--port",
-                str(BACKEND_PORT),
-                "--reload",
-            ],
+            _backend_command(src_dir, production=production),
             cwd=ROOT_DIR,
             env=env,
         )
@@ -540,7 +562,14 @@ def update_frontend_api_url(backend_url: str):
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Interview System 启动器")
-    parser.add_argument("--public", action="store_true", help="启用公网访问 (cloudflared/ngrok)")
+    parser.add_argument(
+        "--public", action="store_true", help="启用公网访问 (cloudflared/ngrok)"
+    )
+    parser.add_argument(
+        "--prod",
+        action="store_true",
+        help="后端以生产模式运行（多 worker，不自动重载）",
+    )
     return parser.parse_args()
 
 
@@ -596,8 +625,10 @@ def _generate_and_set_admin_token() -> str:
     return token
 
 
-def _start_backend_and_urls(*, enable_public: bool) -> tuple[subprocess.Popen, str, str]:
-    backend = start_backend(enable_public=enable_public)
+def _start_backend_and_urls(
+    *, enable_public: bool, production: bool = False
+) -> tuple[subprocess.Popen, str, str]:
+    backend = start_backend(enable_public=enable_public, production=production)
     if not backend:
         sys.exit(1)
     processes.append(backend)
@@ -685,7 +716,7 @@ def main() -> None:
     print("环境配置完成 ✓")
 
     _backend_proc, backend_url, frontend_url = _start_backend_and_urls(
-        enable_public=args.public
+        enable_public=args.public, production=args.prod
     )
     frontend_url = _start_frontend_and_url(enable_public=args.public, frontend_url=frontend_url)
 
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import gzip
+import importlib.util
+import io
+import re
+import zipfile
+
 from fastapi.testclient import TestClient
 
 from interview_system.api.main import create_app
@@ -22,6 +28,34 @@ def test_admin_endpoints_disabled_by_default():
         assert payload["error"]["code"] == "ADMIN_DISABLED"
 
 
+def test_admin_time_series_groups_rows_into_one_bucket():
+    token = "secret-token"
+    app = create_app(
+        Settings(
+            database_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            allowed_origins=[],
+            admin_token=token,
+        )
+    )
+
+    with TestClient(app) as client:
+        start = client.post("/api/session/start", json={"user_name": "tester"})
+        session_id = start.json()["session"]["id"]
+        for text in ("我认为教学应该以学生为中心", "具体来说，课堂上应该多提问"):
+            send = client.post(
+                f"/api/session/{session_id}/message", json={"text": text}
+            )
+            assert send.status_code == 200
+
+        overview = client.get(
+            "/api/admin/overview?bucket=day", headers={"X-Admin-Token": token}
+        )
+        series = overview.json()["time_series"]
+        # 同一天的会话与消息归入同一个桶
+        assert [(p["sessions"], p["messages"]) for p in series] == [(1, 2)]
+
+
 def test_admin_overview_search_and_export():
     token = "secret-token"
     app = create_app(
@@ -52,6 +86,13 @@ def test_admin_overview_search_and_export():
         data = overview.json()
         assert "summary" in data
         assert "time_series" in data
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2}", data["time_series"][0]["bucket"])
+        assert data["summary"]["total_messages"] >= 1
+
+        hourly = client.get("/api/admin/overview?bucket=hour", headers=headers).json()
+        assert re.fullmatch(
+            r"\d{4}-\d{2}-\d{2} \d{2}", hourly["time_series"][0]["bucket"]
+        )
 
         search = client.get(
             "/api/admin/search?keyword=%E5%AD%A6%E7%94%9F&limit=10",
@@ -60,6 +101,15 @@ def test_admin_overview_search_and_export():
         assert search.status_code == 200
         search_payload = search.json()
         assert search_payload["total"] >= 1
+        assert "next_cursor" in search_payload
+
+        no_total = client.get("/api/admin/sessions?count=none", headers=headers).json()
+        assert no_total["total"] is None
+        assert len(no_total["items"]) == 1
+
+        bad_cursor = client.get("/api/admin/sessions?cursor=%21%21", headers=headers)
+        assert bad_cursor.status_code == 400
+        assert bad_cursor.json()["error"]["code"] == "INVALID_CURSOR"
 
         export_csv = client.get(
             "/api/admin/export?format=csv&scope=conversations&limit=100",
@@ -74,3 +124,49 @@ def test_admin_overview_search_and_export():
         )
         assert export_json.status_code == 200
         assert export_json.headers.get("content-type", "").startswith("application/json")
+        assert len(export_json.json()) >= 1
+
+        export_ndjson = client.get(
+            "/api/admin/export?format=ndjson&scope=sessions", headers=headers
+        )
+        assert export_ndjson.status_code == 200
+        assert export_ndjson.headers["content-type"].startswith("application/x-ndjson")
+        assert export_ndjson.text.count("\n") == 1
+
+        export_xlsx = client.get(
+            "/api/admin/export?format=xlsx&scope=all", headers=headers
+        )
+        assert export_xlsx.status_code == 200
+        assert int(export_xlsx.headers["content-length"]) == len(export_xlsx.content)
+        with zipfile.ZipFile(io.BytesIO(export_xlsx.content)) as z:
+            assert {"xl/worksheets/sheet1.xml", "xl/worksheets/sheet2.xml"} <= set(
+                z.namelist()
+            )
+
+        bad_scope = client.get(
+            "/api/admin/export?format=csv&scope=all", headers=headers
+        )
+        assert bad_scope.status_code == 400
+
+        gz = client.get(
+            "/api/admin/export?format=ndjson&scope=sessions&compression=gzip",
+            headers=headers,
+        )
+        assert gz.status_code == 200
+        assert gz.headers["content-type"] == "application/gzip"
+        assert ".ndjson.gz" in gz.headers["content-disposition"]
+        assert gzip.decompress(gz.content) == export_ndjson.content
+
+        bad_compression = client.get(
+            "/api/admin/export?format=xlsx&compression=gzip", headers=headers
+        )
+        assert bad_compression.status_code == 400
+        assert bad_compression.json()["error"]["code"] == "INVALID_EXPORT_COMPRESSION"
+
+        parquet = client.get("/api/admin/export?format=parquet", headers=headers)
+        if importlib.util.find_spec("pyarrow") is None:
+            assert parquet.status_code == 400
+            assert parquet.json()["error"]["code"] == "EXPORT_FORMAT_UNAVAILABLE"
+        else:
+            assert parquet.status_code == 200
+            assert parquet.content.startswith(b"PAR1")
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from interview_system.api.utils.export_files import stream_export
+from interview_system.application.services.admin_service import AdminService
+from interview_system.domain.entities import Session
+from interview_system.domain.value_objects.conversation_entry import ConversationEntry
+from interview_system.infrastructure.database import AsyncDatabase
+from interview_system.infrastructure.database.repositories import (
+    AdminRepositoryImpl,
+    SessionRepositoryImpl,
+)
+from interview_system.infrastructure.executors import BlockingExecutors
+
+_FILTERS = {
+    "start": None,
+    "end": None,
+    "user_name": None,
+    "topic": None,
+    "keyword": None,
+    "min_depth": None,
+    "max_depth": None,
+    "limit": None,
+    "offset": 0,
+}
+
+
+async def _seeded_service(count: int) -> tuple[AsyncDatabase, AdminService]:
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+    repo = SessionRepositoryImpl(db)
+    session = Session(user_name="tester")
+    await repo.save(session)
+    for i in range(count):
+        await repo.append_conversation_entry(
+            session.id,
+            ConversationEntry(
+                timestamp=datetime.now(UTC),
+                topic="学校-德育",
+                question_type="核心问题",
+                question=f"问题{i}",
+                answer=f'回答, "{i}"\n第二行',
+                depth_score=i % 3,
+                is_ai_generated=False,
+            ),
+        )
+    return db, AdminService(AdminRepositoryImpl(db))
+
+
+async def _collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+@pytest.mark.asyncio
+async def test_export_streams_in_chunks_without_row_cap():
+    db, service = await _seeded_service(5)
+
+    chunks = [
+        chunk
+        async for chunk in service.iter_export_items(
+            scope="conversations", chunk_size=2, **_FILTERS
+        )
+    ]
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    assert "snippet" not in chunks[0][0]
+    assert "timestamp_ms" not in chunks[0][0]
+    assert next(item["question"] for c in chunks for item in c) == "问题4"
+
+    limited = [
+        item
+        async for chunk in service.iter_export_items(
+            scope="conversations", chunk_size=2, **{**_FILTERS, "limit": 3, "offset": 1}
+        )
+        for item in chunk
+    ]
+    assert [item["question"] for item in limited] == ["问题3", "问题2", "问题1"]
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_streaming_encoders_produce_valid_documents():
+    db, service = await _seeded_service(3)
+
+    def _items():
+        return service.iter_export_items(
+            scope="conversations", chunk_size=2, **_FILTERS
+        )
+
+    body = await _collect(AdminService.iter_csv(_items()))
+    assert body.startswith(b"\xef\xbb\xbf") and body.count(b"\xef\xbb\xbf") == 1
+    rows = list(csv.DictReader(io.StringIO(body.decode("utf-8-sig"))))
+    assert len(rows) == 3
+    assert rows[0]["answer"] == '回答, "2"\n第二行'
+
+    lines = (await _collect(AdminService.iter_ndjson(_items()))).decode().splitlines()
+    assert [json.loads(line)["depth_score"] for line in lines] == [2, 1, 0]
+
+    assert len(json.loads(await _collect(AdminService.iter_json(_items())))) == 3
+
+    sessions = service.iter_export_items(scope="sessions", **_FILTERS)
+    assert (
+        json.loads(await _collect(AdminService.iter_json(sessions)))[0]["user_name"]
+        == "tester"
+    )
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_streaming_encoders_handle_empty_exports():
+    db, service = await _seeded_service(0)
+
+    def _items():
+        return service.iter_export_items(scope="conversations", **_FILTERS)
+
+    assert await _collect(AdminService.iter_csv(_items())) == b""
+    assert await _collect(AdminService.iter_ndjson(_items())) == b""
+    assert json.loads(await _collect(AdminService.iter_json(_items()))) == []
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_process_pool_encoding_matches_inline_encoders():
+    db, service = await _seeded_service(5)
+    empty_db, empty = await _seeded_service(0)
+    executors = BlockingExecutors.create(process_workers=1)
+    try:
+        for scope in ("conversations", "sessions"):
+            filters = {**_FILTERS, "scope": scope, "chunk_size": 2}
+            for fmt in ("csv", "json", "ndjson"):
+                inline = await _collect(stream_export(service, filters, format=fmt))
+                pooled = await _collect(
+                    stream_export(service, filters, format=fmt, executors=executors)
+                )
+                assert pooled == inline
+
+        for fmt in ("csv", "json", "ndjson"):
+            filters = {**_FILTERS, "scope": "conversations"}
+            assert await _collect(
+                stream_export(empty, filters, format=fmt, executors=executors)
+            ) == await _collect(stream_export(empty, filters, format=fmt))
+
+        stats = executors.stats()["process"]
+        assert stats["completed"] > 0 and stats["active"] == stats["queued"] == 0
+    finally:
+        executors.shutdown()
+    await db.dispose()
+    await empty_db.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+async def test_columnar_export_writes_typed_record_batches(fmt):
+    pa = pytest.importorskip("pyarrow")
+    from interview_system.api.utils.columnar import ColumnarWriter
+
+    db, service = await _seeded_service(5)
+    buf = io.BytesIO()
+    writer = ColumnarWriter(buf, scope="conversations", format=fmt)
+    exact_ms: list[int | None] = []
+    async for rows in service.iter_export_rows(
+        scope="conversations", chunk_size=2, **_FILTERS
+    ):
+        exact_ms.extend(r.timestamp_ms for r in rows)
+        writer.write_rows(rows)
+    writer.close()
+    buf.seek(0)
+
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(buf)
+        assert pq.ParquetFile(io.BytesIO(buf.getvalue())).metadata.num_row_groups == 3
+    else:
+        reader = pa.ipc.open_file(buf)
+        assert reader.num_record_batches == 3
+        table = reader.read_all()
+
+    assert table.num_rows == 5
+    assert table.schema.field("timestamp").type == pa.timestamp("ms", tz="UTC")
+    assert table.schema.field("depth_score").type == pa.int8()
+    assert table.schema.field("is_ai_generated").type == pa.bool_()
+    assert table.column("depth_score").to_pylist() == [1, 0, 2, 1, 0]
+    # 时间列直接取毫秒列，保留亚秒精度
+    assert None not in exact_ms
+    assert table.column("timestamp").cast(pa.int64()).to_pylist() == exact_ms
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_compressed_stream_round_trips_and_shrinks_text():
+    db, service = await _seeded_service(200)
+    filters = {"scope": "conversations", **_FILTERS}
+
+    plain = await _collect(stream_export(service, filters, format="ndjson"))
+    chunks = [
+        chunk
+        async for chunk in stream_export(
+            service, filters, format="ndjson", compression="gzip"
+        )
+    ]
+    assert gzip.decompress(b"".join(chunks)) == plain
+    assert len(b"".join(chunks)) * 5 < len(plain)
+
+    empty_db, empty = await _seeded_service(0)
+    body = await _collect(
+        stream_export(empty, filters, format="json", compression="gzip")
+    )
+    assert gzip.decompress(body) == b"[]"
+
+    await db.dispose()
+    await empty_db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_zstd_stream_round_trips():
+    zstandard = pytest.importorskip("zstandard")
+    db, service = await _seeded_service(20)
+    filters = {"scope": "conversations", **_FILTERS}
+
+    plain = await _collect(stream_export(service, filters, format="csv"))
+    body = await _collect(
+        stream_export(service, filters, format="csv", compression="zstd")
+    )
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(body) == plain
+
+    await db.dispose()
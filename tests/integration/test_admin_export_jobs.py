@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from interview_system.api.export_jobs import ExportJobManager, ExportQueueFullError
+from interview_system.api.main import create_app
+from interview_system.config.settings import Settings
+
+_TOKEN = "secret-token"
+
+
+def _wait(client: TestClient, job_id: str) -> dict:
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        job = client.get(
+            f"/api/admin/exports/{job_id}", headers={"X-Admin-Token": _TOKEN}
+        ).json()
+        if job["status"] not in ("queued", "running"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError("导出任务未在预期时间内完成")
+
+
+def test_export_job_lifecycle_with_range_download(tmp_path):
+    app = create_app(
+        Settings(
+            database_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            allowed_origins=[],
+            admin_token=_TOKEN,
+            export_dir=str(tmp_path),
+        )
+    )
+    headers = {"X-Admin-Token": _TOKEN}
+
+    with TestClient(app) as client:
+        session_id = client.post(
+            "/api/session/start", json={"user_name": "tester"}
+        ).json()["session"]["id"]
+        send = client.post(
+            f"/api/session/{session_id}/message",
+            json={"text": "我认为应该以学生为中心"},
+        )
+        assert send.status_code == 200
+
+        created = client.post(
+            "/api/admin/exports",
+            json={"scope": "conversations", "format": "csv"},
+            headers=headers,
+        )
+        assert created.status_code == 202
+        job_id = created.json()["job_id"]
+
+        job = _wait(client, job_id)
+        assert job["status"] == "succeeded"
+        assert job["rows_written"] == job["total_rows"] == 1
+        assert job["progress"] == 1.0
+        assert not list(tmp_path.glob("*.part"))
+
+        full = client.get(job["download_url"], headers=headers)
+        assert full.status_code == 200
+        assert full.headers["accept-ranges"] == "bytes"
+        assert len(full.content) == job["size_bytes"]
+        rows = list(csv.DictReader(io.StringIO(full.content.decode("utf-8-sig"))))
+        assert rows[0]["user_name"] == "tester"
+
+        # 断点续传：只取剩余部分
+        partial = client.get(
+            job["download_url"], headers={**headers, "Range": "bytes=10-"}
+        )
+        assert partial.status_code == 206
+        assert partial.content == full.content[10:]
+
+        deleted = client.delete(f"/api/admin/exports/{job_id}", headers=headers)
+        assert deleted.status_code == 204
+        assert not list(tmp_path.iterdir())
+        missing = client.get(f"/api/admin/exports/{job_id}", headers=headers)
+        assert missing.status_code == 404
+        assert missing.json()["error"]["code"] == "EXPORT_JOB_NOT_FOUND"
+
+        bad = client.post(
+            "/api/admin/exports",
+            json={"scope": "all", "format": "csv"},
+            headers=headers,
+        )
+        assert bad.status_code == 400
+
+
+class _BlockingService:
+    """iter_export_items 在 release 之前一直阻塞，用于观察排队与并发上限。"""
+
+    def __init__(self, release: asyncio.Event) -> None:
+        self.release = release
+        self.running = 0
+        self.max_running = 0
+
+    async def count_export_items(self, **_filters) -> int:
+        return 1
+
+    async def iter_export_items(self, **_filters):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await self.release.wait()
+        self.running -= 1
+        yield [{"id": 1}]
+
+
+@pytest.mark.asyncio
+async def test_manager_bounds_concurrency_queue_and_expires_files(tmp_path):
+    release = asyncio.Event()
+    service = _BlockingService(release)
+    manager = ExportJobManager(
+        tmp_path,
+        lambda: service,
+        max_concurrency=1,
+        max_pending=2,
+        ttl_seconds=60,  # type: ignore[arg-type, return-value]
+    )
+    filters = {
+        "start": None,
+        "end": None,
+        "user_name": None,
+        "topic": None,
+        "keyword": None,
+        "min_depth": None,
+        "max_depth": None,
+        "limit": None,
+        "offset": 0,
+    }
+    first = await manager.submit(
+        scope="conversations", format="ndjson", filters=filters
+    )
+    second = await manager.submit(
+        scope="conversations", format="ndjson", filters=filters
+    )
+    with pytest.raises(ExportQueueFullError):
+        await manager.submit(scope="conversations", format="ndjson", filters=filters)
+
+    await asyncio.sleep(0.05)
+    assert (first.status, second.status) == ("running", "queued")
+
+    release.set()
+    for _ in range(100):
+        if first.is_done and second.is_done:
+            break
+        await asyncio.sleep(0.01)
+    assert (first.status, second.status) == ("succeeded", "succeeded")
+    assert service.max_running == 1
+    assert first.path is not None and first.path.read_bytes() == b'{"id": 1}\n'
+
+    assert await manager.cleanup(now=time.time()) == 0
+    assert await manager.cleanup(now=time.time() + 61) == 2
+    assert await manager.get(first.id) is None
+    assert not list(tmp_path.iterdir())
+
+    await manager.close()
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from interview_system.domain.entities import Session
+from interview_system.domain.value_objects.conversation_entry import ConversationEntry
+from interview_system.infrastructure.cache import QueryCache
+from interview_system.infrastructure.database import AsyncDatabase
+from interview_system.infrastructure.database.repositories import (
+    AdminRepositoryImpl,
+    SessionRepositoryImpl,
+)
+
+_BASE = datetime(2024, 6, 1, tzinfo=UTC)
+
+
+def _list_kwargs(**overrides):
+    return {
+        "start": None,
+        "end": None,
+        "user_name": None,
+        "is_finished": None,
+        "limit": 2,
+        "offset": 0,
+        **overrides,
+    }
+
+
+def _search_kwargs(**overrides):
+    return {
+        "start": None,
+        "end": None,
+        "user_name": None,
+        "topic": None,
+        "keyword": None,
+        "min_depth": None,
+        "max_depth": None,
+        "limit": 2,
+        "offset": 0,
+        **overrides,
+    }
+
+
+@pytest.mark.asyncio
+async def test_session_keyset_pages_cover_all_rows_once():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+    sessions = SessionRepositoryImpl(db)
+    # 两个 session 同一时间，验证 session_id 作为并列键
+    for i, offset in enumerate([0, 1, 1, 2, 3]):
+        session = Session(user_name=f"u{i}")
+        session.created_at = _BASE + timedelta(minutes=offset)
+        await sessions.save(session)
+
+    repo = AdminRepositoryImpl(db)
+    seen: list[tuple[str, str]] = []
+    cursor = None
+    while True:
+        page = await repo.list_sessions(**_list_kwargs(cursor=cursor, count="none"))
+        assert page.total is None
+        seen.extend((r.start_time, r.session_id) for r in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert len({sid for _, sid in seen}) == 5
+    assert seen == sorted(seen, reverse=True)
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_session_keyset_pages_include_unknown_start_times_last():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+    sessions = SessionRepositoryImpl(db)
+    for i in range(5):
+        session = Session(user_name=f"u{i}")
+        session.created_at = _BASE + timedelta(minutes=i)
+        await sessions.save(session)
+    # 旧数据中无法解析的开始时间为 NULL：排在最后，翻页时不丢失
+    await db.execute(
+        "UPDATE sessions SET start_time_ms = NULL WHERE user_name IN ('u1', 'u3')"
+    )
+
+    repo = AdminRepositoryImpl(db)
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page = await repo.list_sessions(**_list_kwargs(cursor=cursor, count="none"))
+        seen.extend(r.user_name for r in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen[:3] == ["u4", "u2", "u0"]
+    assert sorted(seen[3:]) == ["u1", "u3"]
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "payload",
+    [{"k": "s"}, {"k": "s", "t": None, "id": 1}, {"k": "s", "t": True, "id": "x"}],
+)
+async def test_session_cursor_rejects_missing_or_mistyped_fields(payload):
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+    cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    # 结构合法但字段缺失/类型错误的游标同样按无效游标处理（接口返回 INVALID_CURSOR）
+    with pytest.raises(ValueError):
+        await AdminRepositoryImpl(db).list_sessions(**_list_kwargs(cursor=cursor))
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_conversation_cursor_and_cached_total():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+    sessions = SessionRepositoryImpl(db)
+    session = Session(user_name="tester")
+    await sessions.save(session)
+
+    async def _append(answer: str) -> None:
+        await sessions.append_conversation_entry(
+            session.id,
+            ConversationEntry(
+                timestamp=datetime.now(UTC),
+                topic="学校-德育",
+                question_type="核心问题",
+                question="Q",
+                answer=answer,
+                depth_score=1,
+                is_ai_generated=False,
+            ),
+        )
+
+    for i in range(3):
+        await _append(f"A{i}")
+
+    repo = AdminRepositoryImpl(db, count_cache=QueryCache(ttl_seconds=60))
+    first = await repo.search_conversations(**_search_kwargs(count="cached"))
+    assert first.total == 3
+    assert [r.answer for r in first.items] == ["A2", "A1"]
+    assert first.next_cursor is not None
+
+    second = await repo.search_conversations(
+        **_search_kwargs(cursor=first.next_cursor, count="cached")
+    )
+    assert [r.answer for r in second.items] == ["A0"]
+    assert second.next_cursor is None
+
+    # 缓存键带数据版本号：有新写入后 cached 重新计数，不返回过期的总数
+    await _append("A3")
+    cached = await repo.search_conversations(**_search_kwargs(count="cached"))
+    assert cached.total == 4
+    exact = await repo.search_conversations(**_search_kwargs(count="exact"))
+    assert exact.total == 4
+
+    with pytest.raises(ValueError):
+        await repo.search_conversations(**_search_kwargs(cursor="not-a-cursor"))
+
+    await db.dispose()
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from interview_system.domain.entities import Session
+from interview_system.domain.value_objects.conversation_entry import ConversationEntry
+from interview_system.infrastructure.database import AsyncDatabase
+from interview_system.infrastructure.database.migrations import (
+    MIGRATIONS,
+    run_migrations,
+)
+from interview_system.infrastructure.database.repositories import (
+    AdminRepositoryImpl,
+    SessionRepositoryImpl,
+)
+
+_DAY = datetime(2024, 6, 1, tzinfo=UTC)
+
+# (user, 开始时间, [(消息时间偏移, 主题, 深度)])
+_SESSIONS = [
+    ("u1", _DAY + timedelta(hours=10, minutes=10), [(5, "A", 1), (65, "B", 3)]),
+    ("u2", _DAY + timedelta(hours=10, minutes=50), [(5, "A", 2), (20, "A", 0)]),
+    ("u1", _DAY + timedelta(hours=12, minutes=5), [(1, "B", 2)]),
+    ("u3", _DAY + timedelta(days=1, hours=9), [(30, "A", 3)]),
+    ("u4", _DAY + timedelta(days=1, hours=9, minutes=20), [(1, "C", 1)]),
+]
+
+_RANGES = [
+    (None, None),
+    (_DAY, _DAY + timedelta(days=2)),
+    (
+        _DAY + timedelta(hours=10, minutes=30),
+        _DAY + timedelta(days=1, hours=9, minutes=30),
+    ),
+    (_DAY + timedelta(hours=10, minutes=5), _DAY + timedelta(hours=10, minutes=55)),
+]
+
+
+def _in(ts: datetime, start: datetime | None, end: datetime | None) -> bool:
+    return (start is None or ts >= start) and (end is None or ts < end)
+
+
+def _expected(data, start, end, unknown_start=()):
+    """直接按明细计算的参考结果（与汇总表无关）；unknown_start 为开始时间未知的会话下标。"""
+    day_sessions: dict[str, int] = defaultdict(int)
+    day_users: dict[str, set[str]] = defaultdict(set)
+    day_logs: dict[str, list[int]] = defaultdict(list)
+    user_sessions: dict[str, int] = defaultdict(int)
+    user_messages: dict[str, int] = defaultdict(int)
+    topics: dict[str, list[int]] = defaultdict(list)
+    for i, (user, started, logs) in enumerate(data):
+        session_in = i not in unknown_start and _in(started, start, end)
+        if session_in:
+            day_sessions[started.strftime("%Y-%m-%d")] += 1
+            day_users[started.strftime("%Y-%m-%d")].add(user)
+            user_sessions[user] += 1
+        for minutes, topic, depth in logs:
+            ts = started + timedelta(minutes=minutes)
+            if not _in(ts, start, end):
+                continue
+            day_logs[ts.strftime("%Y-%m-%d")].append(depth)
+            topics[topic].append(depth)
+            if session_in:
+                user_messages[user] += 1
+
+    series = {
+        day: (
+            day_sessions.get(day, 0),
+            len(day_users.get(day, ())),
+            len(depths),
+            depths,
+        )
+        for day in set(day_sessions) | set(day_logs)
+        for depths in [day_logs.get(day, [])]
+    }
+    return (
+        {
+            day: (s, u, m, round(sum(d) / m, 4) if m else 0.0)
+            for day, (s, u, m, d) in series.items()
+        },
+        {user: (n, user_messages.get(user, 0)) for user, n in user_sessions.items()},
+        {topic: (len(d), round(sum(d) / len(d), 4)) for topic, d in topics.items()},
+    )
+
+
+async def _actual(repo: AdminRepositoryImpl, start, end):
+    series = await repo.get_time_series(start=start, end=end, bucket="day")
+    users = await repo.get_user_activity(start=start, end=end, limit=50)
+    topics = await repo.get_top_topics(start=start, end=end, limit=50)
+    return (
+        {
+            p.bucket: (p.sessions, p.unique_users, p.messages, p.avg_depth_score)
+            for p in series
+        },
+        {u.user_name: (u.sessions, u.messages) for u in users},
+        {t.topic: (t.messages, t.avg_depth_score) for t in topics},
+    )
+
+
+async def _seed(db: AsyncDatabase, data) -> list[Session]:
+    repo = SessionRepositoryImpl(db)
+    created: list[Session] = []
+    for user, started, logs in data:
+        session = Session(user_name=user)
+        session.created_at = started
+        await repo.save(session)
+        for minutes, topic, depth in logs:
+            await repo.append_conversation_entry(
+                session.id,
+                ConversationEntry(
+                    timestamp=started + timedelta(minutes=minutes),
+                    topic=topic,
+                    question_type="核心问题",
+                    question="Q",
+                    answer="A",
+                    depth_score=depth,
+                    is_ai_generated=False,
+                ),
+            )
+        created.append(session)
+    return created
+
+
+@pytest.mark.asyncio
+async def test_rollups_match_detail_aggregates_after_writes_and_deletes():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+    created = await _seed(db, _SESSIONS)
+    repo = AdminRepositoryImpl(db)
+
+    for start, end in _RANGES:
+        assert await _actual(repo, start, end) == _expected(_SESSIONS, start, end)
+
+    # 删除会话（级联删除对话）后汇总同步扣减
+    await SessionRepositoryImpl(db).delete(created[1].id)
+    remaining = [row for i, row in enumerate(_SESSIONS) if i != 1]
+    for start, end in _RANGES:
+        assert await _actual(repo, start, end) == _expected(remaining, start, end)
+
+    # 撤销最后一条对话
+    await SessionRepositoryImpl(db).delete_last_conversation_entry(created[0].id)
+    remaining[0] = (*remaining[0][:2], remaining[0][2][:1])
+    assert await _actual(repo, None, None) == _expected(remaining, None, None)
+
+    # 会话改名：已有消息的汇总行随之迁移
+    await db.execute(
+        "UPDATE sessions SET user_name = 'u9' WHERE session_id = :sid",
+        {"sid": str(created[2].id)},
+    )
+    remaining[1] = ("u9", *remaining[1][1:])
+    for start, end in _RANGES:
+        assert await _actual(repo, start, end) == _expected(remaining, start, end)
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sessions_with_unknown_start_time_stay_out_of_session_metrics():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+    created = await _seed(db, _SESSIONS)
+    repo = AdminRepositoryImpl(db)
+
+    # 旧数据中无法解析的开始时间回填为 NULL：会话不计入会话数与按会话统计的消息数，
+    # 其消息仍按消息时间计入
+    await db.execute(
+        "UPDATE sessions SET start_time_ms = NULL WHERE session_id = :sid",
+        {"sid": str(created[0].id)},
+    )
+    for start, end in [*_RANGES, (None, _DAY + timedelta(days=2))]:
+        assert await _actual(repo, start, end) == _expected(
+            _SESSIONS, start, end, unknown_start={0}
+        )
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_rollup_migration_backfills_existing_rows():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await run_migrations(engine=db.engine, migrations=MIGRATIONS[:4])
+    await _seed(db, _SESSIONS)
+    result = await db.execute("SELECT COUNT(*) FROM admin_rollup_messages")
+    assert result.scalar_one() == 0
+
+    await run_migrations(engine=db.engine, backfill_batch_size=2)
+    repo = AdminRepositoryImpl(db)
+    for start, end in _RANGES:
+        assert await _actual(repo, start, end) == _expected(_SESSIONS, start, end)
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_time_series_groups_rows_into_one_bucket_per_day_and_hour():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+    await _seed(db, _SESSIONS)
+    repo = AdminRepositoryImpl(db)
+
+    daily = await repo.get_time_series(start=None, end=None, bucket="day")
+    assert [(p.bucket, p.sessions, p.messages) for p in daily] == [
+        ("2024-06-01", 3, 5),
+        ("2024-06-02", 2, 2),
+    ]
+
+    hourly = await repo.get_time_series(start=None, end=None, bucket="hour")
+    assert [(p.bucket, p.sessions, p.messages) for p in hourly] == [
+        ("2024-06-01 10", 2, 2),
+        ("2024-06-01 11", 0, 2),
+        ("2024-06-01 12", 1, 1),
+        ("2024-06-02 09", 2, 2),
+    ]
+
+    await db.dispose()
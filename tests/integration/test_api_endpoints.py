@@ -23,6 +23,9 @@ def test_api_session_flow_and_errors():
     with TestClient(app) as client:
         health = client.get("/health")
         assert health.status_code == 200
+        assert health.json()["sqlite"]["temp_store"] == "MEMORY"
+        assert set(health.json()["executors"]) == {"llm", "cpu", "file_io", "process"}
+        assert health.json()["executors"]["llm"]["max_workers"] == 16
 
         r = client.post("/api/session/start", json={})
         assert r.status_code == 200
@@ -101,3 +104,37 @@ def test_api_public_url_endpoint(monkeypatch):
                 "url": "https://example.trycloudflare.com",
                 "is_public": True,
             }
+
+
+def test_api_idempotent_answer_submission(monkeypatch):
+    monkeypatch.delenv("API_KEY", raising=False)
+    app = create_app(
+        Settings(
+            database_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            allowed_origins=[],
+        )
+    )
+
+    with TestClient(app) as client:
+        session_id = client.post("/api/session/start", json={}).json()["session"]["id"]
+        url = f"/api/session/{session_id}/message"
+        headers = {"Idempotency-Key": "3f7c1f0e-retry"}
+        body = {"text": "我认为教学应该以学生为中心，关注学生的全面发展。"}
+
+        first = client.post(url, json=body, headers=headers)
+        assert first.status_code == 200
+        assert "idempotent-replayed" not in first.headers
+
+        retry = client.post(url, json=body, headers=headers)
+        assert retry.status_code == 200
+        assert retry.headers["idempotent-replayed"] == "true"
+        assert retry.json()["content"] == first.json()["content"]
+
+        # 重试没有再写入对话记录
+        messages = client.get(f"/api/session/{session_id}/messages").json()
+        assert [m["role"] for m in messages] == ["assistant", "user", "assistant"]
+
+        reused = client.post(url, json={"text": "另一个回答"}, headers=headers)
+        assert reused.status_code == 422
+        assert reused.json()["error"]["code"] == "IDEMPOTENCY_KEY_REUSED"
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from interview_system.infrastructure.executors import BlockingExecutors, BoundedExecutor
+
+
+@pytest.mark.asyncio
+async def test_slow_llm_calls_do_not_starve_other_executors():
+    executors = BlockingExecutors.create(
+        llm_workers=1, cpu_workers=1, file_io_workers=1
+    )
+    release = threading.Event()
+    try:
+        slow = [
+            asyncio.create_task(executors.llm.run(release.wait, 5)) for _ in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        assert executors.llm.stats() == {
+            "max_workers": 1,
+            "active": 1,
+            "queued": 2,
+            "completed": 0,
+        }
+
+        # LLM 线程池占满时，CPU/文件 I/O 线程池仍可立即执行
+        name = await asyncio.wait_for(
+            executors.cpu.run(lambda: threading.current_thread().name), timeout=1
+        )
+        assert name.startswith("cpu-executor")
+        assert (
+            await asyncio.wait_for(executors.file_io.run(sum, [1, 2]), timeout=1) == 3
+        )
+
+        release.set()
+        assert await asyncio.gather(*slow) == [True, True, True]
+        stats = executors.stats()
+        assert stats["llm"]["active"] == stats["llm"]["queued"] == 0
+        assert stats["llm"]["completed"] == 3
+        assert stats["cpu"]["completed"] == stats["file_io"]["completed"] == 1
+    finally:
+        release.set()
+        executors.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_call_is_not_counted():
+    executor = BoundedExecutor("test", 1)
+    release = threading.Event()
+    try:
+        running = asyncio.create_task(executor.run(release.wait, 5))
+        queued = asyncio.create_task(executor.run(lambda: "never"))
+        await asyncio.sleep(0.05)
+        assert executor.stats()["queued"] == 1
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert executor.stats()["queued"] == 0
+
+        release.set()
+        assert await running is True
+        assert executor.stats()["completed"] == 1
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_in_flight_calls():
+    executors = BlockingExecutors.create(llm_workers=1)
+    release = threading.Event()
+    try:
+        call = asyncio.create_task(executors.llm.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+        assert await executors.drain(0.1) is False
+
+        asyncio.get_running_loop().call_later(0.05, release.set)
+        assert await executors.drain(2) is True
+        assert await call is True
+    finally:
+        release.set()
+        executors.shutdown()
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from interview_system.domain.entities import Session
+from interview_system.domain.value_objects.conversation_entry import ConversationEntry
+from interview_system.infrastructure.database import AsyncDatabase
+from interview_system.infrastructure.database.migrations import (
+    MIGRATIONS,
+    run_migrations,
+)
+from interview_system.infrastructure.database.repositories import (
+    AdminRepositoryImpl,
+    SessionRepositoryImpl,
+)
+
+
+def _entry(answer: str) -> ConversationEntry:
+    return ConversationEntry(
+        timestamp=datetime.now(UTC),
+        topic="学校-德育",
+        question_type="核心问题",
+        question="请谈谈你的教学理念",
+        answer=answer,
+        depth_score=1,
+        is_ai_generated=False,
+    )
+
+
+async def _search(repo: AdminRepositoryImpl, keyword: str):
+    page = await repo.search_conversations(
+        start=None,
+        end=None,
+        user_name=None,
+        topic=None,
+        keyword=keyword,
+        min_depth=None,
+        max_depth=None,
+        limit=10,
+        offset=0,
+    )
+    return page.total, page.items
+
+
+@pytest.mark.asyncio
+async def test_fts_search_returns_ranked_snippets_and_tracks_deletes():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+    if not db.fts_enabled:
+        pytest.skip("SQLite 未编译 FTS5 trigram")
+
+    sessions = SessionRepositoryImpl(db)
+    admin = AdminRepositoryImpl(db)
+    session = Session(user_name="tester")
+    await sessions.save(session)
+    await sessions.append_conversation_entry(
+        session.id, _entry("以学生为中心，以学生为中心")
+    )
+    await sessions.append_conversation_entry(session.id, _entry("课堂上要以学生为中心"))
+    await sessions.append_conversation_entry(session.id, _entry("Teaching Matters"))
+
+    total, rows = await _search(admin, "以学生为中心")
+    assert total == 2
+    assert rows[0].answer == "以学生为中心，以学生为中心"  # 命中次数多的排在前面
+    assert "<mark>" in (rows[0].snippet or "")
+
+    total, rows = await _search(admin, "teaching")  # 大小写不敏感
+    assert total == 1
+
+    # 短关键字回退到 LIKE，不返回片段
+    total, rows = await _search(admin, "课堂")
+    assert total == 1
+    assert rows[0].snippet is None
+
+    # 撤销（删除日志）后全文索引同步
+    await sessions.delete_last_conversation_entry(session.id)
+    total, _rows = await _search(admin, "teaching")
+    assert total == 0
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_fts_migration_backfills_existing_rows_in_batches():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await run_migrations(engine=db.engine, migrations=MIGRATIONS[:3])
+
+    sessions = SessionRepositoryImpl(db)
+    session = Session(user_name="tester")
+    await sessions.save(session)
+    for i in range(5):
+        await sessions.append_conversation_entry(session.id, _entry(f"历史回答第{i}条"))
+
+    await db.init()  # 应用剩余迁移（含全文索引回填）
+    if not db.fts_enabled:
+        pytest.skip("SQLite 未编译 FTS5 trigram")
+
+    result = await db.execute(
+        "SELECT last_id, upper_id FROM migration_progress WHERE name = 'conversation_fts'"
+    )
+    assert result.one() == (5, 5)
+
+    total, _rows = await _search(AdminRepositoryImpl(db), "历史回答")
+    assert total == 5
+
+    await db.dispose()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from interview_system.domain.entities import Session
+from interview_system.infrastructure.database import AsyncDatabase, SqlitePragmas
+from interview_system.infrastructure.database.repositories import SessionRepositoryImpl
+
+
+@pytest.mark.asyncio
+async def test_sqlite_pragmas_applied_on_new_connections(tmp_path):
+    db = AsyncDatabase(
+        f"sqlite+aiosqlite:///{tmp_path / 'tuned.db'}",
+        sqlite_pragmas=SqlitePragmas(busy_timeout_ms=1234, cache_size=-4096),
+    )
+    await db.init()
+
+    settings = await db.sqlite_settings()
+    assert settings == {
+        "tuned": True,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout_ms": 1234,
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -4096,
+        "temp_store": "MEMORY",
+    }
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_defaults_without_pragmas(tmp_path):
+    db = AsyncDatabase(f"sqlite+aiosqlite:///{tmp_path / 'plain.db'}")
+    await db.init()
+
+    settings = await db.sqlite_settings()
+    assert settings is not None
+    assert settings["tuned"] is False
+    assert settings["journal_mode"] == "DELETE"
+    assert settings["synchronous"] == "FULL"
+
+    await db.dispose()
+
+
+_SLOW_SQL = (
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 100000000) "
+    "SELECT count(*) FROM c"
+)
+
+
+@pytest.mark.asyncio
+async def test_read_engine_is_read_only_with_statement_timeout(tmp_path):
+    db = AsyncDatabase(
+        f"sqlite+aiosqlite:///{tmp_path / 'read.db'}",
+        sqlite_pragmas=SqlitePragmas(),
+        read_pool_size=1,
+        read_statement_timeout_ms=50,
+    )
+    await db.init()
+    assert db.read_engine_mode == "readonly"
+    await SessionRepositoryImpl(db).save(Session(user_name="tester"))
+
+    async with db.read_session() as session:
+        count = (await session.execute(text("SELECT count(*) FROM sessions"))).scalar()
+        assert count == 1
+
+        with pytest.raises(OperationalError, match="readonly"):
+            await session.execute(text("DELETE FROM sessions"))
+        await session.rollback()
+
+        with pytest.raises(OperationalError, match="interrupted"):
+            await session.execute(text(_SLOW_SQL))
+        await session.rollback()
+
+        # 单条语句可通过 execution_options 覆盖超时
+        quick = await session.execute(
+            text("SELECT count(*) FROM sessions").execution_options(
+                statement_timeout_ms=0
+            )
+        )
+        assert quick.scalar() == 1
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_read_engine_shared_for_memory_database():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+    assert db.read_engine_mode == "shared"
+
+    async with db.read_session() as session:
+        assert (await session.execute(text("SELECT 1"))).scalar() == 1
+
+    # 共用单连接时并发只读会话串行执行
+    async def _read() -> int:
+        async with db.read_session() as session:
+            return int(
+                (await session.execute(text("SELECT count(*) FROM sessions"))).scalar()
+            )
+
+    assert await asyncio.gather(_read(), _read(), _read()) == [0, 0, 0]
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_write_version_advances_on_commit():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    before = db.write_version
+    async with db.read_session() as session:
+        await session.execute(text("SELECT 1"))
+    assert db.write_version == before
+
+    # 只读事务（如健康检查）提交不递增
+    assert await db.health_check() is True
+    assert db.write_version == before
+
+    await SessionRepositoryImpl(db).save(Session(user_name="tester"))
+    assert db.write_version > before
+
+    after_save = db.write_version
+    await db.execute("UPDATE sessions SET user_name = 'renamed'")
+    assert db.write_version == after_save + 1
+
+    # 回滚的写入不递增，且不影响之后的只读事务
+    with pytest.raises(RuntimeError):
+        async with db.transaction() as session:
+            await session.execute(text("DELETE FROM sessions"))
+            raise RuntimeError("abort")
+    await db.health_check()
+    assert db.write_version == after_save + 1
+
+    await db.dispose()
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime
+
 import pytest
+from sqlalchemy import event
 
 from interview_system.infrastructure.database import AsyncDatabase
+from interview_system.infrastructure.database.migrations import (
+    MIGRATIONS,
+    Migration,
+    current_schema_version,
+    run_migrations,
+)
 
 
 @pytest.mark.asyncio
@@ -25,3 +34,144 @@ async def test_migrations_create_tables_and_columns():
     assert "answer" in columns2
 
     await db.dispose()
+
+
+_LEGACY_SCHEMA = [
+    """
+    CREATE TABLE sessions (
+        session_id VARCHAR PRIMARY KEY,
+        user_name VARCHAR NOT NULL,
+        start_time VARCHAR NOT NULL,
+        end_time VARCHAR,
+        is_finished INTEGER NOT NULL DEFAULT 0,
+        current_question_idx INTEGER NOT NULL DEFAULT 0,
+        selected_topics TEXT,
+        created_at VARCHAR,
+        updated_at VARCHAR
+    )
+    """,
+    """
+    CREATE TABLE conversation_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id VARCHAR REFERENCES sessions(session_id),
+        timestamp VARCHAR NOT NULL,
+        topic VARCHAR NOT NULL DEFAULT '',
+        question_type VARCHAR NOT NULL DEFAULT '',
+        question TEXT NOT NULL DEFAULT '',
+        answer TEXT NOT NULL DEFAULT '',
+        depth_score INTEGER NOT NULL DEFAULT 0,
+        is_ai_generated INTEGER NOT NULL DEFAULT 0,
+        created_at VARCHAR
+    )
+    """,
+]
+
+
+@pytest.mark.asyncio
+async def test_migrations_backfill_epoch_ms_in_batches(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}"
+    legacy = AsyncDatabase(url)
+    for ddl in _LEGACY_SCHEMA:
+        await legacy.execute(ddl)
+    for i in range(5):
+        await legacy.execute(
+            "INSERT INTO sessions (session_id, user_name, start_time) "
+            "VALUES (:sid, 'u', '2024-01-02 03:04:05')",
+            {"sid": f"s{i}"},
+        )
+        await legacy.execute(
+            "INSERT INTO conversation_logs (session_id, timestamp) "
+            "VALUES (:sid, '2024-01-02 03:04:06')",
+            {"sid": f"s{i}"},
+        )
+    await legacy.execute(
+        "INSERT INTO conversation_logs (session_id, timestamp) VALUES ('s0', 'broken')"
+    )
+    await legacy.execute(
+        "INSERT INTO sessions (session_id, user_name, start_time) "
+        "VALUES ('s5', 'u', 'broken')"
+    )
+    await legacy.execute(
+        "INSERT INTO conversation_logs (session_id, timestamp) "
+        "VALUES ('s5', '2024-01-02 03:04:06')"
+    )
+    await legacy.dispose()
+
+    db = AsyncDatabase(url)
+    await run_migrations(engine=db.engine, backfill_batch_size=2)
+
+    expected = int(datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC).timestamp() * 1000)
+    # 无法解析的时间回填为 NULL（而不是 1970-01-01），不参与时间筛选与汇总
+    result = await db.execute(
+        "SELECT DISTINCT start_time_ms FROM sessions ORDER BY start_time_ms"
+    )
+    assert [row[0] for row in result.fetchall()] == [None, expected]
+
+    result = await db.execute("SELECT timestamp_ms FROM conversation_logs ORDER BY id")
+    assert [row[0] for row in result.fetchall()] == [expected + 1000] * 5 + [
+        None,
+        expected + 1000,
+    ]
+
+    result = await db.execute("SELECT SUM(sessions) FROM admin_rollup_sessions")
+    assert result.scalar() == 5
+
+    result = await db.execute("PRAGMA index_list(conversation_logs)")
+    assert "idx_log_timestamp_ms" in {row[1] for row in result.fetchall()}
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_migrations_record_versions_and_skip_when_current():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+
+    result = await db.execute(
+        "SELECT version, name FROM schema_version ORDER BY version"
+    )
+    assert [row[0] for row in result.fetchall()] == [m.version for m in MIGRATIONS]
+
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(db.engine.sync_engine, "before_cursor_execute", _record)
+    assert await run_migrations(engine=db.engine) == []
+    event.remove(db.engine.sync_engine, "before_cursor_execute", _record)
+
+    # 已是最新版本：只检查版本表，不做任何表结构探测
+    assert len(statements) == 2
+    assert not any("PRAGMA" in s for s in statements)
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_migrations_resume_after_failed_step():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    calls: list[str] = []
+
+    async def _ok(_engine, _batch_size):
+        calls.append("ok")
+
+    async def _boom(_engine, _batch_size):
+        calls.append("boom")
+        raise RuntimeError("interrupted")
+
+    with pytest.raises(RuntimeError):
+        await run_migrations(
+            engine=db.engine,
+            migrations=[Migration(1, "ok", _ok), Migration(2, "boom", _boom)],
+        )
+    assert await current_schema_version(db.engine) == 1
+
+    applied = await run_migrations(
+        engine=db.engine,
+        migrations=[Migration(1, "ok", _ok), Migration(2, "fixed", _ok)],
+    )
+    assert applied == [2]
+    assert calls == ["ok", "boom", "ok"]
+
+    await db.dispose()
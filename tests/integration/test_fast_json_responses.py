@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from interview_system.api.main import create_app
+from interview_system.api.schemas.admin import (
+    AdminListResponse,
+    AdminOverviewResponse,
+    AdminSearchResponse,
+)
+from interview_system.api.schemas.message import MessageResponse, MessageSyncResponse
+from interview_system.api.schemas.session import SessionResponse, StartSessionResponse
+from interview_system.config.settings import Settings
+
+TOKEN = "secret-token"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.delenv("API_KEY", raising=False)
+    app = create_app(
+        Settings(
+            database_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            allowed_origins=[],
+            admin_token=TOKEN,
+            fast_json_responses=True,
+        )
+    )
+    with TestClient(app) as c:
+        yield c
+
+
+def _assert_canonical(model: Any, body: Any) -> None:
+    # 快速路径跳过了 response_model 校验：payload 必须与校验后再序列化的结果完全一致
+    adapter = TypeAdapter(model)
+    assert adapter.dump_python(adapter.validate_python(body), mode="json") == body
+
+
+def test_fast_json_interview_routes_match_response_models(client):
+    start = client.post("/api/session/start", json={"user_name": "测试"})
+    assert start.status_code == 200
+    assert start.headers["content-type"] == "application/json"
+    _assert_canonical(StartSessionResponse, start.json())
+    assert '"user_name":"测试"' in start.text
+    session_id = start.json()["session"]["id"]
+
+    sent = client.post(
+        f"/api/session/{session_id}/message",
+        json={"text": "我认为教学应该以学生为中心，关注学生的全面发展。"},
+    )
+    _assert_canonical(MessageResponse, sent.json())
+    _assert_canonical(
+        MessageResponse, client.post(f"/api/session/{session_id}/skip").json()
+    )
+    _assert_canonical(
+        list[MessageResponse], client.post(f"/api/session/{session_id}/undo").json()
+    )
+    _assert_canonical(SessionResponse, client.get(f"/api/session/{session_id}").json())
+
+    messages = client.get(f"/api/session/{session_id}/messages")
+    _assert_canonical(list[MessageResponse], messages.json())
+    # 直接返回响应对象时仍带上 ETag
+    etag = messages.headers["etag"]
+    cached = client.get(
+        f"/api/session/{session_id}/messages", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+
+    sync = client.get(f"/api/session/{session_id}/messages/sync")
+    assert sync.headers["etag"] == etag
+    _assert_canonical(MessageSyncResponse, sync.json())
+
+
+def test_fast_json_admin_routes_match_response_models(client):
+    session_id = client.post("/api/session/start", json={"user_name": "tester"}).json()[
+        "session"
+    ]["id"]
+    client.post(
+        f"/api/session/{session_id}/message",
+        json={"text": "我认为教学应该以学生为中心"},
+    )
+    headers = {"X-Admin-Token": TOKEN}
+
+    overview = client.get("/api/admin/overview", headers=headers)
+    _assert_canonical(AdminOverviewResponse, overview.json())
+
+    sessions = client.get("/api/admin/sessions", headers=headers)
+    assert sessions.json()["total"] == 1
+    _assert_canonical(AdminListResponse, sessions.json())
+
+    search = client.get("/api/admin/search", headers=headers)
+    assert search.json()["total"] == 1
+    _assert_canonical(AdminSearchResponse, search.json())
+
+
+def test_json_response_skips_validation_only_when_enabled():
+    pytest.importorskip("orjson")
+    from fastapi import Response
+
+    from interview_system.api.responses import FastJSONResponse, json_response
+
+    payload = {"messages": [], "cursor": "1.0"}
+    assert json_response(payload, fast=False) is payload
+
+    source = Response()
+    source.headers["ETag"] = '"v1"'
+    fast = json_response(payload, fast=True, headers_from=source)
+    assert isinstance(fast, FastJSONResponse)
+    assert fast.body == b'{"messages":[],"cursor":"1.0"}'
+    assert fast.headers["etag"] == '"v1"'
+    assert fast.headers.getlist("content-length") == [str(len(fast.body))]
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from interview_system.api.main import create_app
+from interview_system.config.settings import Settings
+
+ANSWER = "我认为教学应该以学生为中心，关注学生的全面发展。"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.delenv("API_KEY", raising=False)
+    app = create_app(
+        Settings(
+            database_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            allowed_origins=[],
+        )
+    )
+    with TestClient(app) as c:
+        yield c
+
+
+def _start(client: TestClient) -> str:
+    return client.post("/api/session/start", json={"user_name": "tester"}).json()[
+        "session"
+    ]["id"]
+
+
+def test_messages_have_stable_ids_and_etag(client):
+    session_id = _start(client)
+    client.post(f"/api/session/{session_id}/message", json={"text": ANSWER})
+
+    first = client.get(f"/api/session/{session_id}/messages")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    body = first.json()
+    assert body[0]["id"].startswith("log") and body[0]["id"].endswith("-q")
+    assert body[-1]["id"] == "pending"
+
+    # 版本未变：重复读取结果一致，带 If-None-Match 时返回 304
+    assert client.get(f"/api/session/{session_id}/messages").json() == body
+    cached = client.get(
+        f"/api/session/{session_id}/messages", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    client.post(f"/api/session/{session_id}/skip")
+    changed = client.get(
+        f"/api/session/{session_id}/messages", headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_turn_replies_use_transcript_message_ids(client):
+    session_id = _start(client)
+
+    reply = client.post(f"/api/session/{session_id}/message", json={"text": ANSWER})
+    transcript = client.get(f"/api/session/{session_id}/messages").json()
+    # 回复即当前待回答问题：id 与 /messages 末尾一致，客户端可按 id 合并
+    assert reply.json()["id"] == transcript[-1]["id"] == "pending"
+    assert reply.json()["content"] == transcript[-1]["content"]
+
+    # 跳过到最后：结束语不在对话记录中，使用固定的 finished
+    ids = []
+    for _ in range(20):
+        skipped = client.post(f"/api/session/{session_id}/skip").json()
+        ids.append(skipped["id"])
+        if skipped["id"] != "pending":
+            break
+    assert ids[-1] == "finished"
+    assert set(ids[:-1]) <= {"pending"}
+
+
+def test_sync_returns_only_new_messages(client):
+    session_id = _start(client)
+    url = f"/api/session/{session_id}/messages/sync"
+
+    full = client.get(url).json()
+    assert full["reset"] is False
+    assert [m["id"] for m in full["messages"]] == ["pending"]
+
+    unchanged = client.get(url, params={"since": full["cursor"]})
+    assert unchanged.json()["messages"] == []
+    assert unchanged.json()["cursor"] == full["cursor"]
+
+    client.post(f"/api/session/{session_id}/message", json={"text": ANSWER})
+    delta = client.get(url, params={"since": full["cursor"]}).json()
+    assert delta["reset"] is False
+    assert [m["role"] for m in delta["messages"]] == ["assistant", "user", "assistant"]
+    assert delta["messages"][1]["content"] == ANSWER
+    assert delta["cursor"] != full["cursor"]
+
+    # 增量拼接结果与完整读取一致
+    transcript = client.get(f"/api/session/{session_id}/messages").json()
+    assert [m["id"] for m in delta["messages"]] == [m["id"] for m in transcript]
+
+    etag = client.get(url, params={"since": delta["cursor"]}).headers["etag"]
+    polled = client.get(
+        url, params={"since": delta["cursor"]}, headers={"If-None-Match": etag}
+    )
+    assert polled.status_code == 304
+
+
+def test_sync_resets_after_undo(client):
+    session_id = _start(client)
+    url = f"/api/session/{session_id}/messages/sync"
+    client.post(f"/api/session/{session_id}/message", json={"text": ANSWER})
+    before = client.get(url).json()
+
+    client.post(f"/api/session/{session_id}/undo")
+    # 撤销后新记录可能复用被删除记录的 id，游标之后的增量不可信，必须整体重发
+    client.post(
+        f"/api/session/{session_id}/message", json={"text": ANSWER + "（重答）"}
+    )
+
+    after = client.get(url, params={"since": before["cursor"]}).json()
+    assert after["reset"] is True
+    transcript = client.get(f"/api/session/{session_id}/messages").json()
+    assert [m["content"] for m in after["messages"]] == [
+        m["content"] for m in transcript
+    ]
+
+    again = client.get(url, params={"since": after["cursor"]}).json()
+    assert again["reset"] is False
+    assert again["messages"] == []
+
+
+def test_sync_rejects_invalid_cursor(client):
+    session_id = _start(client)
+    resp = client.get(
+        f"/api/session/{session_id}/messages/sync", params={"since": "abc"}
+    )
+    assert resp.status_code == 400
+    assert resp.json()["error"]["code"] == "INVALID_CURSOR"
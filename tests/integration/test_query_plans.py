@@ -0,0 +1,171 @@
+"""热点查询的 EXPLAIN QUERY PLAN 回归测试：确保走索引、不做全表扫描。"""
+
+from __future__ import annotations
+
+import re
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from interview_system.domain.entities import Session
+from interview_system.infrastructure.database import AsyncDatabase
+from interview_system.infrastructure.database.repositories import (
+    AdminRepositoryImpl,
+    SessionRepositoryImpl,
+)
+
+_FULL_SCAN = re.compile(
+    r"^SCAN (sessions|conversation_logs|admin_rollup_sessions|admin_rollup_messages)\b"
+)
+
+_END = datetime(2024, 6, 1, tzinfo=UTC)
+_START = _END - timedelta(days=7)
+
+
+@pytest_asyncio.fixture
+async def db():
+    database = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await database.init()
+    yield database
+    await database.dispose()
+
+
+async def _plans(db: AsyncDatabase, call) -> list[list[str]]:
+    """执行 call 并返回其中每条 SELECT 的查询计划。"""
+    captured: list[tuple[str, tuple]] = []
+
+    def _record(_conn, _cursor, statement, params, _context, _many):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, params))
+
+    event.listen(db.engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        await call()
+    finally:
+        event.remove(db.engine.sync_engine, "before_cursor_execute", _record)
+
+    assert captured, "未捕获到查询"
+    plans: list[list[str]] = []
+    async with db.engine.connect() as conn:
+        for statement, params in captured:
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", params
+            )
+            plans.append([str(row[3]) for row in result.fetchall()])
+    return plans
+
+
+def _assert_no_full_scan(plans: list[list[str]]) -> None:
+    for plan in plans:
+        scans = [detail for detail in plan if _FULL_SCAN.match(detail)]
+        assert not scans, plan
+
+
+@pytest.mark.asyncio
+async def test_conversation_entries_use_session_index_in_id_order(db):
+    repo = SessionRepositoryImpl(db)
+    session = Session(user_name="tester")
+    await repo.save(session)
+
+    for call in (
+        lambda: repo.list_conversation_entries(session.id),
+        lambda: repo.delete_last_conversation_entry(session.id),
+    ):
+        plans = await _plans(db, call)
+        _assert_no_full_scan(plans)
+        # session_id 索引隐含 rowid(id)，按 id 排序无需临时 B 树
+        assert not any("TEMP B-TREE" in d for plan in plans for d in plan), plans
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("filters", "index"),
+    [
+        ({"user_name": "tester"}, "idx_session_user_time"),
+        ({"is_finished": True}, "idx_session_finished_time"),
+        ({"start": _START, "end": _END}, "idx_session_start_ms"),
+    ],
+)
+async def test_list_sessions_uses_index(db, filters, index):
+    repo = AdminRepositoryImpl(db)
+    kwargs = {
+        "start": None,
+        "end": None,
+        "user_name": None,
+        "is_finished": None,
+        "limit": 50,
+        "offset": 0,
+        **filters,
+    }
+
+    plans = await _plans(db, lambda: repo.list_sessions(**kwargs))
+    _assert_no_full_scan(plans)
+    assert all(any(index in d for d in plan) for plan in plans), plans
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("filters", "index"),
+    [
+        ({"topic": "学校-德育", "min_depth": 1}, "idx_log_topic_time"),
+        ({}, "idx_log_timestamp_ms"),
+        ({"keyword": "以学生为中心"}, "conversation_fts VIRTUAL TABLE"),
+    ],
+)
+async def test_search_conversations_uses_index(db, filters, index):
+    if "keyword" in filters and not db.fts_enabled:
+        pytest.skip("SQLite 未编译 FTS5 trigram")
+    repo = AdminRepositoryImpl(db)
+    kwargs = {
+        "start": _START,
+        "end": _END,
+        "user_name": None,
+        "topic": None,
+        "keyword": None,
+        "min_depth": None,
+        "max_depth": None,
+        "limit": 50,
+        "offset": 0,
+        **filters,
+    }
+
+    plans = await _plans(db, lambda: repo.search_conversations(**kwargs))
+    _assert_no_full_scan(plans)
+    assert all(any(index in d for d in plan) for plan in plans), plans
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method", ["get_time_series", "get_user_activity", "get_top_topics"]
+)
+async def test_overview_reads_rollups_and_indexes_edges(db, method):
+    repo = AdminRepositoryImpl(db)
+    extra = {"bucket": "day"} if method == "get_time_series" else {"limit": 10}
+    call = getattr(repo, method)
+
+    # 整点对齐：只读小时汇总表
+    plans = await _plans(db, lambda: call(start=_START, end=_END, **extra))
+    _assert_no_full_scan(plans)
+    details = [d for plan in plans for d in plan]
+    assert any("sqlite_autoindex_admin_rollup" in d for d in details), plans
+    assert not any(
+        re.search(r"\b(sessions|conversation_logs)\b", d) for d in details
+    ), plans
+
+    # 非整点：首尾不足一小时的部分走明细表的时间索引
+    plans = await _plans(
+        db,
+        lambda: call(
+            start=_START + timedelta(minutes=30),
+            end=_END - timedelta(minutes=30),
+            **extra,
+        ),
+    )
+    _assert_no_full_scan(plans)
+    details = [d for plan in plans for d in plan]
+    assert any("sqlite_autoindex_admin_rollup" in d for d in details), plans
+    assert any(
+        "idx_session_start_ms" in d or "idx_log_timestamp_ms" in d for d in details
+    ), plans
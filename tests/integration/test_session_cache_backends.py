@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from interview_system.domain.entities import Session
+from interview_system.infrastructure.cache import SessionCache
+from interview_system.infrastructure.cache.backends import (
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    SqliteCacheBackend,
+)
+from interview_system.infrastructure.database import AsyncDatabase
+from interview_system.infrastructure.database.repositories import (
+    SessionRepositoryImpl,
+    session_repository_impl,
+)
+from interview_system.infrastructure.executors import BoundedExecutor
+
+
+def _redis_backend() -> RedisCacheBackend:
+    pytest.importorskip("redis")
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")  # fakeredis 执行 Lua 脚本所需
+    return RedisCacheBackend("redis://stand-in", client=fakeredis.FakeAsyncRedis())
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCacheBackend()
+    if request.param == "sqlite":
+        return SqliteCacheBackend(str(tmp_path / "cache.db"))
+    return _redis_backend()
+
+
+def _session(version: int, *, question: int = 0) -> Session:
+    session = Session(user_name="tester", current_question_idx=question)
+    session.selected_topics = [{"name": "学校-德育", "questions": ["Q1"]}]
+    session.version = version
+    return session
+
+
+@pytest.mark.asyncio
+async def test_cache_never_goes_back_to_an_older_version(backend):
+    cache = SessionCache(backend=backend)
+    newer = _session(2, question=2)
+    key = str(newer.id)
+    await cache.set(newer)
+
+    older = _session(1, question=1)
+    older.id = newer.id
+    await cache.set(older)
+
+    cached = await cache.get(key)
+    assert cached is not None
+    assert (cached.version, cached.current_question_idx) == (2, 2)
+    assert cached.selected_topics == newer.selected_topics
+    assert cached.created_at == newer.created_at
+    # 每次读取都是独立对象
+    assert cached is not await cache.get(key)
+
+    # 保存冲突：库中已有 v3，v2 及之前的内容失效，且不会被延迟的旧写入恢复
+    await cache.invalidate(key, min_version=3)
+    assert await cache.get(key) is None
+    await cache.set(newer)
+    assert await cache.get(key) is None
+    newest = _session(3, question=3)
+    newest.id = newer.id
+    await cache.set(newest)
+    assert (await cache.get(key)).current_question_idx == 3
+
+    await cache.delete(key)
+    await cache.set(newest)
+    assert await cache.get(key) is None
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_expires_and_trims_entries(tmp_path):
+    backend = SqliteCacheBackend(
+        str(tmp_path / "cache.db"), ttl_seconds=0.01, max_entries=2
+    )
+    await backend.set("a", 5, b"v5")
+    await asyncio.sleep(0.02)
+    assert await backend.get("a") is None
+    # 过期条目不再阻止较低版本写入
+    assert await backend.set("a", 1, b"v1") is True
+
+    for key in ("b", "c", "d"):
+        await backend.set(key, 1, key.encode())
+    backend._purge(now=0)
+    (count,) = (
+        backend._connect().execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+    )
+    assert count == 2
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_runs_on_the_given_executor(tmp_path):
+    executor = BoundedExecutor("file-io", 1)
+    try:
+        backend = SqliteCacheBackend(str(tmp_path / "cache.db"), executor=executor)
+        assert await backend.set("a", 1, b"v1") is True
+        assert await backend.get("a") == b"v1"
+        # 阻塞的 sqlite3 调用均在线程池中执行，不占用事件循环
+        assert executor.stats()["completed"] == 2
+        await backend.close()
+    finally:
+        executor.shutdown()
+
+
+class _FailingWrites(MemoryCacheBackend):
+    """写入内容时出错，占位仍可写入（模拟短暂的后端故障）。"""
+
+    failing = False
+
+    async def set(self, key: str, version: int, value: bytes | None) -> bool:
+        if self.failing and value is not None:
+            raise OSError("backend unavailable")
+        return await super().set(key, version, value)
+
+
+@pytest.mark.asyncio
+async def test_failed_cache_write_invalidates_older_entry():
+    backend = _FailingWrites()
+    cache = SessionCache(backend=backend)
+    session = _session(1)
+    await cache.set(session)
+
+    backend.failing = True
+    session.version = 2
+    session.current_question_idx = 1
+    await cache.set(session)
+    # 新版本未写入时不再返回旧版本，调用方回退到数据库
+    assert await cache.get(str(session.id)) is None
+
+    backend.failing = False
+    await cache.set(session)
+    assert (await cache.get(str(session.id))).current_question_idx == 1
+
+
+@pytest.mark.asyncio
+async def test_workers_sharing_a_sqlite_cache_see_each_others_updates(tmp_path):
+    db = AsyncDatabase(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    await db.init()
+    cache_path = str(tmp_path / "session_cache.db")
+    cache_a = SessionCache(backend=SqliteCacheBackend(cache_path))
+    cache_b = SessionCache(backend=SqliteCacheBackend(cache_path))
+    worker_a = SessionRepositoryImpl(db, cache=cache_a)
+    worker_b = SessionRepositoryImpl(db, cache=cache_b)
+
+    session = Session(user_name="tester")
+    await worker_a.save(session)
+    seen_by_b = await worker_b.get(session.id)
+    assert seen_by_b is not None and seen_by_b.version == 1
+
+    updated = await worker_a.get(session.id)
+    updated.current_question_idx = 1
+    await worker_a.save(updated)
+
+    # B 缓存命中的是 A 写入的新版本，而不是 B 之前读到的旧状态
+    fresh = await worker_b.get(session.id)
+    assert (fresh.version, fresh.current_question_idx) == (2, 1)
+
+    await cache_a.close()
+    await cache_b.close()
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_stops_serving_the_old_version_before_commit(
+    tmp_path, monkeypatch
+):
+    db = AsyncDatabase(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    await db.init()
+    cache_path = str(tmp_path / "session_cache.db")
+    cache_a = SessionCache(backend=SqliteCacheBackend(cache_path))
+    cache_b = SessionCache(backend=SqliteCacheBackend(cache_path))
+    worker_a = SessionRepositoryImpl(db, cache=cache_a)
+
+    session = Session(user_name="tester")
+    await worker_a.save(session)
+    assert await cache_b.get(str(session.id)) is not None
+
+    seen_during_commit: list[Session | None] = []
+    write_entries = session_repository_impl._write_entries
+
+    async def observe(*args, **kwargs):
+        seen_during_commit.append(await cache_b.get(str(session.id)))
+        await write_entries(*args, **kwargs)
+
+    monkeypatch.setattr(session_repository_impl, "_write_entries", observe)
+    session.current_question_idx = 1
+    await worker_a.save(session)
+
+    # 提交完成前其他 worker 已不再命中旧版本；提交后命中新版本
+    assert seen_during_commit == [None]
+    fresh = await cache_b.get(str(session.id))
+    assert (fresh.version, fresh.current_question_idx) == (2, 1)
+
+    await cache_a.close()
+    await cache_b.close()
+    await db.dispose()
@@ -54,3 +54,94 @@ async def test_session_repository_save_get_delete_and_logs():
     assert await repo.get(session.id) is None
 
     await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_session_repository_rejects_stale_save():
+    from interview_system.domain.repositories import StaleSessionError
+
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+    # 两个仓储各自带缓存，模拟共享同一数据库的两个 worker
+    worker_a = SessionRepositoryImpl(db, cache=SessionCache())
+    worker_b = SessionRepositoryImpl(db, cache=SessionCache())
+
+    session = Session(user_name="tester")
+    await worker_a.save(session)
+    assert session.version == 1
+
+    seen_by_a = await worker_a.get(session.id)
+    seen_by_b = await worker_b.get(session.id)
+    assert seen_by_a is not None and seen_by_b is not None
+    # 缓存返回副本，修改不会影响缓存中的对象
+    seen_by_a.current_question_idx = 5
+    assert (await worker_a.get(session.id)).current_question_idx == 0
+
+    entry = ConversationEntry(
+        timestamp=datetime.now(timezone.utc),
+        topic="学校-德育",
+        question_type="核心问题",
+        question="Q1",
+        answer="A1",
+    )
+    seen_by_a.current_question_idx = 1
+    await worker_a.save(seen_by_a, new_entry=entry)
+    assert seen_by_a.version == 2
+
+    seen_by_b.current_question_idx = 1
+    with pytest.raises(StaleSessionError):
+        await worker_b.save(seen_by_b, new_entry=entry)
+    # 冲突时对话记录不写入
+    assert len(await worker_b.list_conversation_entries(session.id)) == 1
+
+    # 冲突后缓存已失效，重新读取得到最新版本即可继续
+    fresh = await worker_b.get(session.id)
+    assert fresh is not None and fresh.version == 2
+    fresh.current_question_idx = 2
+    await worker_b.save(fresh)
+    assert (await worker_a.list_conversation_entries(session.id))[0].answer == "A1"
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_stale_rewind_keeps_conversation_entries():
+    from interview_system.domain.repositories import StaleSessionError
+
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+    worker_a = SessionRepositoryImpl(db, cache=SessionCache())
+    worker_b = SessionRepositoryImpl(db, cache=SessionCache())
+
+    def entry(answer: str) -> ConversationEntry:
+        return ConversationEntry(
+            timestamp=datetime.now(timezone.utc),
+            topic="学校-德育",
+            question_type="核心问题",
+            question="Q",
+            answer=answer,
+        )
+
+    session = Session(user_name="tester")
+    await worker_a.save(session, new_entry=entry("A1"))
+    seen_by_a = await worker_a.get(session.id)
+    advanced = await worker_b.get(session.id)
+    advanced.current_question_idx = 1
+    await worker_b.save(advanced, new_entry=entry("A2"))
+
+    # A 基于旧版本撤销：记录删除随版本冲突一起回滚
+    last = await worker_a.get_last_conversation_entry(session.id)
+    assert last is not None and last.answer == "A2"
+    with pytest.raises(StaleSessionError):
+        await worker_a.save(seen_by_a, delete_entries_from=last.id)
+    assert [e.answer for e in await worker_a.list_conversation_entries(session.id)] == [
+        "A1",
+        "A2",
+    ]
+
+    fresh = await worker_a.get(session.id)
+    fresh.current_question_idx = 0
+    await worker_a.save(fresh, delete_entries_from=0)
+    assert await worker_b.list_conversation_entries(session.id) == []
+
+    await db.dispose()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from interview_system.domain.entities import Session
+from interview_system.domain.value_objects.conversation_entry import ConversationEntry
+from interview_system.infrastructure.database import AsyncDatabase, SessionStateBuffer
+from interview_system.infrastructure.database.repositories import SessionRepositoryImpl
+
+
+async def _db_question_idx(db: AsyncDatabase, session_id: str) -> int:
+    result = await db.execute(
+        "SELECT current_question_idx FROM sessions WHERE session_id = :sid",
+        {"sid": session_id},
+    )
+    return int(result.scalar_one())
+
+
+@pytest.mark.asyncio
+async def test_write_behind_defers_state_until_flush():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+    buffer = SessionStateBuffer(db, flush_interval_seconds=60, max_pending=100)
+    repo = SessionRepositoryImpl(db, write_buffer=buffer)
+
+    session = Session(user_name="tester")
+    await repo.save(session)  # 首次保存同步插入
+    assert buffer.pending_count == 0
+
+    session.current_question_idx = 2
+    session.is_followup = True
+    session.current_followup_question = "F1"
+    await repo.save(session)
+    assert buffer.pending_count == 1
+    assert await _db_question_idx(db, str(session.id)) == 0
+
+    # 无缓存时读取仍以缓冲状态为准
+    loaded = await repo.get(session.id)
+    assert loaded is not None
+    assert loaded.current_question_idx == 2
+    assert loaded.current_followup_question == "F1"
+
+    # 对话日志不经过缓冲
+    await repo.append_conversation_entry(
+        session.id,
+        ConversationEntry(
+            timestamp=datetime.now(UTC),
+            topic="学校-德育",
+            question_type="核心问题",
+            question="Q1",
+            answer="A1",
+            depth_score=1,
+            is_ai_generated=False,
+        ),
+    )
+    assert len(await repo.list_conversation_entries(session.id)) == 1
+
+    assert await buffer.flush() == 1
+    assert buffer.pending_count == 0
+    assert await _db_question_idx(db, str(session.id)) == 2
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_close_forces_flush_and_delete_discards():
+    db = AsyncDatabase("sqlite+aiosqlite:///:memory:")
+    await db.init()
+    buffer = SessionStateBuffer(db, flush_interval_seconds=60, max_pending=100)
+    buffer.start()
+    repo = SessionRepositoryImpl(db, write_buffer=buffer)
+
+    kept = Session(user_name="kept")
+    dropped = Session(user_name="dropped")
+    await repo.save(kept)
+    await repo.save(dropped)
+
+    kept.current_question_idx = 3
+    dropped.current_question_idx = 4
+    await repo.save(kept)
+    await repo.save(dropped)
+    assert buffer.pending_count == 2
+
+    assert await repo.delete(dropped.id) is True
+    assert buffer.pending_count == 1
+
+    await buffer.close()
+    assert buffer.pending_count == 0
+    assert await _db_question_idx(db, str(kept.id)) == 3
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_flush_skips_sessions_deleted_while_pending(tmp_path):
+    db = AsyncDatabase(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    await db.init()
+    buffer = SessionStateBuffer(db, flush_interval_seconds=60, max_pending=100)
+    repo = SessionRepositoryImpl(db, write_buffer=buffer)
+
+    kept = Session(user_name="kept")
+    gone = Session(user_name="gone")
+    await repo.save(kept)
+    await repo.save(gone)
+    kept.current_question_idx = 3
+    gone.current_question_idx = 4
+    await repo.save(kept)
+    await repo.save(gone)
+
+    # 绕过缓冲直接删除：积压批次中含有已不存在的行
+    await db.execute(
+        "DELETE FROM sessions WHERE session_id = :sid", {"sid": str(gone.id)}
+    )
+    assert await buffer.flush() == 1
+    assert buffer.pending_count == 0
+    assert not buffer.is_persisted(str(gone.id))
+    assert await _db_question_idx(db, str(kept.id)) == 3
+
+    # 删除与刷盘并发：两者都成功，缓冲不会卡住
+    other = Session(user_name="other")
+    await repo.save(other)
+    other.current_question_idx = 1
+    kept.current_question_idx = 5
+    await repo.save(other)
+    await repo.save(kept)
+    flushed, deleted = await asyncio.gather(buffer.flush(), repo.delete(kept.id))
+    assert deleted is True
+    assert flushed in (1, 2)
+    assert buffer.pending_count == 0
+    assert await _db_question_idx(db, str(other.id)) == 1
+
+    other.current_question_idx = 2
+    await repo.save(other)
+    assert await buffer.flush() == 1
+    assert await _db_question_idx(db, str(other.id)) == 2
+
+    await db.dispose()
@@ -0,0 +1,291 @@
+"""多 worker 共享状态：两个 AsyncDatabase 连接同一个库文件，模拟两个 worker 进程。"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from interview_system.api.export_jobs import ExportJobManager, ExportQueueFullError
+from interview_system.application.services.interview_service import InterviewService
+from interview_system.domain.entities import Session
+from interview_system.domain.services.answer_processor import AnswerProcessor
+from interview_system.domain.services.followup_generator import FollowupGenerator
+from interview_system.infrastructure.database import AsyncDatabase
+from interview_system.infrastructure.database.export_job_store import SqlExportJobStore
+from interview_system.infrastructure.database.idempotency_store import (
+    SqlIdempotencyStore,
+)
+from interview_system.infrastructure.database.models import IdempotencyKeyModel
+from interview_system.infrastructure.database.repositories import (
+    AdminRepositoryImpl,
+    SessionRepositoryImpl,
+)
+
+_TOPICS = {
+    "TOPICS": [
+        {
+            "name": "学校-德育",
+            "scene": "学校",
+            "edu_type": "德育",
+            "questions": ["Q1"],
+            "followups": ["F1"],
+        }
+    ],
+    "SCENES": ["学校"],
+    "EDU_TYPES": ["德育"],
+}
+
+_FILTERS = {
+    "start": None,
+    "end": None,
+    "user_name": None,
+    "topic": None,
+    "keyword": None,
+    "min_depth": None,
+    "max_depth": None,
+    "limit": None,
+    "offset": 0,
+}
+
+
+async def _workers(tmp_path, count: int = 2) -> list[AsyncDatabase]:
+    url = f"sqlite+aiosqlite:///{tmp_path / 'shared.db'}"
+    dbs = [AsyncDatabase(url) for _ in range(count)]
+    for db in dbs:
+        await db.init()
+    return dbs
+
+
+@pytest.mark.asyncio
+async def test_shared_data_version_sees_writes_from_other_workers(tmp_path):
+    worker_a, worker_b = await _workers(tmp_path)
+    admin_b = AdminRepositoryImpl(worker_b, shared_data_version=True)
+
+    before = await admin_b.data_version()
+    local_before = worker_b.write_version
+    await SessionRepositoryImpl(worker_a).save(Session(user_name="tester"))
+
+    # 本进程的写入版本号看不到其他 worker 的写入，共享计数可以
+    assert worker_b.write_version == local_before
+    assert await admin_b.data_version() > before
+
+    await worker_a.dispose()
+    await worker_b.dispose()
+
+
+class _CountingLLM:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def generate_followup(self, answer, topic, conversation_log=None):
+        self.calls += 1
+        time.sleep(0.2)
+        return "AI 追问"
+
+
+def _service(db: AsyncDatabase, llm: _CountingLLM) -> InterviewService:
+    return InterviewService(
+        repository=SessionRepositoryImpl(db),
+        answer_processor=AnswerProcessor(
+            depth_keywords=["具体"], common_keywords=[], max_depth_score=4
+        ),
+        followup_generator=FollowupGenerator(
+            llm=llm,
+            min_answer_length=10,
+            max_followups_per_question=3,
+            max_depth_score=4,
+        ),
+        topics_source=_TOPICS,
+        total_questions=1,
+        idempotency_store=SqlIdempotencyStore(db, ttl_seconds=60),
+    )
+
+
+@pytest.mark.asyncio
+async def test_idempotent_retry_on_another_worker_waits_for_first_result(tmp_path):
+    worker_a, worker_b = await _workers(tmp_path)
+    llm = _CountingLLM()
+    service_a, service_b = _service(worker_a, llm), _service(worker_b, llm)
+    session = await service_a.start_session(user_name="tester", topics=None)
+
+    first = asyncio.create_task(
+        service_a.process_answer(
+            session_id=session.id, answer="短", idempotency_key="k1"
+        )
+    )
+    await asyncio.sleep(0.05)
+    # 客户端超时后重发，请求被路由到另一个 worker
+    retry = await service_b.process_answer(
+        session_id=session.id, answer="短", idempotency_key="k1"
+    )
+    original = await first
+
+    assert original.replayed is False
+    assert retry.replayed is True
+    assert retry.assistant_message == original.assistant_message
+    assert llm.calls == 1
+    entries = await SessionRepositoryImpl(worker_b).list_conversation_entries(
+        session.id
+    )
+    assert len(entries) == 1
+
+    await worker_a.dispose()
+    await worker_b.dispose()
+
+
+class _BlockingService:
+    def __init__(self, release: asyncio.Event) -> None:
+        self.release = release
+
+    async def count_export_items(self, **_filters) -> int:
+        return 1
+
+    async def iter_export_items(self, **_filters):
+        await self.release.wait()
+        yield [{"id": 1}]
+
+
+def _manager(tmp_path, db: AsyncDatabase, service, **kwargs) -> ExportJobManager:
+    return ExportJobManager(
+        tmp_path / "exports",
+        lambda: service,
+        max_pending=1,
+        ttl_seconds=60,
+        store=SqlExportJobStore(db),
+        sync_interval_seconds=0.01,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_jobs_are_visible_and_deletable_from_other_workers(tmp_path):
+    worker_a, worker_b = await _workers(tmp_path)
+    release = asyncio.Event()
+    service = _BlockingService(release)
+    manager_a = _manager(tmp_path, worker_a, service)
+    manager_b = _manager(tmp_path, worker_b, service)
+    await manager_a.start()
+    await manager_b.start()
+
+    job = await manager_a.submit(
+        scope="conversations", format="ndjson", filters=_FILTERS
+    )
+    await asyncio.sleep(0.05)
+    seen = await manager_b.get(job.id)
+    assert seen is not None and seen.status == "running"
+    # 排队上限按全部 worker 合计
+    with pytest.raises(ExportQueueFullError):
+        await manager_b.submit(scope="conversations", format="ndjson", filters=_FILTERS)
+
+    release.set()
+    for _ in range(100):
+        seen = await manager_b.get(job.id)
+        if seen is not None and seen.is_done:
+            break
+        await asyncio.sleep(0.01)
+    assert seen is not None and seen.status == "succeeded"
+    assert seen.path is not None and seen.path.read_bytes() == b'{"id": 1}\n'
+
+    # 其他 worker 启动时只清理无登记的残留文件
+    orphan = tmp_path / "exports" / f"{'0' * 32}.csv"
+    orphan.write_bytes(b"stale")
+    restarted = _manager(tmp_path, worker_b, service)
+    await restarted.start()
+    assert not orphan.exists()
+    assert seen.path.exists()
+    await restarted.close()
+
+    assert await manager_b.delete(job.id) is True
+    assert not list((tmp_path / "exports").iterdir())
+    assert await manager_a.get(job.id) is None
+
+    await manager_a.close()
+    await manager_b.close()
+    await worker_a.dispose()
+    await worker_b.dispose()
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_running_job_from_another_worker_cancels_it(tmp_path):
+    worker_a, worker_b = await _workers(tmp_path)
+    service = _BlockingService(asyncio.Event())
+    manager_a = _manager(tmp_path, worker_a, service)
+    manager_b = _manager(tmp_path, worker_b, service)
+    await manager_a.start()
+
+    job = await manager_a.submit(
+        scope="conversations", format="ndjson", filters=_FILTERS
+    )
+    await asyncio.sleep(0.05)
+    assert await manager_b.delete(job.id) is True
+
+    for _ in range(100):
+        if job.is_done:
+            break
+        await asyncio.sleep(0.01)
+    assert job.status == "cancelled"
+    assert not list((tmp_path / "exports").glob("*.part"))
+
+    await manager_a.close()
+    await worker_a.dispose()
+    await worker_b.dispose()
+
+
+@pytest.mark.asyncio
+async def test_jobs_of_an_exited_worker_are_failed_and_cleaned(tmp_path):
+    (worker,) = await _workers(tmp_path, count=1)
+    manager = _manager(tmp_path, worker, _BlockingService(asyncio.Event()))
+
+    # 已退出的 worker 登记的执行中任务：心跳不再刷新，临时文件残留
+    job_id = "a" * 32
+    assert await SqlExportJobStore(worker).insert(
+        {
+            "id": job_id,
+            "scope": "conversations",
+            "format": "ndjson",
+            "compression": "none",
+            "filters": _FILTERS,
+            "filename": "conversations.ndjson",
+            "created_at": time.time(),
+            "status": "running",
+            "started_at": time.time(),
+            "finished_at": None,
+            "rows_written": 0,
+            "total_rows": 1,
+            "error": None,
+        },
+        max_pending=1,
+    )
+    part = tmp_path / "exports" / f"{job_id}.ndjson.part"
+    part.parent.mkdir()
+    part.write_bytes(b"partial")
+
+    assert await manager.cleanup(now=time.time() + 1) == 0
+    assert part.exists()
+
+    now = time.time() + 31
+    assert await manager.cleanup(now=now) == 0
+    seen = await manager.get(job_id)
+    assert seen is not None and seen.status == "failed"
+    assert not part.exists()
+
+    assert await manager.cleanup(now=now + 60) == 1
+    assert await manager.get(job_id) is None
+
+    await worker.dispose()
+
+
+def test_idempotency_store_builds_the_claim_insert_for_the_database_dialect():
+    def store(dialect: str) -> SqlIdempotencyStore:
+        engine = SimpleNamespace(dialect=SimpleNamespace(name=dialect))
+        return SqlIdempotencyStore(cast(AsyncDatabase, SimpleNamespace(engine=engine)))
+
+    claim = store("postgresql")._insert(IdempotencyKeyModel).on_conflict_do_nothing()
+    assert "ON CONFLICT DO NOTHING" in str(claim.compile(dialect=postgresql.dialect()))
+    with pytest.raises(ValueError):
+        store("mysql")
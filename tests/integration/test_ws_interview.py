@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from interview_system.api.main import create_app
+from interview_system.config.settings import Settings
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.delenv("API_KEY", raising=False)
+    app = create_app(
+        Settings(
+            database_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            allowed_origins=[],
+        )
+    )
+    with TestClient(app) as c:
+        yield c
+
+
+def _command(ws, payload: dict) -> dict:
+    ws.send_json(payload)
+    ack = ws.receive_json()
+    expected = (
+        {"type": "ack", "id": payload["id"]} if "id" in payload else {"type": "ack"}
+    )
+    assert ack == expected
+    return ws.receive_json()
+
+
+def test_ws_channel_sends_turn_deltas(client):
+    start = client.post("/api/session/start", json={"user_name": "tester"}).json()
+    session_id = start["session"]["id"]
+    first_question = start["messages"][-1]["content"]
+
+    with client.websocket_connect(f"/ws/session/{session_id}") as ws:
+        ready = ws.receive_json()
+        assert ready["type"] == "ready"
+        assert ready["session"]["id"] == session_id
+
+        answered = _command(
+            ws,
+            {
+                "type": "answer",
+                "id": "a1",
+                "text": "我认为教学应该以学生为中心，关注学生的全面发展。",
+            },
+        )
+        assert answered["type"] == "message"
+        assert answered["id"] == "a1"
+        assert answered["message"]["role"] == "assistant"
+        assert answered["message"]["id"] == "pending"
+        assert answered["finished"] is False
+        # 只推送本轮增量，不回传完整记录
+        assert set(answered) == {"type", "id", "message", "finished"}
+
+        transcript = client.get(f"/api/session/{session_id}/messages").json()
+        undone = _command(ws, {"type": "undo", "id": "u1"})
+        assert undone["type"] == "undo"
+        # 按 id 截断：删除被撤销的问答，末尾的待回答问题由 message 替换
+        assert undone["truncate_from"] == transcript[0]["id"]
+        assert undone["message"]["id"] == "pending"
+        assert undone["message"]["content"] == first_question
+        assert undone["session"]["current_question"] == 0
+
+        skipped = _command(ws, {"type": "skip"})
+        assert skipped["type"] == "message"
+
+        restarted = _command(ws, {"type": "restart", "id": "r1"})
+        assert restarted["type"] == "restart"
+        assert restarted["session"]["current_question"] == 0
+        assert restarted["message"]["content"] == first_question
+        assert restarted["message"]["id"] == "pending"
+
+        ws.send_json({"type": "ping", "id": "p"})
+        assert ws.receive_json() == {"type": "pong", "id": "p"}
+
+    messages = client.get(f"/api/session/{session_id}/messages").json()
+    assert [m["content"] for m in messages] == [first_question]
+
+
+def test_ws_channel_reports_errors_without_closing(client):
+    session_id = client.post("/api/session/start", json={}).json()["session"]["id"]
+
+    with client.websocket_connect(f"/ws/session/{session_id}") as ws:
+        ws.receive_json()
+
+        ws.send_text("not json")
+        assert ws.receive_json()["error"]["code"] == "INVALID_COMMAND"
+
+        ws.send_json({"type": "answer", "text": "  "})
+        assert ws.receive_json()["error"]["code"] == "INVALID_COMMAND"
+
+        failed = _command(ws, {"type": "undo", "id": "u"})
+        assert failed["type"] == "error"
+        assert failed["id"] == "u"
+        assert failed["error"]["code"] == "NO_MESSAGES_TO_UNDO"
+
+        ws.send_json({"type": "ping"})
+        assert ws.receive_json() == {"type": "pong"}
+
+
+def test_ws_channel_closes_for_unknown_session(client):
+    with (
+        client.websocket_connect(
+            "/ws/session/00000000-0000-0000-0000-000000000000"
+        ) as ws,
+        pytest.raises(WebSocketDisconnect) as exc,
+    ):
+        ws.receive_json()
+    assert exc.value.code == 4404
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import multiprocessing
+import sys
+import types
+
+from fastapi.testclient import TestClient
+
+from interview_system.api.container import AppContainer, EnvFollowupLLM
+from interview_system.api.main import _is_multi_worker, create_app
+from interview_system.config.settings import Settings
+from interview_system.infrastructure.cache.idempotency import MemoryIdempotencyStore
+from interview_system.infrastructure.database.export_job_store import SqlExportJobStore
+from interview_system.infrastructure.database.idempotency_store import (
+    SqlIdempotencyStore,
+)
+
+
+def test_container_is_built_once_and_shared_across_requests():
+    app = create_app(
+        Settings(
+            database_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            allowed_origins=[],
+        )
+    )
+
+    with TestClient(app) as client:
+        container = app.state.container
+        assert isinstance(container, AppContainer)
+        interview = container.interview_service
+
+        for _ in range(2):
+            r = client.post("/api/session/start", json={"user_name": "tester"})
+            assert r.status_code == 200
+
+        assert app.state.container is container
+        assert container.interview_service is interview
+        assert container.session_service._repository is container.session_repository
+        assert isinstance(container.idempotency_store, MemoryIdempotencyStore)
+        assert container.export_jobs._store is None
+
+
+def test_multi_worker_app_disables_process_local_session_state():
+    app = create_app(
+        Settings(
+            database_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            allowed_origins=[],
+            server_workers=4,
+            session_write_behind=True,
+        )
+    )
+
+    with TestClient(app):
+        container = app.state.container
+        # 其他 worker 的更新在本进程不可见：不缓存会话、不延迟写入
+        assert container.session_cache is None
+        assert container.session_write_buffer is None
+        assert container.session_repository._cache is None
+        # 幂等键、导出任务与查询缓存版本号改用库中的共享状态
+        assert isinstance(container.idempotency_store, SqlIdempotencyStore)
+        assert isinstance(container.export_jobs._store, SqlExportJobStore)
+        assert container.admin_repository._shared_data_version is True
+
+
+def test_multi_worker_app_keeps_a_shared_session_cache(tmp_path):
+    app = create_app(
+        Settings(
+            database_url="sqlite+aiosqlite:///:memory:",
+            log_level="INFO",
+            allowed_origins=[],
+            server_workers=4,
+            session_cache_backend="sqlite",
+            session_cache_url=str(tmp_path / "session_cache.db"),
+        )
+    )
+
+    with TestClient(app) as client:
+        container = app.state.container
+        assert container.session_cache is not None
+        assert container.session_repository._cache is container.session_cache
+        r = client.post("/api/session/start", json={"user_name": "tester"})
+        session_id = r.json()["session"]["id"]
+        assert client.get(f"/api/session/{session_id}").status_code == 200
+
+
+def test_env_followup_llm_checks_api_key_per_call(monkeypatch):
+    llm = EnvFollowupLLM()
+    calls: list[str] = []
+    llm._generate = lambda answer, topic, log: calls.append(answer) or "追问"  # type: ignore[method-assign]
+
+    monkeypatch.delenv("API_KEY", raising=False)
+    assert llm.generate_followup("回答", {}) is None
+
+    monkeypatch.setenv("API_KEY", "sk-test")
+    assert llm.generate_followup("回答", {}) == "追问"
+    assert calls == ["回答"]
+
+
+def test_unset_server_workers_follows_the_process_model(monkeypatch):
+    def settings(workers: int) -> Settings:
+        return Settings(
+            database_url="sqlite+aiosqlite:///:memory:", server_workers=workers
+        )
+
+    assert _is_multi_worker(settings(1)) is False
+    assert _is_multi_worker(settings(4)) is True
+
+    # 未设置时：直接运行为单 worker，由 uvicorn --workers 派生或在 gunicorn 下按多 worker
+    monkeypatch.delitem(sys.modules, "gunicorn", raising=False)
+    monkeypatch.setattr(multiprocessing, "parent_process", lambda: None)
+    assert _is_multi_worker(settings(0)) is False
+    monkeypatch.setattr(multiprocessing, "parent_process", lambda: object())
+    assert _is_multi_worker(settings(0)) is True
+    monkeypatch.setattr(multiprocessing, "parent_process", lambda: None)
+    monkeypatch.setitem(sys.modules, "gunicorn", types.ModuleType("gunicorn"))
+    assert _is_multi_worker(settings(0)) is True
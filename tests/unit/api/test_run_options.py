@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from interview_system.api.run import default_workers, server_options
+from interview_system.config.settings import Settings
+
+
+def test_development_mode_reloads_in_a_single_process():
+    options = server_options(Settings(log_level="INFO"), production=False, port=9000)
+    assert options == {
+        "host": "0.0.0.0",
+        "port": 9000,
+        "log_level": "info",
+        "reload": True,
+    }
+
+
+def test_production_mode_uses_workers_and_tuned_server():
+    settings = Settings(
+        log_level="INFO",
+        server_keep_alive_seconds=20,
+        server_backlog=4096,
+        server_graceful_shutdown_seconds=45,
+    )
+    options = server_options(settings, production=True)
+    assert options["reload"] is False
+    assert options["workers"] == default_workers()
+    assert options["loop"] in {"uvloop", "auto"}
+    assert options["http"] in {"httptools", "auto"}
+    assert options["timeout_keep_alive"] == 20
+    assert options["backlog"] == 4096
+    assert options["timeout_graceful_shutdown"] == 45
+
+    assert server_options(Settings(server_workers=3), production=True)["workers"] == 3
+    assert (
+        server_options(Settings(server_workers=3), production=True, workers=5)[
+            "workers"
+        ]
+        == 5
+    )
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import io
+import zipfile
+from xml.etree import ElementTree
+
+from interview_system.api.utils import xlsx
+from interview_system.api.utils.xlsx import XlsxWriter
+
+_NS = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+def _read(data: bytes) -> tuple[list[str], list[str], dict[str, list[list[str]]]]:
+    """返回 (sheet 名称, 共享字符串, 每个 sheet 的单元格值)。"""
+    z = zipfile.ZipFile(io.BytesIO(data))
+    shared = [
+        "".join(t.text or "" for t in si.iter(f"{{{_NS['m']}}}t"))
+        for si in ElementTree.fromstring(z.read("xl/sharedStrings.xml")).findall(
+            "m:si", _NS
+        )
+    ]
+    workbook = ElementTree.fromstring(z.read("xl/workbook.xml"))
+    names = [s.get("name") for s in workbook.find("m:sheets", _NS)]
+    sheets: dict[str, list[list[str]]] = {}
+    for i, name in enumerate(names, start=1):
+        root = ElementTree.fromstring(z.read(f"xl/worksheets/sheet{i}.xml"))
+        rows = []
+        for row in root.iter(f"{{{_NS['m']}}}row"):
+            values = []
+            for c in row.findall("m:c", _NS):
+                kind = c.get("t")
+                if kind == "s":
+                    values.append(shared[int(c.find("m:v", _NS).text)])
+                elif kind == "inlineStr":
+                    values.append(c.find("m:is/m:t", _NS).text)
+                else:
+                    values.append(f"{kind or 'n'}:{c.find('m:v', _NS).text}")
+            rows.append(values)
+        sheets[name] = rows
+    return names, shared, sheets
+
+
+def test_writer_dedupes_short_strings_and_types_cells():
+    buf = io.BytesIO()
+    writer = XlsxWriter(buf, shared_max_length=10)
+    writer.add_sheet("conversations")
+    writer.write_row(["topic", "answer", "depth", "ai"])
+    writer.write_row(["学校-德育", "很长的回答" * 3, 2, False])
+    writer.write_row(["学校-德育", "控制\x01字符", 1.5, True])
+    writer.add_sheet("sessions")
+    writer.write_row(["user_name", None, "ok"])
+    writer.close()
+
+    names, shared, sheets = _read(buf.getvalue())
+    assert names == ["conversations", "sessions"]
+    assert shared.count("学校-德育") == 1
+    assert sheets["conversations"][1] == ["学校-德育", "很长的回答" * 3, "n:2", "b:0"]
+    assert sheets["conversations"][2] == ["学校-德育", "控制字符", "n:1.5", "b:1"]
+    # None 单元格不输出
+    assert sheets["sessions"] == [["user_name", "ok"]]
+
+
+def test_writer_continues_on_new_sheet_past_row_limit(monkeypatch):
+    monkeypatch.setattr(xlsx, "MAX_SHEET_ROWS", 3)
+    buf = io.BytesIO()
+    writer = XlsxWriter(buf)
+    writer.add_sheet("logs")
+    writer.write_rows([["id"], [1], [2], [3], [4]])
+    writer.close()
+
+    names, _shared, sheets = _read(buf.getvalue())
+    assert names == ["logs", "logs_2"]
+    assert sheets["logs"] == [["id"], ["n:1"], ["n:2"]]
+    assert sheets["logs_2"] == [["id"], ["n:3"], ["n:4"]]
+
+
+def test_build_xlsx_single_sheet():
+    names, _shared, sheets = _read(
+        xlsx.build_xlsx(rows=[["a", "b"]], sheet_name="export")
+    )
+    assert names == ["export"]
+    assert sheets["export"] == [["a", "b"]]
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import dataclasses
+import itertools
+
 import pytest
 
 from interview_system.application.services.interview_service import InterviewService
@@ -17,11 +20,22 @@ class FakeRepo:
     def __init__(self):
         self.sessions: dict[str, Session] = {}
         self.logs: dict[str, list[ConversationEntry]] = {}
+        self._ids = itertools.count(1)
 
     async def get(self, session_id):  # type: ignore[override]
         return self.sessions.get(str(session_id))
 
-    async def save(self, session: Session) -> None:  # type: ignore[override]
+    async def save(  # type: ignore[override]
+        self, session: Session, *, new_entry=None, delete_entries_from=None
+    ) -> None:
+        items = self.logs.setdefault(str(session.id), [])
+        if delete_entries_from is not None:
+            items[:] = [
+                e for e in items if e.id is not None and e.id < delete_entries_from
+            ]
+        if new_entry is not None:
+            items.append(dataclasses.replace(new_entry, id=next(self._ids)))
+        session.version += 1
         self.sessions[str(session.id)] = session
 
     async def delete(self, session_id):  # type: ignore[override]
@@ -29,13 +43,22 @@ class FakeRepo:
         self.logs.pop(str(session_id), None)
         return True
 
-    async def list_conversation_entries(self, session_id):  # type: ignore[override]
-        return list(self.logs.get(str(session_id), []))
+    async def list_conversation_entries(self, session_id, *, after_id=None):  # type: ignore[override]
+        items = self.logs.get(str(session_id), [])
+        if after_id is not None:
+            items = [e for e in items if e.id is not None and e.id > after_id]
+        return list(items)
 
     async def append_conversation_entry(
         self, session_id, entry: ConversationEntry
     ) -> None:  # type: ignore[override]
-        self.logs.setdefault(str(session_id), []).append(entry)
+        self.logs.setdefault(str(session_id), []).append(
+            dataclasses.replace(entry, id=next(self._ids))
+        )
+
+    async def get_last_conversation_entry(self, session_id):  # type: ignore[override]
+        items = self.logs.get(str(session_id), [])
+        return items[-1] if items else None
 
     async def delete_last_conversation_entry(self, session_id):  # type: ignore[override]
         items = self.logs.get(str(session_id), [])
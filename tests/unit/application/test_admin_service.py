@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from interview_system.application.services.admin_service import AdminService
+from interview_system.domain.repositories.admin_repository import (
+    AdminTimeSeriesPoint,
+    AdminTopicRow,
+    AdminUserActivityRow,
+)
+from interview_system.infrastructure.cache import QueryCache
+
+
+class FakeAdminRepo:
+    def __init__(self):
+        self.version = 0
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def data_version(self) -> int:
+        return self.version
+
+    async def _track(self, value):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return value
+
+    async def get_time_series(self, *, start, end, bucket):  # type: ignore[override]
+        return await self._track([AdminTimeSeriesPoint("2024-06-01", 2, 4, 1, 1.5)])
+
+    async def get_user_activity(self, *, start, end, limit):  # type: ignore[override]
+        return await self._track([AdminUserActivityRow("tester", 2, 4)])
+
+    async def get_top_topics(self, *, start, end, limit):  # type: ignore[override]
+        return await self._track([AdminTopicRow("学校-德育", 4, 1.5)])
+
+
+@pytest.mark.asyncio
+async def test_overview_runs_queries_concurrently_and_caches_by_write_version():
+    repo = FakeAdminRepo()
+    service = AdminService(repo, cache=QueryCache(ttl_seconds=60))  # type: ignore[arg-type]
+    start = datetime(2024, 6, 1)
+
+    first = await service.overview(start=start, end=None, top_n=5)
+    assert repo.max_in_flight == 3
+    assert first["summary"]["total_messages"] == 4
+
+    # 等价时间（naive 视为 UTC）命中同一缓存项
+    again = await service.overview(start=start.replace(tzinfo=UTC), end=None, top_n=5)
+    assert again == first
+    assert repo.calls == 3
+
+    repo.version += 1
+    await service.overview(start=start, end=None, top_n=5)
+    assert repo.calls == 6
@@ -98,3 +98,155 @@ async def test_interview_service_followup_generation_does_not_block_event_loop(
     await asyncio.wait_for(tick.wait(), timeout=0.1)
     await process_task
     await ticker_task
+
+
+class RecordingRunner:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def run(self, fn, /, *args, **kwargs):
+        self.calls.append(fn.__name__)
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_interview_service_runs_followup_on_llm_executor(
+    fake_repo, topics_source
+):
+    runner = RecordingRunner()
+    service = InterviewService(
+        repository=fake_repo,  # type: ignore[arg-type]
+        answer_processor=AnswerProcessor(
+            depth_keywords=["具体"], common_keywords=[], max_depth_score=4
+        ),
+        followup_generator=FollowupGenerator(
+            llm=SlowLLM(),
+            min_answer_length=10,
+            max_followups_per_question=3,
+            max_depth_score=4,
+        ),
+        topics_source=topics_source,
+        total_questions=2,
+        llm_executor=runner,
+    )
+    session = await service.start_session(user_name="tester", topics=None)
+
+    await service.process_answer(session_id=session.id, answer="短")
+    assert runner.calls == ["should_followup"]
+
+
+class CountingLLM:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def generate_followup(self, answer: str, topic: dict, conversation_log=None):  # type: ignore[override]
+        self.calls += 1
+        time.sleep(0.05)
+        return "AI 追问"
+
+
+def _idempotent_service(fake_repo, topics_source, llm) -> InterviewService:
+    from interview_system.infrastructure.cache.idempotency import MemoryIdempotencyStore
+
+    return InterviewService(
+        repository=fake_repo,  # type: ignore[arg-type]
+        answer_processor=AnswerProcessor(
+            depth_keywords=["具体"], common_keywords=[], max_depth_score=4
+        ),
+        followup_generator=FollowupGenerator(
+            llm=llm,
+            min_answer_length=10,
+            max_followups_per_question=3,
+            max_depth_score=4,
+        ),
+        topics_source=topics_source,
+        total_questions=2,
+        idempotency_store=MemoryIdempotencyStore(maxsize=16, ttl_seconds=60),
+    )
+
+
+@pytest.mark.asyncio
+async def test_interview_service_replays_idempotent_answer(fake_repo, topics_source):
+    llm = CountingLLM()
+    service = _idempotent_service(fake_repo, topics_source, llm)
+    session = await service.start_session(user_name="tester", topics=None)
+
+    first = await service.process_answer(
+        session_id=session.id, answer="短", idempotency_key="k1"
+    )
+    again = await service.process_answer(
+        session_id=session.id, answer="短", idempotency_key="k1"
+    )
+
+    assert first.replayed is False
+    assert again.replayed is True
+    assert again.assistant_message == first.assistant_message
+    assert llm.calls == 1
+    assert len(fake_repo.logs[str(session.id)]) == 1
+
+    # 不同的键按新请求处理
+    await service.process_answer(
+        session_id=session.id, answer="短", idempotency_key="k2"
+    )
+    assert len(fake_repo.logs[str(session.id)]) == 2
+
+
+@pytest.mark.asyncio
+async def test_interview_service_concurrent_retries_share_one_result(
+    fake_repo, topics_source
+):
+    llm = CountingLLM()
+    service = _idempotent_service(fake_repo, topics_source, llm)
+    session = await service.start_session(user_name="tester", topics=None)
+
+    results = await asyncio.gather(
+        *(
+            service.process_answer(
+                session_id=session.id, answer="短", idempotency_key="k1"
+            )
+            for _ in range(3)
+        )
+    )
+
+    assert sorted(r.replayed for r in results) == [False, True, True]
+    assert len({r.assistant_message for r in results}) == 1
+    assert llm.calls == 1
+    assert len(fake_repo.logs[str(session.id)]) == 1
+
+
+@pytest.mark.asyncio
+async def test_interview_service_rejects_reused_idempotency_key(
+    fake_repo, topics_source
+):
+    from interview_system.application.exceptions import IdempotencyKeyReusedError
+
+    service = _idempotent_service(fake_repo, topics_source, None)
+    session = await service.start_session(user_name="tester", topics=None)
+
+    await service.process_answer(
+        session_id=session.id, answer="短", idempotency_key="k1"
+    )
+    with pytest.raises(IdempotencyKeyReusedError):
+        await service.process_answer(
+            session_id=session.id, answer="另一个回答", idempotency_key="k1"
+        )
+    with pytest.raises(IdempotencyKeyReusedError):
+        await service.skip_question(session_id=session.id, idempotency_key="k1")
+
+
+@pytest.mark.asyncio
+async def test_interview_service_serializes_concurrent_turns(fake_repo, topics_source):
+    llm = CountingLLM()
+    service = _idempotent_service(fake_repo, topics_source, llm)
+    session = await service.start_session(user_name="tester", topics=None)
+
+    first, _ = await asyncio.gather(
+        service.process_answer(session_id=session.id, answer="短"),
+        service.process_answer(session_id=session.id, answer="短"),
+    )
+
+    # 第二个请求基于第一个请求保存后的状态：回答的是第一个请求给出的追问
+    entries = fake_repo.logs[str(session.id)]
+    assert len(entries) == 2
+    assert entries[1].question == first.assistant_message
+    assert entries[0].question != entries[1].question
@@ -21,3 +21,16 @@ def test_session_can_undo():
 
     session.current_question_idx = 1
     assert session.can_undo() is True
+
+
+def test_session_mark_changed_tracks_rewinds():
+    session = Session(user_name="测试")
+    session.mark_changed()
+    assert session.version == 0
+    assert session.rewound_version == 0
+    assert session.updated_at is not None
+
+    session.version = 2
+    session.mark_changed(rewound=True)
+    # 记为下一次保存后的版本
+    assert session.rewound_version == 3